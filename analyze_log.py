@@ -0,0 +1,184 @@
+import os
+import re
+import sys
+import json
+import argparse
+from collections import Counter, defaultdict
+from datetime import datetime
+
+# Reads both host_quest.py log formats:
+#  - JSON lines from --access-log
+#  - the plain http.server stderr log (e.g. server_log.txt):
+#    127.0.0.1 - - [09/Feb/2026 18:46:51] "GET /game.js?v=3.73 HTTP/1.1" 304 -
+LEGACY_RE = re.compile(r'^(\S+) - - \[([^\]]+)\] "(\S+) (\S+)[^"]*" (\d{3}) (\S+)')
+LEGACY_TIME = "%d/%b/%Y %H:%M:%S"
+
+SESSION_GAP = 30 * 60 # Seconds of inactivity that start a new session
+
+def parse_line(line):
+    # Returns a request dict or None for lines that aren't requests
+    line = line.strip()
+    if line.startswith("{"):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return None
+        entry.setdefault("ms", None)
+        entry.setdefault("cache", "-")
+        entry["estimated"] = False
+        return entry
+
+    m = LEGACY_RE.match(line)
+    if not m:
+        return None
+    client, when, method, path, status, size = m.groups()
+    try:
+        ts = datetime.strptime(when, LEGACY_TIME).timestamp()
+    except ValueError:
+        return None
+    return {
+        "ts": ts, "client": client, "method": method, "path": path,
+        "status": int(status), "bytes": int(size) if size.isdigit() else None,
+        "ms": None, "cache": "-", "ua": "", "estimated": False,
+    }
+
+def estimate_bytes(entry, root):
+    # The legacy log has no sizes; assume a 200 GET sent the file as it is on disk now
+    if entry["bytes"] is not None:
+        return
+    entry["bytes"] = 0
+    if entry["status"] == 200 and entry["method"] == "GET" and root:
+        rel_path = entry["path"].split("?", 1)[0].lstrip("/") or "index.html"
+        full_path = os.path.join(root, rel_path)
+        if os.path.isdir(full_path):
+            full_path = os.path.join(full_path, "index.html")
+        if os.path.isfile(full_path):
+            entry["bytes"] = os.path.getsize(full_path)
+            entry["estimated"] = True
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def sessions(entries):
+    # Groups requests by client (+ user agent) split on SESSION_GAP of inactivity
+    by_client = defaultdict(list)
+    for e in entries:
+        by_client[(e["client"], e.get("ua", ""))].append(e)
+    result = []
+    for reqs in by_client.values():
+        reqs.sort(key=lambda e: e["ts"])
+        current = [reqs[0]]
+        for e in reqs[1:]:
+            if e["ts"] - current[-1]["ts"] > SESSION_GAP:
+                result.append(current)
+                current = []
+            current.append(e)
+        result.append(current)
+    return result
+
+def analyze(entries, top=10):
+    entries.sort(key=lambda e: e["ts"])
+    span = entries[-1]["ts"] - entries[0]["ts"] if entries else 0
+    per_minute = Counter(int(e["ts"] // 60) for e in entries)
+
+    latencies = sorted(e["ms"] for e in entries if e["ms"] is not None)
+    time_by_path = Counter()
+    for e in entries:
+        if e["ms"] is not None:
+            time_by_path[e["path"].split("?", 1)[0]] += e["ms"]
+
+    session_bytes = sorted(sum(e["bytes"] or 0 for e in s) for s in sessions(entries))
+
+    return {
+        "requests": len(entries),
+        "span_seconds": span,
+        "avg_rps": len(entries) / span if span > 0 else None,
+        # Logs span days of mostly idle time; this is the rate while people were playing
+        "active_rps": len(entries) / (len(per_minute) * 60) if per_minute else None,
+        "peak_requests_per_minute": max(per_minute.values(), default=0),
+        "status": dict(sorted(Counter(e["status"] for e in entries).items())),
+        "cache": dict(Counter(e["cache"] for e in entries if e["cache"] != "-")),
+        "latency_ms": {
+            "count": len(latencies),
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1] if latencies else None,
+        },
+        "server_time_ms_by_path": dict(time_by_path.most_common(top)),
+        "top_404": dict(Counter(e["path"].split("?", 1)[0] for e in entries if e["status"] == 404).most_common(top)),
+        "bytes_total": sum(e["bytes"] or 0 for e in entries),
+        "bytes_estimated": any(e["estimated"] for e in entries),
+        "sessions": len(session_bytes),
+        "bytes_per_session": {
+            "mean": sum(session_bytes) / len(session_bytes) if session_bytes else None,
+            "p50": percentile(session_bytes, 50),
+            "max": session_bytes[-1] if session_bytes else None,
+        },
+    }
+
+def fmt_ms(v):
+    return "-" if v is None else f"{v:.1f} ms"
+
+def print_report(report):
+    print(f"Requests:      {report['requests']} over {report['span_seconds'] / 60:.1f} min")
+    if report["avg_rps"] is not None:
+        print(f"Throughput:    {report['avg_rps']:.3f} req/s avg, {report['active_rps']:.2f} req/s in active minutes, "
+              f"peak {report['peak_requests_per_minute']} req/min")
+    print("Status:        " + ", ".join(f"{k}: {v}" for k, v in report["status"].items()))
+    if report["cache"]:
+        print("Cache:         " + ", ".join(f"{k}: {v}" for k, v in report["cache"].items()))
+
+    lat = report["latency_ms"]
+    if lat["count"]:
+        print(f"Latency:       p50 {fmt_ms(lat['p50'])}, p90 {fmt_ms(lat['p90'])}, "
+              f"p95 {fmt_ms(lat['p95'])}, p99 {fmt_ms(lat['p99'])}, max {fmt_ms(lat['max'])}")
+        print("Server time by path:")
+        for path, ms in report["server_time_ms_by_path"].items():
+            print(f"  {ms:>10.1f} ms  {path}")
+    else:
+        print("Latency:       not recorded (legacy log format)")
+
+    if report["top_404"]:
+        print("Top 404s:")
+        for path, count in report["top_404"].items():
+            print(f"  {count:>6}  {path}")
+
+    bps = report["bytes_per_session"]
+    note = " (estimated from file sizes on disk)" if report["bytes_estimated"] else ""
+    print(f"Bytes:         {report['bytes_total'] // 1024} KB total{note}")
+    if bps["mean"] is not None:
+        print(f"Per session:   {report['sessions']} sessions, mean {bps['mean'] / 1024:.1f} KB, "
+              f"median {bps['p50'] / 1024:.1f} KB, max {bps['max'] / 1024:.1f} KB")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize host_quest.py access logs")
+    parser.add_argument("logs", nargs="+", help="JSON-lines access logs and/or legacy server_log.txt files")
+    parser.add_argument("--root", default=os.path.dirname(os.path.abspath(__file__)),
+                        help="game directory, used to estimate sizes for legacy log lines")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    entries = []
+    for path in args.logs:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                entry = parse_line(line)
+                if entry is not None:
+                    estimate_bytes(entry, args.root)
+                    entries.append(entry)
+
+    if not entries:
+        print("No requests found.")
+        sys.exit(1)
+
+    report = analyze(entries, args.top)
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print_report(report)
@@ -0,0 +1,163 @@
+import os
+import sys
+import json
+import mmap
+import time
+import struct
+import argparse
+
+import build_manifest
+from build_manifest import MANIFEST_FILE, SW_FILE
+from build_dist import DIST_DIR, HASHED_RE
+from asset_cache import CachedAsset, guess_content_type
+
+# Packs the built game into one archive that host_quest.py --bundle maps
+# into memory and serves from directly: startup is a single open() and a
+# request never touches the filesystem.
+#
+# Layout: MAGIC, u32 index length, JSON index, zero padding up to the next
+# page boundary, then the bodies back to back. The index maps each path to
+# its content type, Last-Modified, ETag and [offset, length] of the identity
+# body, plus [offset, length, etag] per pre-compressed encoding. Offsets are
+# relative to the start of the data. ETags and variants are computed exactly
+# like asset_cache.CachedAsset, so switching between --dist and --bundle
+# doesn't invalidate anything browsers already have.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BUNDLE_FILE = os.path.join(BASE_DIR, "math-quest.bundle")
+MAGIC = b"MQBUNDL1"
+HEADER = struct.Struct("<8sI")
+ALIGN = mmap.PAGESIZE
+
+def data_offset(index_length):
+    end = HEADER.size + index_length
+    return (end + ALIGN - 1) // ALIGN * ALIGN
+
+def bundle_paths(root):
+    # Everything the page can load (same crawl as build_manifest.py), the
+    # generated manifest and service worker, and for a dist/ build the
+    # previous build's hashed files that open pages may still lazy-load
+    paths = set(build_manifest.crawl(root)) | {MANIFEST_FILE, SW_FILE}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if HASHED_RE.search(name):
+                paths.add(os.path.relpath(os.path.join(dirpath, name), root).replace(os.sep, "/"))
+    found = sorted(p for p in paths if os.path.isfile(os.path.join(root, p)))
+    return found, sorted(p for p in paths - set(found) if p not in (MANIFEST_FILE, SW_FILE))
+
+def build_bundle(root=DIST_DIR, output=BUNDLE_FILE):
+    start = time.perf_counter()
+    paths, missing = bundle_paths(root)
+    files = {}
+    chunks = []
+    offset = 0
+
+    def add(data):
+        nonlocal offset
+        chunks.append(data)
+        offset += len(data)
+        return [offset - len(data), len(data)]
+
+    for path in paths:
+        full_path = os.path.join(root, path)
+        with open(full_path, "rb") as f:
+            body = f.read()
+        asset = CachedAsset(full_path, body, guess_content_type(full_path), os.stat(full_path))
+        files[path] = {
+            "type": asset.content_type,
+            "last_modified": asset.last_modified,
+            "etag": asset.etag,
+            "body": add(body),
+            "encodings": {encoding: add(data) + [etag] for encoding, (data, etag) in asset.encodings.items()},
+        }
+
+    index = json.dumps({"files": files}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    tmp_path = output + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(index)))
+        f.write(index)
+        f.write(b"\0" * (data_offset(len(index)) - HEADER.size - len(index)))
+        for data in chunks:
+            f.write(data)
+    os.replace(tmp_path, output)
+
+    print(f"Bundled {len(files)} files from {os.path.relpath(root)} into {os.path.relpath(output)} "
+          f"({os.path.getsize(output) // 1024} KB incl. pre-compressed) in {time.perf_counter() - start:.2f}s.")
+    for path in missing:
+        print(f"  Missing: {path}")
+    return files, missing
+
+class BundledAsset(CachedAsset):
+    # CachedAsset whose bodies are zero-copy slices of the mapped archive
+    def __init__(self, path, data, entry):
+        self.path = path
+        self.content_type = entry["type"]
+        self.last_modified = entry["last_modified"]
+        self.etag = entry["etag"]
+        offset, length = entry["body"]
+        self.body = data[offset:offset + length]
+        self.encodings = {encoding: (data[offset:offset + length], etag)
+                          for encoding, (offset, length, etag) in entry["encodings"].items()}
+
+class AssetBundle:
+    # Read-only stand-in for AssetCache behind CachedHandler. The index is
+    # parsed once at startup; lookups are dict hits and anything not in the
+    # archive is missing, so there is no disk fallback and nothing to watch.
+    # The mapping lives as long as the process (the bodies keep it exported).
+
+    def __init__(self, path=BUNDLE_FILE):
+        self.path = os.path.abspath(path)
+        with open(self.path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_length = HEADER.unpack_from(self.map) if len(self.map) >= HEADER.size else (None, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an asset bundle (run asset_bundle.py)")
+        index = json.loads(self.map[HEADER.size:HEADER.size + index_length])
+        data = memoryview(self.map)[data_offset(index_length):]
+        self.entries = {p: BundledAsset(p, data, entry) for p, entry in index["files"].items()}
+        if hasattr(self.map, "madvise") and hasattr(mmap, "MADV_WILLNEED"):
+            self.map.madvise(mmap.MADV_WILLNEED) # Start paging it in before the first request
+
+    @property
+    def nbytes(self):
+        return len(self.map)
+
+    def get(self, rel_path):
+        return self.entries.get(rel_path)
+
+    def lookup(self, rel_path):
+        return self.entries.get(rel_path), True
+
+    def is_missing(self, rel_path):
+        return rel_path not in self.entries
+
+    def read(self, rel_path):
+        # Body as bytes, or None if it isn't bundled
+        asset = self.entries.get(rel_path)
+        return None if asset is None else bytes(asset.body)
+
+    def load_manifest(self):
+        data = self.read(MANIFEST_FILE)
+        try:
+            return json.loads(data) if data is not None else None
+        except ValueError:
+            return None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack the built game into one archive for host_quest.py --bundle")
+    parser.add_argument("--root", default=DIST_DIR, help="tree to pack (default: dist/, the build_dist.py output)")
+    parser.add_argument("--output", default=BUNDLE_FILE)
+    parser.add_argument("--build", action="store_true", help="run build_dist.py first")
+    parser.add_argument("--strict", action="store_true", help="exit with an error if any asset is missing")
+    args = parser.parse_args()
+
+    root = os.path.abspath(args.root)
+    if args.build:
+        import build_dist
+        build_dist.build_dist(BASE_DIR, root)
+    if not os.path.isfile(os.path.join(root, build_manifest.ENTRY)):
+        parser.error(f"no {build_manifest.ENTRY} in {root}, run build_dist.py first (or pass --build)")
+    _, missing = build_bundle(root, os.path.abspath(args.output))
+    if args.strict and missing:
+        sys.exit(1)
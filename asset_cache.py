@@ -0,0 +1,211 @@
+import os
+import gzip
+import time
+import hashlib
+import threading
+import mimetypes
+from collections import OrderedDict
+from email.utils import formatdate
+
+# Brotli is optional: without it text assets are only pre-gzipped
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Files loaded at startup (everything else under assets/ is loaded too if it fits)
+PRELOAD_FILES = ["index.html", "game.js", "enemies.js", "style.css"]
+PRELOAD_DIRS = ["assets", "enemies", "problems"]
+
+MAX_BYTES = 64 * 1024 * 1024 # Cap on cached bodies incl. compressed variants
+MAX_FILE_BYTES = 8 * 1024 * 1024 # Larger files are always served from disk
+WATCH_INTERVAL = 1.0 # Seconds between file-change polls
+MAX_MISSES = 1024 # Remembered missing paths (LRU)
+
+# Only text gets pre-compressed; images/audio are already compressed
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+class CachedAsset:
+    def __init__(self, path, body, content_type, stat):
+        self.path = path
+        self.body = body
+        self.content_type = content_type
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.last_modified = formatdate(stat.st_mtime, usegmt=True)
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+        # encoding -> (body, etag); strong ETags must differ per representation
+        self.encodings = {}
+        if content_type.startswith(COMPRESSIBLE_TYPES):
+            gz = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(gz) < len(body):
+                self.encodings["gzip"] = (gz, self.etag[:-1] + '-gz"')
+            if brotli is not None:
+                br = brotli.compress(body, quality=11)
+                if len(br) < len(body):
+                    self.encodings["br"] = (br, self.etag[:-1] + '-br"')
+
+    @property
+    def nbytes(self):
+        return len(self.body) + sum(len(b) for b, _ in self.encodings.values())
+
+    def select(self, accept_encoding):
+        # Returns (body, etag, encoding or None) for the client's Accept-Encoding
+        accepted = parse_accept_encoding(accept_encoding)
+        for encoding in ("br", "gzip"):
+            if encoding in self.encodings and encoding in accepted:
+                body, etag = self.encodings[encoding]
+                return body, etag, encoding
+        return self.body, self.etag, None
+
+def guess_content_type(path):
+    if path.endswith(".js"):
+        return "application/javascript"
+    return mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+def parse_accept_encoding(header):
+    accepted = set()
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    return accepted
+
+class AssetCache:
+    # In-memory LRU cache of static files keyed by path relative to root,
+    # plus a negative cache of paths that don't exist.
+    # A background thread polls mtimes and drops entries whose file changed
+    # or whose missing file appeared.
+
+    def __init__(self, root, max_bytes=MAX_BYTES, max_file_bytes=MAX_FILE_BYTES):
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+        self.entries = OrderedDict()
+        self.missing = OrderedDict() # rel_path -> None, paths known not to exist
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher = None
+
+    def _load(self, rel_path):
+        full_path = os.path.join(self.root, rel_path)
+        try:
+            stat = os.stat(full_path)
+        except OSError:
+            return None
+        if not os.path.isfile(full_path) or stat.st_size > self.max_file_bytes:
+            return None
+        with open(full_path, "rb") as f:
+            body = f.read()
+        return CachedAsset(full_path, body, guess_content_type(full_path), stat)
+
+    def get(self, rel_path):
+        # Cached entry for rel_path, loading it on a miss; None if not cacheable
+        return self.lookup(rel_path)[0]
+
+    def lookup(self, rel_path):
+        # Like get(), but returns (asset, hit) where hit says it was already in RAM
+        with self.lock:
+            asset = self.entries.get(rel_path)
+            if asset is not None:
+                self.entries.move_to_end(rel_path)
+                self.hits += 1
+                return asset, True
+            self.misses += 1
+
+        asset = self._load(rel_path)
+        if asset is None or asset.nbytes > self.max_bytes:
+            return None, False
+        with self.lock:
+            self._insert(rel_path, asset)
+        return asset, False
+
+    def _insert(self, rel_path, asset):
+        old = self.entries.pop(rel_path, None)
+        if old is not None:
+            self.total_bytes -= old.nbytes
+        self.entries[rel_path] = asset
+        self.total_bytes += asset.nbytes
+        # Evict least recently used
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= evicted.nbytes
+
+    def invalidate(self, rel_path):
+        with self.lock:
+            asset = self.entries.pop(rel_path, None)
+            if asset is not None:
+                self.total_bytes -= asset.nbytes
+
+    def is_missing(self, rel_path):
+        with self.lock:
+            if rel_path in self.missing:
+                self.missing.move_to_end(rel_path)
+                return True
+        return False
+
+    def mark_missing(self, rel_path):
+        # Only called after the file was found not to exist
+        with self.lock:
+            self.missing[rel_path] = None
+            self.missing.move_to_end(rel_path)
+            while len(self.missing) > MAX_MISSES:
+                self.missing.popitem(last=False)
+
+    def preload(self, files=PRELOAD_FILES, dirs=PRELOAD_DIRS):
+        start = time.perf_counter()
+        paths = list(files)
+        for d in dirs:
+            full_dir = os.path.join(self.root, d)
+            if os.path.isdir(full_dir):
+                paths.extend(os.path.join(d, name) for name in sorted(os.listdir(full_dir))
+                             if not name.startswith("."))
+        loaded = sum(1 for p in paths if self.get(p.replace(os.sep, "/")) is not None)
+        print(f"Cached {loaded} files ({self.total_bytes // 1024} KB) in {time.perf_counter() - start:.2f}s.")
+
+    def _changed(self):
+        with self.lock:
+            snapshot = list(self.entries.items())
+        changed = []
+        for rel_path, asset in snapshot:
+            try:
+                stat = os.stat(asset.path)
+            except OSError:
+                changed.append(rel_path)
+                continue
+            if stat.st_mtime_ns != asset.mtime_ns or stat.st_size != asset.size:
+                changed.append(rel_path)
+        return changed
+
+    def _appeared(self):
+        with self.lock:
+            snapshot = list(self.missing)
+        return [p for p in snapshot if os.path.exists(os.path.join(self.root, p))]
+
+    def refresh(self):
+        # Drops changed files and forgets misses that now exist
+        for rel_path in self._changed():
+            self.invalidate(rel_path)
+            print(f"Cache invalidated: {rel_path}")
+        for rel_path in self._appeared():
+            with self.lock:
+                self.missing.pop(rel_path, None)
+            print(f"Now available: {rel_path}")
+
+    def _watch(self, interval):
+        while not self._stop.wait(interval):
+            self.refresh()
+
+    def start_watching(self, interval=WATCH_INTERVAL):
+        self._watcher = threading.Thread(target=self._watch, args=(interval,), daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        self._stop.set()
@@ -0,0 +1,249 @@
+import os
+import sys
+import json
+import fnmatch
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+import numpy as np
+
+import build_manifest
+import optimize_sprites
+from check_images import find_images
+from process_new_images import ID_MAP
+
+# Groups near-identical artwork in assets/ by perceptual hash and checks
+# every image against what the game references (index.html -> game.js ->
+# enemy shards, via build_manifest.crawl). Writes a plan:
+#  - remove: unreferenced images (duplicates of a kept image, or orphans);
+#    they still ship to the server and go through fix_backgrounds
+#  - alias: referenced images near-identical to another referenced image,
+#    which could point at one file instead
+#  - id_map: process_new_images.ID_MAP entries whose target is removed; drop
+#    them first or the next new-artwork run re-creates the file
+# --apply only deletes what a previous run wrote to the plan file (review it
+# first) and is still unreferenced, and refuses while ID_MAP targets remain.
+# Both hashes are 64 bits. dHash compares neighbouring pixels of a 9x8
+# thumbnail; pHash thresholds the low 8x8 DCT frequencies of a 32x32 one.
+# Thumbnails are made in worker processes, the hashes and pairwise
+# distances for the whole set in one batch with NumPy.
+
+ASSETS_DIR = "assets"
+PLAN_FILE = "asset-prune-plan.json"
+HASH_SIZE = 8
+PHASH_SIZE = 32
+FLATTEN_COLOR = (255, 255, 255) # Transparent pixels are hashed as this, close to most checkerboards
+DHASH_DISTANCE = 14 # Max differing bits (of 64) for two images to count as near-identical
+PHASH_DISTANCE = 6 # Tighter: similar-looking sprites of different creatures land around 10
+PIPELINE_PATTERN = "uma_*.png" # What fix_backgrounds processes, see get_target_images
+
+def thumbnail(path):
+    # 32x32 grayscale (float32) of the image flattened onto FLATTEN_COLOR
+    with Image.open(path) as img:
+        if img.format == "JPEG":
+            img.draft("RGB", (PHASH_SIZE * 4, PHASH_SIZE * 4))
+        img = img.convert("RGBA")
+        alpha = img.getchannel("A")
+        info = {"width": img.width, "height": img.height, "alpha": alpha.getextrema()[0] < 255}
+        # Hash the figure, not the canvas: sprites are mostly empty space,
+        # which would make every centered creature look alike
+        bbox = alpha.point(lambda a: 255 if a >= 128 else 0).getbbox()
+        if bbox:
+            img = img.crop(bbox)
+        flat = Image.new("RGBA", img.size, FLATTEN_COLOR + (255,))
+        flat.alpha_composite(img)
+        small = flat.convert("L").resize((PHASH_SIZE, PHASH_SIZE), Image.LANCZOS)
+        return np.asarray(small, dtype=np.float32), info
+
+def dct_matrix(n):
+    k = np.arange(n)[:, None]
+    m = np.cos(np.pi * (2 * np.arange(n)[None, :] + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    m[0] /= np.sqrt(2)
+    return m
+
+def pack_bits(bits):
+    # (n, 64) bool -> (n,) uint64
+    return np.packbits(bits, axis=1).view(">u8").ravel().astype(np.uint64)
+
+def batch_hashes(thumbs):
+    # thumbs: (n, 32, 32) -> (dhash, phash), each (n,) uint64
+    small = np.stack([np.asarray(Image.fromarray(t).resize((HASH_SIZE + 1, HASH_SIZE), Image.BILINEAR))
+                      for t in thumbs])
+    dhash = pack_bits((small[:, :, 1:] > small[:, :, :-1]).reshape(len(thumbs), -1))
+
+    c = dct_matrix(PHASH_SIZE)
+    freq = (c @ thumbs @ c.T)[:, :HASH_SIZE, :HASH_SIZE].reshape(len(thumbs), -1)
+    # Median of the AC terms; the DC term (overall brightness) doesn't vote
+    median = np.median(freq[:, 1:], axis=1, keepdims=True)
+    phash = pack_bits(freq > median)
+    return dhash, phash
+
+def hamming(hashes):
+    # (n,) uint64 -> (n, n) differing bit counts
+    xor = hashes[:, None] ^ hashes[None, :]
+    return np.unpackbits(xor.view(np.uint8).reshape(len(hashes), len(hashes), 8), axis=2).sum(axis=2)
+
+def group_similar(dhash, phash):
+    # Lists of indices whose images are within both distance limits (transitively)
+    close = (hamming(dhash) <= DHASH_DISTANCE) & (hamming(phash) <= PHASH_DISTANCE)
+    parent = list(range(len(dhash)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for a, b in zip(*np.nonzero(np.triu(close, 1))):
+        parent[find(a)] = find(b)
+    groups = {}
+    for i in range(len(dhash)):
+        groups.setdefault(find(i), []).append(i)
+    return [g for g in groups.values() if len(g) > 1]
+
+def references(root):
+    # path -> files that reference it, for everything the game can load
+    found = build_manifest.crawl(root)
+    return {path: info["referencedBy"] for path, info in found.items()}
+
+def id_map_entries(names):
+    # ID_MAP entries (id, target) that would re-create any of the given asset paths
+    basenames = {os.path.basename(n) for n in names}
+    return [(icon_id, target) for icon_id, target in ID_MAP.items() if target in basenames]
+
+def build_plan(root=build_manifest.BASE_DIR, jobs=None):
+    assets_dir = os.path.join(root, ASSETS_DIR)
+    paths = [p for p in find_images(assets_dir) if not optimize_sprites.is_variant(p)]
+    names = [f"{ASSETS_DIR}/{os.path.basename(p)}" for p in paths]
+    jobs = min(jobs or os.cpu_count() or 1, len(paths))
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            loaded = list(pool.map(thumbnail, paths, chunksize=max(1, len(paths) // (jobs * 4))))
+    else:
+        loaded = [thumbnail(p) for p in paths]
+
+    dhash, phash = batch_hashes(np.stack([t for t, _ in loaded]))
+    refs = references(root)
+    pipeline_targets = set(ID_MAP.values())
+    images = {}
+    for i, (name, path) in enumerate(zip(names, paths)):
+        images[name] = dict(loaded[i][1], bytes=os.path.getsize(path),
+                            dhash=f"{int(dhash[i]):016x}", phash=f"{int(phash[i]):016x}",
+                            referencedBy=refs.get(name, []),
+                            pipeline=os.path.basename(path) in pipeline_targets)
+
+    def keep_order(name):
+        # Referenced first, then real transparency, then resolution
+        info = images[name]
+        return (not info["referencedBy"], not info["alpha"], -info["width"] * info["height"], name)
+
+    groups = []
+    remove = []
+    alias = []
+    for members in group_similar(dhash, phash):
+        group = sorted((names[i] for i in members), key=keep_order)
+        keep = group[0]
+        groups.append({"keep": keep, "similar": group[1:]})
+        for name in group[1:]:
+            if images[name]["referencedBy"]:
+                alias.append({"path": name, "canonical": keep, "referencedBy": images[name]["referencedBy"]})
+            else:
+                remove.append({"path": name, "reason": f"near-duplicate of {keep}", "bytes": images[name]["bytes"]})
+    # Whatever else the game never loads, including groups with no referenced member
+    planned = {r["path"] for r in remove}
+    for name in names:
+        if name not in planned and not images[name]["referencedBy"]:
+            remove.append({"path": name, "reason": "not referenced by the game", "bytes": images[name]["bytes"]})
+
+    return {
+        "thresholds": {"dhash": DHASH_DISTANCE, "phash": PHASH_DISTANCE},
+        "images": images,
+        "groups": groups,
+        "remove": sorted(remove, key=lambda r: r["path"]),
+        "alias": alias,
+        "id_map": [{"id": icon_id, "target": target} for icon_id, target in id_map_entries(r["path"] for r in remove)],
+        "savings": {
+            "bytes": sum(r["bytes"] for r in remove),
+            # Only files fix_backgrounds picks up; ID_MAP targets count once their entry is dropped
+            "pipeline_images": sum(1 for r in remove if fnmatch.fnmatch(os.path.basename(r["path"]), PIPELINE_PATTERN)),
+        },
+    }
+
+def load_plan(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def apply_plan(plan, reviewed, root=build_manifest.BASE_DIR):
+    # Deletes the images marked remove in both the reviewed plan and the
+    # fresh one, with their downscaled variants. Returns False (deleting
+    # nothing) while any of them is still an ID_MAP target.
+    approved = {r["path"] for r in reviewed["remove"]}
+    remove = [r for r in plan["remove"] if r["path"] in approved]
+    for r in plan["remove"]:
+        if r["path"] not in approved:
+            print(f"  Skipped (not in the reviewed plan): {r['path']}")
+    blocked = id_map_entries(r["path"] for r in remove)
+    if blocked:
+        print("Refusing to delete files process_new_images.py still creates; drop these ID_MAP entries first:")
+        for icon_id, target in blocked:
+            print(f"  {icon_id}: {target}")
+        return False
+
+    removed = 0
+    for r in remove:
+        path = os.path.join(root, r["path"])
+        targets = [path] + [optimize_sprites.variant_path(path, w, ext)
+                            for w in optimize_sprites.TARGET_WIDTHS for ext in optimize_sprites.FORMATS]
+        for target in targets:
+            if os.path.exists(target):
+                os.remove(target)
+                removed += 1
+    print(f"Removed {removed} files.")
+    return True
+
+def print_plan(plan):
+    for g in plan["groups"]:
+        print(f"Similar: {g['keep']} ~ {', '.join(g['similar'])}")
+    if plan["alias"]:
+        print(f"Alias ({len(plan['alias'])}, referenced near-duplicates):")
+        for a in plan["alias"]:
+            print(f"  {a['path']} -> {a['canonical']}  (referenced by {', '.join(a['referencedBy'])})")
+    if plan["remove"]:
+        print(f"Remove ({len(plan['remove'])}):")
+        for r in plan["remove"]:
+            print(f"  {r['path']:<40} {r['bytes'] // 1024:>6} KB  {r['reason']}")
+    if plan["id_map"]:
+        print(f"Drop from process_new_images.ID_MAP ({len(plan['id_map'])}):")
+        for e in plan["id_map"]:
+            print(f"  {e['id']}: {e['target']}")
+    savings = plan["savings"]
+    print(f"Saves {savings['bytes'] // 1024} KB of assets and {savings['pipeline_images']} images per pipeline run.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find near-duplicate and unreferenced artwork in assets/")
+    parser.add_argument("--root", default=build_manifest.BASE_DIR)
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--output", default=PLAN_FILE, help=f"where to write the plan (default: {PLAN_FILE})")
+    parser.add_argument("--apply", action="store_true",
+                        help="delete the images marked for removal in the plan a previous run wrote (and still unreferenced)")
+    args = parser.parse_args()
+
+    plan_path = os.path.join(args.root, args.output)
+    reviewed = load_plan(plan_path) if args.apply else None
+    if args.apply and reviewed is None:
+        parser.error(f"no plan in {args.output} to apply, run without --apply first and review it")
+
+    plan = build_plan(args.root, jobs=args.jobs)
+    with open(plan_path, "w", encoding="utf-8") as f:
+        json.dump(plan, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    print_plan(plan)
+    if args.apply:
+        if not apply_plan(plan, reviewed, args.root):
+            sys.exit(1)
+    elif plan["remove"]:
+        print(f"Review {args.output}, then run with --apply to delete them.")
@@ -0,0 +1,446 @@
+import os
+import json
+import time
+import argparse
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+import enemy_compiler
+from enemy_compiler import STATS_BY_PREFIX, HABITAT_BY_PREFIX, FIXED_ENTRIES
+
+# Monte Carlo balance check: plays many virtual players through the game's
+# battle rules (game.js: rush attacks, misses, enemy turns, ホイミ, level-ups,
+# the Lv1 boss) against the compiled enemy table, all players at once as
+# NumPy arrays. Reports time-to-level, the boss win rate and EXP pacing per
+# ID prefix. Change RULES / --growth / --stats to try a balance change
+# before touching game.js or enemy_compiler.py.
+# Players are simulated in chunks of CHUNK, each with its own seed, so the
+# result for a given --seed doesn't depend on --jobs.
+
+CHUNK = 1 << 17 # Players per chunk (keeps the working arrays in cache)
+MAX_TURNS = 100 # A battle still running after this many turns counts as a run
+MAX_LEVEL = 99 # Levels above this share the last accuracy/time entry
+ASKED = np.arange(1, 128, dtype=np.int8)[:, None] # Questions asked so far, per rush question
+
+# The battle rules, as game.js has them
+RULES = {
+    "start_hp": 50, "start_mp": 10,
+    "rush_questions": 5, # startRush: questions per attack
+    "hit_base": 8, "hit_per_level": 2, # damagePerHit = 8 + lv * 2
+    "miss_share": 0.1, "miss_base": 5, # wrong answer: floor(maxHp * 0.1) + 5
+    "enemy_attack": [2, 6], "enemy_attack_per_level": 0.5, # 2-6 + floor(lv * 0.5)
+    "growth": 0.15, # enemy stats x (1 + (enemyLv - 1) * 0.15), enemyLv = player lv -1..+1
+    "spell_cost": 3, "spell_heal": [20, 29],
+    "item_heal": 30,
+    "exp_per_level": 10, # level up when total exp >= lv * 10 (one level per win)
+    "level_hp": 10, "level_mp": 5, "mp_cap": 50,
+    "boss": {"level": 1, "exp_at": 8, "hp": 60, "exp": 15},
+}
+
+# Seconds each step takes on screen (the setTimeout/sleep delays in game.js),
+# on top of the time spent answering
+TIMING = {
+    "intro": 7.5, # startBattle: ...... / approaching / darkness / appear
+    "fight": 1.0, # command -> first question
+    "after_correct": 0.8, "after_wrong": 1.0,
+    "defeat": 3.5, # defeat animation + endRush
+    "enemy_turn": 3.5, # end of rush, enemy attack, back to the menu
+    "heal_turn": 4.0, # spell/item message, enemy attack, back to the menu
+    "win": 3.5, "level_up": 2.0,
+}
+ANSWER_SECONDS = 4.0 # Thinking time per question when there are no recorded stats
+ACCURACY = 0.8 # Share of answers that are right, when there are no recorded stats
+SKILL_SPREAD = 0.8 # Std dev of each player's skill in log-odds around the level accuracy
+
+def level_prefix(level):
+    # game.js getHabitatForLevel, as an ID prefix
+    for top, prefix in ((3, "C"), (10, "F"), (15, "G"), (20, "M"), (25, "S"), (30, "L"), (40, "O")):
+        if level <= top:
+            return prefix
+    return "R"
+
+def load_pool(stats=None, require_image=True):
+    # Enemy templates from the compiled table: (hp, exp, prefix index) arrays,
+    # sorted by prefix. stats overrides STATS_BY_PREFIX, e.g. {"C": (20, 5)}.
+    # Like generateEnemy, only enemies with a sprite are drawn when there are any.
+    fixed = {e["id"] for e in FIXED_ENTRIES}
+    prefixes = list(HABITAT_BY_PREFIX)
+    rows = []
+    for entry in enemy_compiler.iter_entries(errors=[]):
+        prefix = entry["id"][0]
+        if require_image and not entry.get("image"):
+            continue
+        hp, exp = entry["hp"], entry["exp"]
+        if stats and prefix in stats and entry["id"] not in fixed:
+            hp, exp = stats[prefix]
+        rows.append((prefixes.index(prefix), hp, exp))
+    if not rows and require_image:
+        return load_pool(stats, require_image=False)
+    rows.sort()
+    cat, hp, exp = (np.array(col) for col in zip(*rows))
+    return {"hp": hp.astype(np.float64), "exp": exp.astype(np.float64), "cat": cat.astype(np.int32)}
+
+def pool_ranges(pool, habitat):
+    # Per player level (index): [lo, hi) of the templates generateEnemy draws from.
+    # The sharded game ends up with every shard loaded, so by default that's all of them.
+    levels = np.arange(MAX_LEVEL + 2)
+    lo = np.zeros(len(levels), dtype=np.int64)
+    hi = np.full(len(levels), len(pool["cat"]), dtype=np.int64)
+    if habitat:
+        prefixes = list(HABITAT_BY_PREFIX)
+        for lv in levels:
+            cat = prefixes.index(level_prefix(max(lv, 1)))
+            start, end = np.searchsorted(pool["cat"], [cat, cat + 1])
+            if end > start:
+                lo[lv], hi[lv] = start, end
+    return lo, hi
+
+def level_table(default, values):
+    # {level: value} -> array indexed by level, gaps filled with default
+    table = np.full(MAX_LEVEL + 2, float(default))
+    for level, value in values.items():
+        if 0 < level <= MAX_LEVEL:
+            table[level] = value
+    return table
+
+def load_answer_stats(source):
+    # Per-level accuracy and seconds per answer from /api/stats (a URL, or a
+    # saved copy of its JSON), all operators together
+    if source.startswith(("http://", "https://")):
+        with urllib.request.urlopen(source, timeout=10) as response:
+            stats = json.load(response)
+    else:
+        with open(source, "r", encoding="utf-8") as f:
+            stats = json.load(f)
+    by_level = {}
+    for row in stats.get("accuracy", []):
+        totals = by_level.setdefault(row["level"], [0, 0, 0])
+        totals[0] += row["answered"]
+        totals[1] += row["correct"]
+        totals[2] += row["avg_ms"] * row["answered"]
+    accuracy = {lv: c / a for lv, (a, c, _) in by_level.items() if a}
+    seconds = {lv: ms / a / 1000 for lv, (a, _, ms) in by_level.items() if a}
+    return accuracy, seconds
+
+class Totals:
+    # Counters summed over every chunk
+    def __init__(self, categories, battles):
+        self.categories = categories
+        self.encounters = np.zeros(categories, dtype=np.int64)
+        self.wins = np.zeros(categories, dtype=np.int64)
+        self.losses = np.zeros(categories, dtype=np.int64)
+        self.runs = np.zeros(categories, dtype=np.int64)
+        self.questions = np.zeros(categories, dtype=np.int64)
+        self.exp = np.zeros(categories, dtype=np.float64)
+        self.seconds = np.zeros(categories, dtype=np.float64)
+        self.reached = np.zeros((MAX_LEVEL + 2, battles + 1), dtype=np.int64) # level x battle it was reached in
+        self.reached_seconds = np.zeros(MAX_LEVEL + 2, dtype=np.float64)
+        self.final_level = np.zeros(MAX_LEVEL + 2, dtype=np.int64)
+        self.game_overs = 0
+        self.sessions = 0
+
+    def add(self, other):
+        for key, value in vars(other).items():
+            if isinstance(value, np.ndarray):
+                getattr(self, key)[...] += value
+            elif key != "categories":
+                setattr(self, key, getattr(self, key) + value)
+
+def per_category(cat, categories, weights=None):
+    return np.bincount(cat, weights=weights, minlength=categories)
+
+def simulate_chunk(pool, players, battles, rules, accuracy, answer_seconds, heal, heal_below,
+                   habitat, seed):
+    rng = np.random.default_rng(seed)
+    categories = len(HABITAT_BY_PREFIX) + 1
+    boss_cat = categories - 1
+    levels = MAX_LEVEL + 2
+    totals = Totals(categories, battles)
+    totals.sessions = players
+    lo, hi = pool_ranges(pool, habitat)
+    logit = np.log(accuracy / (1 - accuracy))
+    atk_lo, atk_hi = rules["enemy_attack"]
+    heal_lo, heal_hi = rules["spell_heal"]
+    boss = rules["boss"]
+    q = rules["rush_questions"]
+
+    # One entry per player still playing; players are dropped when they lose
+    lv = np.ones(players, dtype=np.int32)
+    exp = np.zeros(players)
+    hp = np.full(players, rules["start_hp"], dtype=np.int32)
+    max_hp = hp.copy()
+    mp = np.full(players, rules["start_mp"], dtype=np.int32)
+    boss_done = np.zeros(players, dtype=bool)
+    seconds = np.zeros(players)
+    skill = rng.normal(0, SKILL_SPREAD, players)
+    totals.reached[1, 0] = players
+
+    for battle in range(1, battles + 1):
+        k = len(lv)
+        if k == 0:
+            break
+        clock = np.full(k, TIMING["intro"])
+
+        # generateEnemy
+        level_index = np.minimum(lv, levels - 1)
+        is_boss = (lv == boss["level"]) & (exp >= boss["exp_at"]) & ~boss_done
+        tpl = lo[level_index] + (rng.random(k, dtype=np.float32) * (hi - lo)[level_index]).astype(np.int64)
+        scale = 1 + (np.maximum(1, lv + rng.integers(-1, 2, k, dtype=np.int32)) - 1) * rules["growth"]
+        e_hp = np.where(is_boss, boss["hp"], np.floor(pool["hp"][tpl] * scale)).astype(np.int32)
+        e_exp = np.where(is_boss, boss["exp"], np.floor(pool["exp"][tpl] * scale))
+        cat = np.where(is_boss, boss_cat, pool["cat"][tpl])
+
+        p_correct = (1 / (1 + np.exp(-(logit[level_index] + skill)))).astype(np.float32)
+        think = answer_seconds[level_index]
+        hit = rules["hit_base"] + rules["hit_per_level"] * lv
+        miss = np.floor(max_hp * rules["miss_share"]).astype(np.int32) + rules["miss_base"]
+        attack_damage = np.floor(lv * rules["enemy_attack_per_level"]).astype(np.int32)
+        outcome = np.zeros(k, dtype=np.int8) # 0 fighting, 1 win, 2 lose, 3 run
+        asked = np.zeros(k, dtype=np.int32)
+
+        # Turns, each over the players whose battle is still on. Most battles
+        # end in the first rush, so that turn works on the whole arrays.
+        fighting = None
+        for turn in range(MAX_TURNS):
+            take = (lambda a: a) if fighting is None else (lambda a: a[fighting])
+            f_hp, f_max, f_mp, f_ehp, f_clock, f_asked = (take(a) for a in (hp, max_hp, mp, e_hp, clock, asked))
+            f_hit, f_miss, f_correct = take(hit), take(miss), take(p_correct)
+            n = len(f_hp)
+
+            # handleSpell / handleItem instead of attacking when low
+            healing = f_hp < heal_below * f_max
+            if heal == "spell":
+                healing &= f_mp >= rules["spell_cost"]
+                f_mp = f_mp - rules["spell_cost"] * healing
+                amount = rng.integers(heal_lo, heal_hi + 1, n, dtype=np.int32)
+            elif heal == "item":
+                amount = rules["item_heal"]
+            else:
+                healing[:] = False
+                amount = 0
+            f_hp = np.where(healing, np.minimum(f_hp + amount, f_max), f_hp)
+
+            # startRush: up to 5 questions, stopping at the first that ends the battle.
+            # Question-major (q, players) so the running count is a contiguous cumsum;
+            # the battle ends once the right (wrong) answers reach what it takes
+            # to knock the enemy (player) out.
+            right = rng.random((q, n), dtype=np.float32) < f_correct
+            got = np.cumsum(right, axis=0, dtype=np.int8)
+            need_right = np.minimum(-(-f_ehp // f_hit), q + 1).astype(np.int8)
+            need_wrong = np.minimum(-(-f_hp // f_miss), q + 1).astype(np.int8)
+            ended = (got >= need_right) | (ASKED[:q] - got >= need_wrong)
+            attacking = ~healing
+            over = ended.any(axis=0) & attacking
+            answered = np.where(over, ended.argmax(axis=0) + 1, q) * attacking
+            correct = got[np.maximum(answered - 1, 0), np.arange(n)] * attacking
+            won = over & (correct >= need_right)
+            f_ehp = f_ehp - correct * f_hit
+            f_hp = f_hp - (answered - correct) * f_miss
+            f_asked = f_asked + answered
+            f_clock = f_clock + np.where(healing, TIMING["heal_turn"], TIMING["fight"] + TIMING["enemy_turn"] * ~over) \
+                + answered * take(think) + correct * TIMING["after_correct"] \
+                + (answered - correct) * TIMING["after_wrong"] + won * TIMING["defeat"]
+
+            # enemyAttack for everyone whose battle goes on
+            countered = ~over
+            f_hp = f_hp - countered * (rng.integers(atk_lo, atk_hi + 1, n, dtype=np.int32) + take(attack_damage))
+            f_outcome = np.where(won, 1, np.where(over | (f_hp <= 0), 2, 0)).astype(np.int8)
+
+            if fighting is None:
+                hp, mp, e_hp, clock, asked, outcome = f_hp, f_mp, f_ehp, f_clock, f_asked, f_outcome
+                fighting = np.flatnonzero(outcome == 0)
+            else:
+                hp[fighting], mp[fighting], e_hp[fighting] = f_hp, f_mp, f_ehp
+                clock[fighting], asked[fighting], outcome[fighting] = f_clock, f_asked, f_outcome
+                fighting = fighting[f_outcome == 0]
+            if len(fighting) == 0:
+                break
+        else:
+            outcome[fighting] = 3
+
+        # winBattle + checkLevelUp (one level per win)
+        won = outcome == 1
+        exp += e_exp * won
+        clock += won * TIMING["win"]
+        up = won & (exp >= lv * rules["exp_per_level"])
+        lv += up
+        max_hp += up * rules["level_hp"]
+        hp = np.where(up, max_hp, hp)
+        mp = np.where(up, np.minimum(mp + rules["level_mp"], rules["mp_cap"]), mp)
+        clock += up * TIMING["level_up"]
+        boss_done |= won & is_boss
+        seconds += clock
+
+        reached = np.minimum(lv, levels - 1) * up
+        totals.reached[:, battle] += np.bincount(reached, minlength=levels)
+        totals.reached_seconds += np.bincount(reached, weights=seconds * up, minlength=levels)
+        by_outcome = np.bincount(cat * 4 + outcome, minlength=categories * 4).reshape(categories, 4)
+        totals.encounters += by_outcome.sum(axis=1)
+        totals.wins += by_outcome[:, 1]
+        totals.losses += by_outcome[:, 2]
+        totals.runs += by_outcome[:, 3]
+        totals.questions += per_category(cat, categories, asked).astype(np.int64)
+        totals.exp += per_category(cat, categories, e_exp * won)
+        totals.seconds += per_category(cat, categories, clock)
+
+        lost = outcome == 2
+        if lost.any():
+            totals.final_level += np.bincount(np.minimum(lv[lost], levels - 1), minlength=levels)
+            totals.game_overs += int(lost.sum())
+            keep = ~lost
+            lv, exp, hp, max_hp, mp, boss_done, seconds, skill = (
+                a[keep] for a in (lv, exp, hp, max_hp, mp, boss_done, seconds, skill))
+
+    totals.final_level += np.bincount(np.minimum(lv, levels - 1), minlength=levels)
+    totals.reached[0] = 0
+    return totals
+
+def run_chunk(args):
+    return simulate_chunk(*args)
+
+def simulate(sessions, battles=30, rules=RULES, stats=None, accuracy=None, answer_seconds=None,
+             default_accuracy=ACCURACY, heal="spell", heal_below=0.3, habitat=False, seed=0, jobs=1):
+    # Totals over `sessions` players playing up to `battles` battles each (or until
+    # game over). accuracy/answer_seconds: {level: value}, default_accuracy elsewhere.
+    pool = load_pool(stats)
+    accuracy = level_table(default_accuracy, accuracy or {}).clip(0.001, 0.999)
+    answer_seconds = level_table(ANSWER_SECONDS, answer_seconds or {})
+    sizes = [min(CHUNK, sessions - start) for start in range(0, sessions, CHUNK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    work = [(pool, size, battles, rules, accuracy, answer_seconds, heal, heal_below, habitat, s)
+            for size, s in zip(sizes, seeds)]
+    totals = Totals(len(HABITAT_BY_PREFIX) + 1, battles)
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for part in executor.map(run_chunk, work):
+                totals.add(part)
+    else:
+        for args in work:
+            totals.add(run_chunk(args))
+    return totals
+
+def percentile_index(row, share):
+    # Index (battle, level) below which `share` of a histogram's counts lie
+    cumulative = np.cumsum(row)
+    return int(np.searchsorted(cumulative, share * cumulative[-1]))
+
+def report(totals):
+    names = list(HABITAT_BY_PREFIX) + ["boss"]
+    levels = []
+    for level in range(2, MAX_LEVEL + 2):
+        row = totals.reached[level]
+        reached = int(row.sum())
+        if reached == 0:
+            continue
+        levels.append({
+            "level": level, "reached": round(reached / totals.sessions, 4),
+            "battles_median": percentile_index(row, 0.5), "battles_p90": percentile_index(row, 0.9),
+            "minutes_mean": round(totals.reached_seconds[level] / reached / 60, 1),
+        })
+    prefixes = []
+    for i, name in enumerate(names):
+        encounters = int(totals.encounters[i])
+        if encounters == 0:
+            continue
+        wins = int(totals.wins[i])
+        prefixes.append({
+            "prefix": name,
+            "habitat": HABITAT_BY_PREFIX.get(name, "Lv1 boss"),
+            "encounters": encounters,
+            "win_rate": round(wins / encounters, 4),
+            "loss_rate": round(int(totals.losses[i]) / encounters, 4),
+            "questions": round(int(totals.questions[i]) / encounters, 2),
+            "exp_per_win": round(float(totals.exp[i]) / wins, 2) if wins else 0,
+            "exp_per_minute": round(float(totals.exp[i]) / (totals.seconds[i] / 60), 2),
+        })
+    final = totals.final_level
+    return {
+        "sessions": totals.sessions,
+        "game_over_rate": round(totals.game_overs / totals.sessions, 4),
+        "final_level_median": percentile_index(final, 0.5),
+        "levels": levels,
+        "prefixes": prefixes,
+    }
+
+def print_report(result):
+    print(f"{result['sessions']:,} sessions: {result['game_over_rate']:.1%} game over, "
+          f"median final level {result['final_level_median']}")
+    print(f"\n{'Level':>5} {'reached':>8} {'battles p50':>12} {'p90':>5} {'minutes':>8}")
+    for row in result["levels"]:
+        if row["level"] > 10 and row["level"] % 5 and row is not result["levels"][-1]:
+            continue
+        print(f"{row['level']:>5} {row['reached']:>8.1%} {row['battles_median']:>12} "
+              f"{row['battles_p90']:>5} {row['minutes_mean']:>8.1f}")
+    boss = next((row for row in result["prefixes"] if row["prefix"] == "boss"), None)
+    if boss:
+        print(f"Lv1 boss: met in {boss['encounters'] / result['sessions']:.1%} of sessions, "
+              f"won {boss['win_rate']:.1%}")
+    print(f"\n{'Prefix':<6} {'battles':>10} {'win':>7} {'lose':>7} {'questions':>10} {'exp/win':>8} {'exp/min':>8}")
+    for row in result["prefixes"]:
+        print(f"{row['prefix']:<6} {row['encounters']:>10,} {row['win_rate']:>7.1%} {row['loss_rate']:>7.1%} "
+              f"{row['questions']:>10.2f} {row['exp_per_win']:>8.2f} {row['exp_per_minute']:>8.2f}")
+
+def parse_stats(values):
+    # ["C=20/5", ...] -> {"C": (20, 5)}
+    stats = {}
+    for value in values or []:
+        prefix, _, pair = value.partition("=")
+        hp, _, exp = pair.partition("/")
+        if prefix not in STATS_BY_PREFIX or not hp.isdigit() or not exp.isdigit():
+            raise ValueError(f"bad --stats {value!r}, expected e.g. C=15/5")
+        stats[prefix] = (int(hp), int(exp))
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate many players to check enemy stats and level pacing")
+    parser.add_argument("--sessions", "-n", type=int, default=1_000_000)
+    parser.add_argument("--battles", type=int, default=30,
+                        help="battles per session at most (default: 30, about a quarter of an hour)")
+    parser.add_argument("--growth", type=float, action="append",
+                        help=f"enemy stat growth per level (default: {RULES['growth']}); repeat to sweep")
+    parser.add_argument("--stats", action="append", metavar="PREFIX=HP/EXP",
+                        help="override a prefix's HP/EXP from enemy_compiler.py, e.g. C=20/5")
+    parser.add_argument("--accuracy", type=float, default=ACCURACY,
+                        help=f"share of right answers (default: {ACCURACY})")
+    parser.add_argument("--answer-stats", metavar="PATH|URL",
+                        help="per-level accuracy and answer time from /api/stats (a saved copy or the URL)")
+    parser.add_argument("--heal", choices=["spell", "item", "none"], default="spell",
+                        help="what players heal with below --heal-below of max HP (item: unlimited やくそう)")
+    parser.add_argument("--heal-below", type=float, default=0.3)
+    parser.add_argument("--habitat", action="store_true",
+                        help="draw enemies only from the habitat for the player's level")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON")
+    args = parser.parse_args()
+
+    try:
+        stats = parse_stats(args.stats)
+    except ValueError as e:
+        parser.error(str(e))
+    accuracy = {}
+    answer_seconds = {}
+    if args.answer_stats:
+        accuracy, answer_seconds = load_answer_stats(args.answer_stats)
+        print(f"Answer stats for {len(accuracy)} level(s) from {args.answer_stats}")
+
+    results = []
+    for growth in args.growth or [RULES["growth"]]:
+        rules = dict(RULES, growth=growth)
+        start = time.perf_counter()
+        totals = simulate(args.sessions, args.battles, rules, stats, accuracy, answer_seconds,
+                          default_accuracy=args.accuracy, heal=args.heal, heal_below=args.heal_below, habitat=args.habitat,
+                          seed=args.seed, jobs=args.jobs)
+        elapsed = time.perf_counter() - start
+        result = dict(report(totals), growth=growth, seconds=round(elapsed, 2))
+        print(f"\n=== growth {growth} ({elapsed:.1f}s) ===")
+        print_report(result)
+        results.append(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"rules": RULES, "timing": TIMING, "stats": {**STATS_BY_PREFIX, **stats},
+                       "results": results}, f, indent=2, ensure_ascii=False)
+            f.write("\n")
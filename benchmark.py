@@ -0,0 +1,295 @@
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import platform
+import tempfile
+import contextlib
+import subprocess
+
+# Benchmarks for the Python tooling on synthetic fixtures:
+#  - backgrounds: fix_backgrounds engines on checkerboard sprites, 256-4096 px
+#  - compile: enemy_compiler on generated raw_enemies.txt files, 100-100k rows
+#  - serve: loadtest.py against host_quest.py (pages, saves, events)
+# Image and compile cases each run in a fresh process so peak RSS is per case.
+# Results are written as JSON and compared with a saved baseline.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BENCH_DIR = os.path.join(BASE_DIR, "benchmarks")
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+LATEST_FILE = os.path.join(BENCH_DIR, "latest.json")
+
+STAGES = ["backgrounds", "compile", "serve"]
+SPRITE_SIZES = [256, 512, 1024, 2048, 4096]
+PYTHON_ENGINE_MAX = 1024 # The pure-Python engine takes minutes beyond this
+ENEMY_ROWS = [100, 1000, 10000, 100000]
+LOAD_MODES = ["pages", "saves", "events"]
+LOAD_CLIENTS = 30
+LOAD_DURATION = 5
+
+# --quick: small fixtures for a fast sanity run
+QUICK_SPRITE_SIZES = [256, 512, 1024]
+QUICK_ENEMY_ROWS = [100, 1000, 10000]
+QUICK_LOAD_DURATION = 2
+
+THRESHOLD = 0.2 # Throughput drop / memory growth vs. baseline reported as a regression
+
+# --- Fixtures ---
+
+def make_sprite(path, size, seed=0):
+    # Noisy blob with a wavy outline on a white/gray checkerboard, like the
+    # exported sprites fix_backgrounds was written for
+    import numpy as np
+    from PIL import Image
+    from fix_backgrounds import CHECKER_COLORS
+
+    rng = np.random.default_rng(seed)
+    y, x = np.ogrid[0:size, 0:size]
+    square = max(8, size // 32)
+    checker = ((x // square + y // square) % 2).astype(bool)
+    arr = np.empty((size, size, 3), dtype=np.uint8)
+    arr[...] = np.array(CHECKER_COLORS[0], dtype=np.uint8)
+    arr[checker] = CHECKER_COLORS[1]
+
+    dy, dx = y - size / 2, x - size / 2
+    radius = size * 0.35 * (1 + 0.1 * np.sin(7 * np.arctan2(dy, dx)))
+    inside = np.hypot(dx, dy) < radius
+    arr[inside] = rng.integers(20, 160, (int(inside.sum()), 3), dtype=np.uint8)
+    Image.fromarray(arr, "RGB").save(path, compress_level=1)
+
+def make_raw_enemies(path, rows, seed=0):
+    # Tab-separated rows in the raw_enemies.txt layout, spread over all ID
+    # prefixes, with some empty optional columns
+    import random
+    from enemy_compiler import STATS_BY_PREFIX, TYPE_EMOJI_MAP
+
+    rng = random.Random(seed)
+    prefixes = list(STATS_BY_PREFIX)
+    types = list(TYPE_EMOJI_MAP)
+    names = ["モスマン", "ビッグフット", "ネッシー", "スカイフィッシュ", "ツチノコ", "チュパカブラ", "イエティ"]
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(rows):
+            prefix = prefixes[i % len(prefixes)]
+            enemy_id = f"{prefix}{i // len(prefixes) + 1:03d}"
+            region = rng.choice(["アメリカ", "日本", "イギリス", ""])
+            size = rng.choice(["2m", "30cm", "", "10m以上"])
+            description = "なぞの生きもの" * rng.randint(0, 4)
+            f.write("\t".join([enemy_id, f"{rng.choice(names)}{i}", "まち", rng.choice(types),
+                               region, size, description]) + "\n")
+
+# --- Measurement ---
+
+def peak_rss_mb():
+    # Peak resident memory of this process so far. Prefer VmHWM: on Linux
+    # ru_maxrss carries over the parent's peak across fork + exec.
+    peak = server_peak_rss_mb(os.getpid())
+    if peak is not None:
+        return peak
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def server_peak_rss_mb(pid):
+    # VmHWM of another process (Linux only)
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+def run_case(case):
+    # Runs in a child process; returns the result dict for one case
+    stage = case["stage"]
+    if stage == "backgrounds":
+        from PIL import Image
+        from fix_backgrounds import ENGINES
+        img = Image.open(case["fixture"]).convert("RGBA")
+        base_rss = peak_rss_mb()
+        start = time.perf_counter()
+        ENGINES[case["engine"]](img)
+        seconds = time.perf_counter() - start
+        pixels = img.width * img.height
+        return {"seconds": round(seconds, 4), "throughput": round(pixels / seconds / 1e6, 3), "unit": "Mpx/s",
+                "peak_rss_mb": peak_rss_mb(), "base_rss_mb": base_rss}
+
+    if stage == "compile":
+        from enemy_compiler import compile_enemies
+        out_dir = tempfile.mkdtemp(prefix="bench_compile_")
+        base_rss = peak_rss_mb()
+        start = time.perf_counter()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            count = compile_enemies(case["fixture"], os.path.join(out_dir, "enemies.js"), assets_dir=out_dir,
+                                    force=True, shard_dir=os.path.join(out_dir, "enemies") if case["sharded"] else None)
+        seconds = time.perf_counter() - start
+        return {"seconds": round(seconds, 4), "throughput": round(count / seconds, 1), "unit": "rows/s",
+                "peak_rss_mb": peak_rss_mb(), "base_rss_mb": base_rss}
+
+    raise ValueError(f"unknown stage {stage}")
+
+def run_in_child(case):
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", json.dumps(case)],
+                          capture_output=True, text=True, cwd=BASE_DIR)
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "failed"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+def bench_backgrounds(tmp, sizes):
+    from fix_backgrounds import ENGINES
+    results = {}
+    for size in sizes:
+        fixture = os.path.join(tmp, f"sprite_{size}.png")
+        make_sprite(fixture, size)
+        for engine in ENGINES:
+            if engine == "python" and size > PYTHON_ENGINE_MAX:
+                continue
+            key = f"backgrounds/{engine}/{size}"
+            results[key] = run_in_child({"stage": "backgrounds", "engine": engine, "fixture": fixture})
+            print_result(key, results[key])
+    return results
+
+def bench_compile(tmp, row_counts):
+    results = {}
+    for rows in row_counts:
+        fixture = os.path.join(tmp, f"raw_enemies_{rows}.txt")
+        make_raw_enemies(fixture, rows)
+        for sharded in (False, True):
+            key = f"compile/{'sharded' if sharded else 'js'}/{rows}"
+            results[key] = run_in_child({"stage": "compile", "fixture": fixture, "sharded": sharded})
+            print_result(key, results[key])
+    return results
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def bench_serve(tmp, duration, clients=LOAD_CLIENTS):
+    from loadtest import run_load, wait_for_port
+    results = {}
+    for label, extra in [("dev", []), ("prod", ["--prod"])]:
+        for mode in LOAD_MODES:
+            if label == "dev" and mode != "pages":
+                continue # The single-threaded server is only the reference for page loads
+            port = free_port()
+            state = os.path.join(tmp, f"{label}-{mode}")
+            proc = subprocess.Popen([sys.executable, os.path.join(BASE_DIR, "host_quest.py"), "--port", str(port),
+                                     "--save-db", os.path.join(state, "saves.sqlite3"),
+                                     "--events-dir", os.path.join(state, "events")] + extra,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            key = f"serve/{label}/{mode}"
+            try:
+                if not wait_for_port(port):
+                    results[key] = {"error": "server did not start"}
+                    continue
+                load = run_load(f"http://127.0.0.1:{port}", clients, duration, mode=mode)
+                results[key] = {
+                    "seconds": duration, "throughput": round(load["rps"], 1), "unit": "req/s",
+                    "p50_ms": round(load["p50_ms"], 2), "p95_ms": round(load["p95_ms"], 2),
+                    "errors": load["errors"], "peak_rss_mb": server_peak_rss_mb(proc.pid),
+                }
+            finally:
+                proc.terminate()
+                proc.wait()
+            print_result(key, results[key])
+    return results
+
+# --- Reporting ---
+
+def print_result(key, result):
+    if "error" in result:
+        print(f"{key:<28} ERROR {result['error']}")
+        return
+    rss = f"{result['peak_rss_mb']:>8.1f} MB" if result.get("peak_rss_mb") is not None else "       - MB"
+    extra = f"  p95 {result['p95_ms']:.1f} ms, errors {result['errors']}" if "p95_ms" in result else ""
+    print(f"{key:<28} {result['throughput']:>12,.1f} {result['unit']:<6} {result['seconds']:>8.2f}s {rss}{extra}")
+
+def compare(results, baseline, threshold=THRESHOLD):
+    # Prints changes vs. baseline; returns the keys that regressed
+    regressions = []
+    print(f"\nVs. baseline ({baseline['meta'].get('date', '?')}, {baseline['meta'].get('machine', '?')}):")
+    for key, result in results.items():
+        base = baseline["results"].get(key)
+        if not base or "error" in base or "error" in result:
+            continue
+        speed = result["throughput"] / base["throughput"] - 1
+        memory = None
+        if result.get("peak_rss_mb") and base.get("peak_rss_mb"):
+            memory = result["peak_rss_mb"] / base["peak_rss_mb"] - 1
+        flag = ""
+        if speed < -threshold or (memory is not None and memory > threshold):
+            regressions.append(key)
+            flag = "  REGRESSION"
+        mem_text = f"{memory:+7.1%}" if memory is not None else "      -"
+        print(f"  {key:<28} throughput {speed:+7.1%}  peak memory {mem_text}{flag}")
+    return regressions
+
+def machine_info():
+    info = {
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "machine": f"{platform.system()} {platform.machine()}, {os.cpu_count()} CPUs",
+        "python": platform.python_version(),
+    }
+    try:
+        import numpy
+        info["numpy"] = numpy.__version__
+    except ImportError:
+        info["numpy"] = None
+    return info
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the image pipeline, enemy compiler and server")
+    parser.add_argument("--stages", default=",".join(STAGES), help=f"comma-separated subset of {STAGES}")
+    parser.add_argument("--quick", action="store_true", help="smaller fixtures and shorter load runs")
+    parser.add_argument("--output", default=LATEST_FILE, help="where to write this run's results")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="also store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="relative throughput drop / memory growth counted as a regression")
+    parser.add_argument("--check", action="store_true", help="exit with an error if anything regressed")
+    parser.add_argument("--case", help=argparse.SUPPRESS) # Internal: run one case in this process
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(json.loads(args.case))))
+        sys.exit(0)
+
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench_") as tmp:
+        if "backgrounds" in stages:
+            results.update(bench_backgrounds(tmp, QUICK_SPRITE_SIZES if args.quick else SPRITE_SIZES))
+        if "compile" in stages:
+            results.update(bench_compile(tmp, QUICK_ENEMY_ROWS if args.quick else ENEMY_ROWS))
+        if "serve" in stages:
+            results.update(bench_serve(tmp, QUICK_LOAD_DURATION if args.quick else LOAD_DURATION))
+
+    run = {"meta": machine_info(), "results": results}
+    write_json(args.output, run)
+    print(f"\nWrote {os.path.relpath(args.output)}")
+    if args.save_baseline:
+        write_json(args.baseline, run)
+        print(f"Saved baseline {os.path.relpath(args.baseline)}")
+
+    regressions = []
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}.")
+    if args.check and regressions:
+        sys.exit(1)
@@ -0,0 +1,189 @@
+import os
+import json
+from PIL import Image
+
+from optimize_sprites import save_variant
+from enemy_compiler import BASE_DIR, sprite_groups
+
+ASSETS_DIR = "assets"
+
+# Sprites are packed at the same scale as the 512w variants (the game never
+# shows them larger), trimmed to their alpha bounding box. Each habitat (enemy
+# shard) gets its own sheets with only the sprites its enemies use, so a page
+# never pulls in art for places the player hasn't reached.
+SPRITE_WIDTH = 512
+SHEET_SIZE = 2048 # Safe max texture size on classroom tablets
+PADDING = 2 # Transparent gap so neighbours don't bleed when scaled
+
+ATLAS_FILE = "atlas.json"
+
+def sheet_name(group, index):
+    return f"atlas_{group}_{index}.png"
+
+class SkylinePacker:
+    # Bottom-left skyline bin packing into a fixed-size sheet.
+    # The skyline is a list of [x, y, width] segments covering the sheet width.
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.skyline = [[0, 0, width]]
+
+    def _fit(self, index, w, h):
+        # Lowest y at which a w-wide rect can sit starting at segment index, or None
+        x = self.skyline[index][0]
+        if x + w > self.width:
+            return None
+        y = 0
+        remaining = w
+        i = index
+        while remaining > 0:
+            seg_x, seg_y, seg_w = self.skyline[i]
+            y = max(y, seg_y)
+            if y + h > self.height:
+                return None
+            remaining -= seg_w
+            i += 1
+        return y
+
+    def insert(self, w, h):
+        # Returns (x, y) or None if the rect doesn't fit
+        best = None
+        for i in range(len(self.skyline)):
+            y = self._fit(i, w, h)
+            if y is None:
+                continue
+            x = self.skyline[i][0]
+            if best is None or (y + h, x) < (best[1] + h, best[0]):
+                best = (x, y, i)
+        if best is None:
+            return None
+
+        x, y, index = best
+        self._add_segment(index, x, y + h, w)
+        return x, y
+
+    def _add_segment(self, index, x, top, w):
+        self.skyline.insert(index, [x, top, w])
+
+        # Shrink or drop the segments now covered by the new one
+        i = index + 1
+        while i < len(self.skyline):
+            seg = self.skyline[i]
+            prev_end = self.skyline[i - 1][0] + self.skyline[i - 1][2]
+            if seg[0] >= prev_end:
+                break
+            shrink = prev_end - seg[0]
+            seg[0] += shrink
+            seg[2] -= shrink
+            if seg[2] <= 0:
+                del self.skyline[i]
+            else:
+                break
+
+        # Merge neighbours at the same height
+        i = 0
+        while i < len(self.skyline) - 1:
+            if self.skyline[i][1] == self.skyline[i + 1][1]:
+                self.skyline[i][2] += self.skyline[i + 1][2]
+                del self.skyline[i + 1]
+            else:
+                i += 1
+
+def load_sprite(path):
+    # Returns the scaled, trimmed sprite and its frame info
+    img = Image.open(path).convert("RGBA")
+    scale = SPRITE_WIDTH / img.size[0]
+    frame_w = SPRITE_WIDTH
+    frame_h = max(1, round(img.size[1] * scale))
+    img = img.resize((frame_w, frame_h), Image.LANCZOS)
+
+    bbox = img.getchannel("A").getbbox() or (0, 0, 1, 1)
+    trimmed = img.crop(bbox)
+    frame = {
+        "w": trimmed.size[0], "h": trimmed.size[1],
+        "offsetX": bbox[0], "offsetY": bbox[1],
+        "sourceW": frame_w, "sourceH": frame_h,
+    }
+    return trimmed, frame
+
+def pack(sprites):
+    # sprites: {name: (image, frame)}; tallest first packs tightest on a skyline.
+    # Returns a list of packers (one per sheet) and fills frame["sheet"] (index
+    # into that list), ["x"], ["y"].
+    packers = []
+    order = sorted(sprites, key=lambda n: (-sprites[n][1]["h"], -sprites[n][1]["w"], n))
+    for name in order:
+        frame = sprites[name][1]
+        w, h = frame["w"] + PADDING, frame["h"] + PADDING
+        if w > SHEET_SIZE or h > SHEET_SIZE:
+            raise ValueError(f"{name} ({frame['w']}x{frame['h']}) does not fit in a {SHEET_SIZE}px sheet")
+
+        for index, packer in enumerate(packers):
+            pos = packer.insert(w, h)
+            if pos:
+                break
+        else:
+            packers.append(SkylinePacker(SHEET_SIZE, SHEET_SIZE))
+            index = len(packers) - 1
+            pos = packers[index].insert(w, h)
+
+        frame["sheet"] = index
+        frame["x"], frame["y"] = pos
+    return packers
+
+def build_atlas(groups, assets_dir=ASSETS_DIR):
+    # groups: {group: sprite paths}; frame["sheet"] ends up indexing atlas["sheets"]
+    sheets = []
+    frames = {}
+    for group, paths in groups.items():
+        sprites = {os.path.basename(p): load_sprite(p) for p in paths}
+        packers = pack(sprites)
+        for index in range(len(packers)):
+            used_w = max((f["x"] + f["w"] for _, f in sprites.values() if f["sheet"] == index), default=1)
+            used_h = max((f["y"] + f["h"] for _, f in sprites.values() if f["sheet"] == index), default=1)
+            sheet = Image.new("RGBA", (used_w, used_h), (0, 0, 0, 0))
+            for img, frame in sprites.values():
+                if frame["sheet"] == index:
+                    sheet.paste(img, (frame["x"], frame["y"]))
+
+            # Same palette-quantized PNG encoding as the sprite variants
+            name = sheet_name(group, index)
+            size = save_variant(sheet, os.path.join(assets_dir, name), "png")
+            sheets.append({"image": f"assets/{name}", "width": used_w, "height": used_h, "bytes": size})
+            print(f"  {name}: {used_w}x{used_h}, {size // 1024} KB")
+        for name, (_, frame) in sprites.items():
+            frame["sheet"] += len(sheets) - len(packers)
+            frames[name] = frame
+
+    atlas = {"sheets": sheets, "sprites": dict(sorted(frames.items()))}
+    with open(os.path.join(assets_dir, ATLAS_FILE), "w", encoding="utf-8") as f:
+        json.dump(atlas, f, indent=2)
+    return atlas
+
+def load_atlas(assets_dir=ASSETS_DIR):
+    try:
+        with open(os.path.join(assets_dir, ATLAS_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def atlas_entry(atlas, image_path):
+    # The "atlas" field for an enemyData entry whose image is image_path, or None
+    if not atlas or not image_path:
+        return None
+    frame = atlas["sprites"].get(os.path.basename(image_path))
+    if frame is None:
+        return None
+    entry = {"image": atlas["sheets"][frame["sheet"]]["image"]}
+    entry.update({k: frame[k] for k in ("x", "y", "w", "h", "offsetX", "offsetY", "sourceW", "sourceH")})
+    return entry
+
+if __name__ == "__main__":
+    # The PNG sprites the compiled enemy table uses, per shard
+    groups = {group: [os.path.join(BASE_DIR, p) for p in paths if p.endswith(".png")]
+              for group, paths in sprite_groups().items()}
+    groups = {group: paths for group, paths in groups.items() if paths}
+    print(f"Packing {sum(len(p) for p in groups.values())} sprites into {len(groups)} group(s)...")
+    atlas = build_atlas(groups)
+    print(f"Wrote {len(atlas['sheets'])} sheet(s) and {ATLAS_FILE}.")
@@ -0,0 +1,143 @@
+import os
+import re
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+
+import build_manifest
+from build_manifest import ENTRY, SW_FILE, MANIFEST_FILE, TEXT_TYPES, REF_RE, CRITICAL_EXTRA, PRECACHE_EXTRA
+
+# Builds dist/: every file the game can load (found the same way as
+# build_manifest.py, starting from index.html) copied under a name carrying
+# its content hash, e.g. game.js -> game.3f2a9c01de.js, with all references
+# rewritten to the hashed names. Text files are rewritten before they are
+# hashed, so a changed sprite also renames the enemy shard pointing at it,
+# the shard index, and so on up to index.html. Only index.html, sw.js and
+# asset-manifest.json keep their names.
+# host_quest.py --dist serves the tree and marks hashed files immutable.
+# Hashed files from the previous build are kept so pages that are already
+# open can still lazy-load their shards.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DIST_DIR = os.path.join(BASE_DIR, "dist")
+BUILD_FILE = ".build.json" # Hashed files of the current and previous build
+HASH_LENGTH = 10
+HASHED_RE = re.compile(r"\.[0-9a-f]{%d}\.[A-Za-z0-9]+$" % HASH_LENGTH) # Also used by host_quest.py
+
+def hashed_name(path, data):
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{ext}"
+
+def rewrite_references(text, rel_path, renamed):
+    # References in text with their targets' hashed names; ?v= queries are dropped
+    base = build_manifest.reference_base(rel_path)
+
+    def replace(m):
+        target = build_manifest.resolve_reference(base, m.group(1))
+        if target not in renamed:
+            return m.group(0)
+        new = renamed[target]
+        if base:
+            new = os.path.relpath(new, base).replace(os.sep, "/")
+        return m.group(0)[0] + new + m.group(0)[-1]
+
+    return REF_RE.sub(replace, text)
+
+def build_files(root=BASE_DIR):
+    # {source path: (output path, bytes)} for everything reachable from ENTRY,
+    # plus the list of referenced paths that don't exist
+    found = build_manifest.crawl(root)
+    missing = sorted(p for p in found if not os.path.isfile(os.path.join(root, p)))
+    outputs = {}
+    renamed = {}
+    visiting = set()
+
+    def visit(path):
+        # Depth-first, so every dependency is renamed before its referrer is hashed
+        if path in outputs or path in missing:
+            return
+        visiting.add(path)
+        with open(os.path.join(root, path), "rb") as f:
+            data = f.read()
+        if path.endswith(TEXT_TYPES):
+            for target, _ in build_manifest.find_references(root, path):
+                if target in visiting:
+                    print(f"Warning: reference cycle {path} -> {target}, left unhashed")
+                elif target in found and target not in (MANIFEST_FILE, SW_FILE):
+                    visit(target)
+            data = rewrite_references(data.decode("utf-8"), path, renamed).encode("utf-8")
+        visiting.discard(path)
+        out = path if path == ENTRY else hashed_name(path, data)
+        renamed[path] = out
+        outputs[path] = (out, data)
+
+    visit(ENTRY)
+    return outputs, missing
+
+def write_file(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def build_dist(root=BASE_DIR, dist_dir=DIST_DIR):
+    outputs, missing = build_files(root)
+    try:
+        with open(os.path.join(dist_dir, BUILD_FILE), "r", encoding="utf-8") as f:
+            previous = json.load(f).get("files", [])
+    except (OSError, ValueError):
+        previous = []
+
+    written = 0
+    for out, data in outputs.values():
+        path = os.path.join(dist_dir, out)
+        # Same hashed name means same content
+        if out != ENTRY and os.path.exists(path):
+            continue
+        if out != ENTRY:
+            write_file(path, data)
+            written += 1
+
+    # The page, its service worker and manifest go last, once everything they point at exists
+    write_file(os.path.join(dist_dir, ENTRY), outputs[ENTRY][1])
+    critical = [outputs[p][0] for p in CRITICAL_EXTRA if p in outputs]
+    precache = [outputs[p][0] for p in PRECACHE_EXTRA if p in outputs]
+    manifest = build_manifest.build_manifest(dist_dir, critical_extra=critical, precache_extra=precache)
+    write_file(os.path.join(dist_dir, MANIFEST_FILE),
+               (json.dumps(manifest, indent=2, ensure_ascii=False) + "\n").encode("utf-8"))
+    write_file(os.path.join(dist_dir, SW_FILE), build_manifest.render_service_worker(manifest).encode("utf-8"))
+
+    current = sorted(out for out, _ in outputs.values() if out != ENTRY)
+    keep = set(current) | set(previous)
+    removed = 0
+    for dirpath, _, filenames in os.walk(dist_dir):
+        for name in filenames:
+            rel_path = os.path.relpath(os.path.join(dirpath, name), dist_dir).replace(os.sep, "/")
+            if HASHED_RE.search(name) and rel_path not in keep:
+                os.remove(os.path.join(dirpath, name))
+                removed += 1
+    write_file(os.path.join(dist_dir, BUILD_FILE), json.dumps({"files": current}).encode("utf-8"))
+
+    total = sum(len(data) for _, data in outputs.values())
+    print(f"Built {os.path.relpath(dist_dir)}: {len(outputs)} files ({total // 1024} KB), "
+          f"{written} new, {removed} stale removed.")
+    for path in missing:
+        print(f"  Missing: {path}")
+    return outputs, missing
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build dist/ with content-hashed file names")
+    parser.add_argument("--root", default=BASE_DIR)
+    parser.add_argument("--output", default=DIST_DIR)
+    parser.add_argument("--clean", action="store_true", help="delete the output directory first")
+    parser.add_argument("--strict", action="store_true", help="exit with an error if any asset is missing")
+    args = parser.parse_args()
+
+    if args.clean and os.path.isdir(args.output):
+        shutil.rmtree(args.output)
+    _, missing = build_dist(args.root, os.path.abspath(args.output))
+    if args.strict and missing:
+        sys.exit(1)
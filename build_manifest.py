@@ -0,0 +1,218 @@
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+from collections import deque
+
+# Finds every asset the game can request by following references from
+# index.html (scripts, styles, enemy shards, problem banks, images, audio),
+# then writes:
+#  - asset-manifest.json: size + hash per asset, missing and unused files,
+#    the preload list host_quest.py sends as Link headers
+#  - sw.js: service worker that precaches the page shell and the enemy
+#    shards for offline play; sprites, problem banks and audio are cached on
+#    first use (game.js requests the next battle's sprite ahead of time)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_FILE = "asset-manifest.json"
+SW_FILE = "sw.js"
+
+ENTRY = "index.html"
+ASSET_DIRS = ["assets", "enemies", "problems"] # Files here that nothing references are reported as unused
+TEXT_TYPES = (".html", ".css", ".js", ".json") # Scanned for further references
+# Needed before the title screen can show; game.js sets the title background
+CRITICAL_EXTRA = ["assets/title_bg.png"]
+# Precached with the page and what it references directly: the backdrops and
+# the problem index game.js reads before the first battle
+PRECACHE_EXTRA = ["assets/battle_bg.png", "problems/index.json"]
+PRECACHE_DIRS = ["enemies"] # Every shard (a few KB each): the first battle can draw from any of them
+PRELOAD_MAX_BYTES = 128 * 1024 # Larger images aren't worth holding up the code for
+
+REF_RE = re.compile(r"""["'`(]((?:\./)?[\w\-./]+\.(?:png|jpe?g|gif|webp|avif|svg|mp3|ogg|wav|m4a|js|css|json))"""
+                    r"""(\?[^"'`()\s]*)?["'`)]""")
+PRELOAD_AS = {
+    ".js": "script", ".css": "style",
+    ".png": "image", ".jpg": "image", ".jpeg": "image", ".gif": "image",
+    ".webp": "image", ".avif": "image", ".svg": "image",
+}
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()[:16]
+
+def reference_base(rel_path):
+    # CSS url()s are relative to the stylesheet, everything else to the page
+    return os.path.dirname(rel_path) if rel_path.endswith(".css") else ""
+
+def resolve_reference(base, ref):
+    # Root-relative path for a reference, or None if it points outside the root
+    target = os.path.normpath(os.path.join(base, ref)).replace(os.sep, "/")
+    return None if target.startswith("..") else target
+
+def find_references(root, rel_path):
+    # [(resolved path, url as written)] referenced by a text file
+    with open(os.path.join(root, rel_path), "r", encoding="utf-8", errors="replace") as f:
+        text = f.read()
+    base = reference_base(rel_path)
+    refs = []
+    for m in REF_RE.finditer(text):
+        target = resolve_reference(base, m.group(1))
+        if target is not None:
+            refs.append((target, target + (m.group(2) or "")))
+    return refs
+
+def crawl(root, entry=ENTRY):
+    # Breadth-first over references: {path: {"url", "referencedBy"}} for every
+    # reachable path, whether or not it exists
+    found = {entry: {"url": entry, "referencedBy": []}}
+    queue = deque([entry])
+    while queue:
+        rel_path = queue.popleft()
+        if not rel_path.endswith(TEXT_TYPES) or not os.path.isfile(os.path.join(root, rel_path)):
+            continue
+        for target, url in find_references(root, rel_path):
+            if target in (MANIFEST_FILE, SW_FILE):
+                continue # Generated from this crawl
+            if target not in found:
+                found[target] = {"url": url, "referencedBy": []}
+                queue.append(target)
+            if rel_path not in found[target]["referencedBy"]:
+                found[target]["referencedBy"].append(rel_path)
+    return found
+
+def build_manifest(root=BASE_DIR, critical_extra=CRITICAL_EXTRA, precache_extra=PRECACHE_EXTRA):
+    found = crawl(root)
+    critical = {path for path, info in found.items() if ENTRY in info["referencedBy"]} | set(critical_extra)
+
+    assets = {}
+    missing = []
+    for path in sorted(found):
+        info = found[path]
+        full_path = os.path.join(root, path)
+        if not os.path.isfile(full_path):
+            missing.append({"path": path, "referencedBy": info["referencedBy"]})
+            continue
+        assets[path] = {
+            "url": info["url"],
+            "size": os.path.getsize(full_path),
+            "sha256": file_hash(full_path),
+            "referencedBy": info["referencedBy"],
+        }
+
+    unused = []
+    for d in ASSET_DIRS:
+        full_dir = os.path.join(root, d)
+        if not os.path.isdir(full_dir):
+            continue
+        for name in sorted(os.listdir(full_dir)):
+            path = f"{d}/{name}"
+            if not name.startswith(".") and os.path.isfile(os.path.join(full_dir, name)) and path not in found:
+                unused.append({"path": path, "size": os.path.getsize(os.path.join(full_dir, name))})
+
+    # Stylesheet, then scripts, then the small images
+    order = {"style": 0, "script": 1, "image": 2}
+    preload = [{"url": assets[path]["url"], "as": PRELOAD_AS[os.path.splitext(path)[1]]}
+               for path in sorted(critical, key=lambda p: (order.get(PRELOAD_AS.get(os.path.splitext(p)[1])), p))
+               if path in assets and os.path.splitext(path)[1] in PRELOAD_AS
+               and (PRELOAD_AS[os.path.splitext(path)[1]] != "image" or assets[path]["size"] <= PRELOAD_MAX_BYTES)]
+    # "./" too: the page is usually requested as the bare directory
+    precached = critical | set(precache_extra) | {path for path in assets if path.split("/")[0] in PRECACHE_DIRS}
+    precache = ["./", ENTRY] + [assets[path]["url"] for path in sorted(precached) if path in assets and path != ENTRY]
+
+    version = hashlib.sha256("".join(f"{p}:{a['sha256']}" for p, a in assets.items()).encode()).hexdigest()[:12]
+    return {
+        "version": version,
+        "assets": assets,
+        "missing": missing,
+        "unused": unused,
+        "preload": preload,
+        "precache": precache,
+    }
+
+def render_service_worker(manifest):
+    # Network first (so edits show up right away), precached copy when offline
+    return f"""// Generated by build_manifest.py from {MANIFEST_FILE}; do not edit.
+const CACHE = 'math-quest-{manifest["version"]}';
+const PRECACHE = {json.dumps(manifest["precache"], indent=4)};
+
+self.addEventListener('install', (event) => {{
+    event.waitUntil(caches.open(CACHE).then(cache => cache.addAll(PRECACHE)).then(() => self.skipWaiting()));
+}});
+
+self.addEventListener('activate', (event) => {{
+    event.waitUntil(caches.keys()
+        .then(keys => Promise.all(keys.filter(k => k.startsWith('math-quest-') && k !== CACHE).map(k => caches.delete(k))))
+        .then(() => self.clients.claim()));
+}});
+
+self.addEventListener('fetch', (event) => {{
+    const request = event.request;
+    const url = new URL(request.url);
+    // Leave the API, other origins and ranged audio requests to the network
+    if (request.method !== 'GET' || url.origin !== location.origin || url.pathname.startsWith('/api/')
+        || request.headers.has('range')) {{
+        return;
+    }}
+    event.respondWith(fetch(request)
+        .then(response => {{
+            if (response.status === 200) {{
+                const copy = response.clone();
+                caches.open(CACHE).then(cache => cache.put(request, copy));
+            }}
+            return response;
+        }})
+        .catch(() => caches.match(request, {{ ignoreSearch: true }})
+            .then(cached => cached || Response.error())));
+}});
+"""
+
+def write_text(path, text):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def load_manifest(root=BASE_DIR):
+    try:
+        with open(os.path.join(root, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def preload_header(manifest):
+    # Value for the Link header sent with index.html, or None
+    if not manifest or not manifest.get("preload"):
+        return None
+    return ", ".join(f"</{p['url']}>; rel=preload; as={p['as']}" for p in manifest["preload"])
+
+def print_report(manifest):
+    total = sum(a["size"] for a in manifest["assets"].values())
+    print(f"{len(manifest['assets'])} assets ({total // 1024} KB), "
+          f"{len(manifest['preload'])} preloaded, {len(manifest['precache'])} precached.")
+    if manifest["missing"]:
+        print(f"Missing ({len(manifest['missing'])}):")
+        for m in manifest["missing"]:
+            print(f"  {m['path']}  (referenced by {', '.join(m['referencedBy'])})")
+    if manifest["unused"]:
+        unused_kb = sum(u["size"] for u in manifest["unused"]) // 1024
+        print(f"Unused ({len(manifest['unused'])}, {unused_kb} KB):")
+        for u in manifest["unused"]:
+            print(f"  {u['path']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build asset-manifest.json and sw.js")
+    parser.add_argument("--root", default=BASE_DIR)
+    parser.add_argument("--strict", action="store_true", help="exit with an error if any asset is missing")
+    args = parser.parse_args()
+
+    manifest = build_manifest(args.root)
+    write_text(os.path.join(args.root, MANIFEST_FILE), json.dumps(manifest, indent=2, ensure_ascii=False) + "\n")
+    write_text(os.path.join(args.root, SW_FILE), render_service_worker(manifest))
+    print_report(manifest)
+    if args.strict and manifest["missing"]:
+        sys.exit(1)
@@ -1,3 +1,4 @@
+// enemy_compiler build a5ce2d7b466119e6b1ffb451c082efe7
 window.enemyData = [
     {
         "id": "C000",
@@ -17,24 +18,118 @@ window.enemyData = [
         "exp": 5,
         "habitat": "まち",
         "type": "怪異/ひと型",
-        "region": "目が赤い・毛が生えている設定",
+        "region": "",
         "size": "",
-        "description": "",
-        "image": "assets/uma_mothman.png"
+        "description": "目が赤い・毛が生えている設定",
+        "image": "assets/uma_mothman.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_mothman-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_mothman-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_mothman-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_mothman-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_mothman-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_mothman-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_mothman.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 980,
+            "y": 205,
+            "w": 236,
+            "h": 149,
+            "offsetX": 138,
+            "offsetY": 85,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C002",
         "name": "モンキーマン",
-        "image": "assets/uma_monkey_man.png",
         "emoji": "👾",
         "hp": 15,
         "maxHp": 15,
         "exp": 5,
         "habitat": "まち",
         "type": "ひと型",
-        "region": "100人以上が目撃などの設定",
+        "region": "",
         "size": "",
-        "description": ""
+        "description": "100人以上が目撃などの設定",
+        "image": "assets/uma_monkey_man.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_monkey_man-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_monkey_man-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_monkey_man-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_monkey_man-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_monkey_man-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_monkey_man-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_monkey_man.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 411,
+            "y": 0,
+            "w": 138,
+            "h": 211,
+            "offsetX": 190,
+            "offsetY": 59,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C003",
@@ -45,24 +140,118 @@ window.enemyData = [
         "exp": 5,
         "habitat": "まち",
         "type": "宇宙人",
-        "region": "小柄な人間くらい・体は灰色",
+        "region": "",
         "size": "",
-        "description": "",
-        "image": "assets/uma_gray.png"
+        "description": "小柄な人間くらい・体は灰色",
+        "image": "assets/uma_gray.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_gray-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_gray-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_gray-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_gray-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_gray-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_gray-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_gray.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 1509,
+            "y": 0,
+            "w": 92,
+            "h": 186,
+            "offsetX": 213,
+            "offsetY": 65,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C004",
         "name": "キシュテム・ドワーフ",
-        "image": "assets/uma_kistem_dwarf.png",
         "emoji": "🧚",
         "hp": 15,
         "maxHp": 15,
         "exp": 5,
         "habitat": "まち",
         "type": "小人",
-        "region": "0.5",
-        "size": "頭が大きい赤ちゃんのよう",
-        "description": ""
+        "region": "",
+        "size": "0.5",
+        "description": "頭が大きい赤ちゃんのよう",
+        "image": "assets/uma_kistem_dwarf.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_kistem_dwarf-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_kistem_dwarf-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_kistem_dwarf-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_kistem_dwarf-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_kistem_dwarf-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_kistem_dwarf-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_kistem_dwarf.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 1185,
+            "y": 0,
+            "w": 130,
+            "h": 192,
+            "offsetX": 202,
+            "offsetY": 70,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C005",
@@ -73,10 +262,57 @@ window.enemyData = [
         "exp": 5,
         "habitat": "まち",
         "type": "獣人",
-        "region": "トカゲのような姿",
+        "region": "",
         "size": "",
-        "description": "",
-        "image": "assets/uma_lizardman.png"
+        "description": "トカゲのような姿",
+        "image": "assets/uma_lizardman.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_lizardman-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_lizardman-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_lizardman-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_lizardman-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_lizardman-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_lizardman-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_lizardman.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 1870,
+            "y": 183,
+            "w": 136,
+            "h": 172,
+            "offsetX": 206,
+            "offsetY": 78,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C006",
@@ -87,38 +323,179 @@ window.enemyData = [
         "exp": 5,
         "habitat": "まち",
         "type": "怪異/ひと型",
-        "region": "1.2",
-        "size": "細い手足・長いゆび",
-        "description": "",
-        "image": "assets/uma_dover_demon.png"
+        "region": "",
+        "size": "1.2",
+        "description": "細い手足・長いゆび",
+        "image": "assets/uma_dover_demon.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_dover_demon-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_dover_demon-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_dover_demon-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_dover_demon-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_dover_demon-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_dover_demon-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_dover_demon.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 1721,
+            "y": 185,
+            "w": 92,
+            "h": 172,
+            "offsetX": 215,
+            "offsetY": 79,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C007",
         "name": "フォウク・モンスター",
-        "image": "assets/uma_fouke_monster.png",
         "emoji": "🦍",
         "hp": 15,
         "maxHp": 15,
         "exp": 5,
         "habitat": "まち",
         "type": "獣人",
-        "region": "2",
-        "size": "長い毛・におい設定",
-        "description": ""
+        "region": "",
+        "size": "2",
+        "description": "長い毛・におい設定",
+        "image": "assets/uma_fouke_monster.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_fouke_monster-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_fouke_monster-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_fouke_monster-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_fouke_monster-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_fouke_monster-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_fouke_monster-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_fouke_monster.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 1721,
+            "y": 0,
+            "w": 147,
+            "h": 183,
+            "offsetX": 193,
+            "offsetY": 72,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C008",
         "name": "ノーム",
-        "image": "assets/uma_gnome.png",
         "emoji": "🧚",
         "hp": 15,
         "maxHp": 15,
         "exp": 5,
         "habitat": "まち",
         "type": "小人",
-        "region": "1",
-        "size": "ヨーロッパなどの伝承系",
-        "description": ""
+        "region": "",
+        "size": "1",
+        "description": "ヨーロッパなどの伝承系",
+        "image": "assets/uma_gnome.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_gnome-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_gnome-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_gnome-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_gnome-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_gnome-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_gnome-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_gnome.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 861,
+            "y": 0,
+            "w": 117,
+            "h": 204,
+            "offsetX": 203,
+            "offsetY": 59,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C009",
@@ -129,15 +506,61 @@ window.enemyData = [
         "exp": 5,
         "habitat": "まち",
         "type": "怪異",
-        "region": "1",
-        "size": "白くて細い・足だけのような見た目",
-        "description": "",
-        "image": "assets/uma_night_crawler.png"
+        "region": "",
+        "size": "1",
+        "description": "白くて細い・足だけのような見た目",
+        "image": "assets/uma_night_crawler.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_night_crawler-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_night_crawler-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_night_crawler-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_night_crawler-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_night_crawler-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_night_crawler-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_night_crawler.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 1870,
+            "y": 0,
+            "w": 93,
+            "h": 181,
+            "offsetX": 215,
+            "offsetY": 72,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C010",
         "name": "ジェヴォーダンのけもの",
-        "image": "assets/uma_beast_of_gevaudan.png",
         "emoji": "🐺",
         "hp": 15,
         "maxHp": 15,
@@ -146,26 +569,120 @@ window.enemyData = [
         "type": "獣",
         "region": "フランス",
         "size": "1.7",
-        "description": "おおかみのような設定"
+        "description": "おおかみのような設定",
+        "image": "assets/uma_beast_of_gevaudan.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_beast_of_gevaudan-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_beast_of_gevaudan-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_beast_of_gevaudan-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_beast_of_gevaudan-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_beast_of_gevaudan-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_beast_of_gevaudan-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_beast_of_gevaudan.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 1509,
+            "y": 188,
+            "w": 170,
+            "h": 159,
+            "offsetX": 190,
+            "offsetY": 90,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C011",
         "name": "バウオコジ",
-        "image": "assets/uma_bauokoji.png",
         "emoji": "👻",
         "hp": 15,
         "maxHp": 15,
         "exp": 5,
         "habitat": "まち",
         "type": "怪異/こうもり系",
-        "region": "コウモリ/サル/犬のような姿と言われる",
+        "region": "",
         "size": "",
-        "description": ""
+        "description": "コウモリ/サル/犬のような姿と言われる",
+        "image": "assets/uma_bauokoji.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_bauokoji-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_bauokoji-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_bauokoji-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_bauokoji-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_bauokoji-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_bauokoji-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_bauokoji.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 1317,
+            "y": 189,
+            "w": 166,
+            "h": 156,
+            "offsetX": 186,
+            "offsetY": 92,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C012",
         "name": "ジャドーピープル",
-        "image": "assets/uma_shadow_people.png",
         "emoji": "👻",
         "hp": 15,
         "maxHp": 15,
@@ -174,21 +691,116 @@ window.enemyData = [
         "type": "怪異/ひと型",
         "region": "アメリカ",
         "size": "1.7-2",
-        "description": "人を体調不良にしたり家電をゆらす設定"
+        "description": "人を体調不良にしたり家電をゆらす設定",
+        "image": "assets/uma_shadow_people.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_shadow_people-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_shadow_people-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_shadow_people-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_shadow_people-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_shadow_people-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_shadow_people-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_shadow_people.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 1096,
+            "y": 0,
+            "w": 87,
+            "h": 199,
+            "offsetX": 218,
+            "offsetY": 66,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C013",
         "name": "スレンダーマン",
-        "image": "assets/uma_slenderman.png",
         "emoji": "👻",
         "hp": 15,
         "maxHp": 15,
         "exp": 5,
         "habitat": "まち",
         "type": "怪異/ひと型",
-        "region": "1.8-3",
-        "size": "背が高く顔や鼻がない設定",
-        "description": ""
+        "region": "",
+        "size": "1.8-3",
+        "description": "背が高く顔や鼻がない設定",
+        "image": "assets/uma_slenderman.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_slenderman-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_slenderman-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_slenderman-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_slenderman-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_slenderman-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_slenderman-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_slenderman.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 201,
+            "y": 0,
+            "w": 93,
+            "h": 249,
+            "offsetX": 212,
+            "offsetY": 40,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C014",
@@ -202,12 +814,58 @@ window.enemyData = [
         "region": "アメリカ",
         "size": "3",
         "description": "大きな目・ヘルメットのような頭",
-        "image": "assets/uma_flatwoods_monster.png"
+        "image": "assets/uma_flatwoods_monster.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_flatwoods_monster-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_flatwoods_monster-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_flatwoods_monster-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_flatwoods_monster-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_flatwoods_monster-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_flatwoods_monster-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_flatwoods_monster.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 551,
+            "y": 0,
+            "w": 140,
+            "h": 210,
+            "offsetX": 186,
+            "offsetY": 58,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C015",
         "name": "ビッグマン",
-        "image": "assets/uma_bigman.png",
         "emoji": "👾",
         "hp": 15,
         "maxHp": 15,
@@ -216,12 +874,59 @@ window.enemyData = [
         "type": "ひと型",
         "region": "アメリカ",
         "size": "1.8",
-        "description": "体は人間・顔はブタ風"
+        "description": "体は人間・顔はブタ風",
+        "image": "assets/uma_bigman.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_bigman-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_bigman-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_bigman-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_bigman-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_bigman-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_bigman-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_bigman.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 980,
+            "y": 0,
+            "w": 114,
+            "h": 203,
+            "offsetX": 214,
+            "offsetY": 61,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C016",
         "name": "マナナンガル",
-        // "image": "assets/uma_manananggal.png", // Removed
         "emoji": "👻",
         "hp": 15,
         "maxHp": 15,
@@ -229,13 +934,12 @@ window.enemyData = [
         "habitat": "まち",
         "type": "怪異/吸血系",
         "region": "フィリピン",
-        "size": "夜にコウモリの羽で飛ぶ設定",
-        "description": ""
+        "size": "",
+        "description": "夜にコウモリの羽で飛ぶ設定"
     },
     {
         "id": "C017",
         "name": "レイク",
-        "image": "assets/uma_rake.png",
         "emoji": "👻",
         "hp": 15,
         "maxHp": 15,
@@ -244,35 +948,177 @@ window.enemyData = [
         "type": "怪異/ひと型",
         "region": "アメリカ",
         "size": "2",
-        "description": "家にしのびこみ泣く人の声など設定"
+        "description": "家にしのびこみ泣く人の声など設定",
+        "image": "assets/uma_rake.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_rake-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_rake-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_rake-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_rake-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_rake-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_rake-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_rake.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 296,
+            "y": 0,
+            "w": 113,
+            "h": 235,
+            "offsetX": 206,
+            "offsetY": 48,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C018",
         "name": "トロール",
-        "image": "assets/uma_troll.png",
         "emoji": "👾",
         "hp": 15,
         "maxHp": 15,
         "exp": 5,
         "habitat": "まち",
         "type": "小型UMA",
-        "region": "0.15-0.5",
-        "size": "空中に現れる設定",
-        "description": ""
+        "region": "",
+        "size": "0.15-0.5",
+        "description": "空中に現れる設定",
+        "image": "assets/uma_troll.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_troll-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_troll-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_troll-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_troll-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_troll-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_troll-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_troll.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 1317,
+            "y": 0,
+            "w": 190,
+            "h": 187,
+            "offsetX": 170,
+            "offsetY": 83,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C019",
         "name": "ポンベロ",
-        "image": "assets/uma_pombero.png",
         "emoji": "👻",
         "hp": 15,
         "maxHp": 15,
         "exp": 5,
         "habitat": "まち",
         "type": "小人/怪異",
-        "region": "0.5",
-        "size": "イタズラや家の中に入る設定",
-        "description": ""
+        "region": "",
+        "size": "0.5",
+        "description": "イタズラや家の中に入る設定",
+        "image": "assets/uma_pombero.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_pombero-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_pombero-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_pombero-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_pombero-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_pombero-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_pombero-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_pombero.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 693,
+            "y": 0,
+            "w": 166,
+            "h": 207,
+            "offsetX": 175,
+            "offsetY": 61,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C020",
@@ -286,12 +1132,58 @@ window.enemyData = [
         "region": "アメリカ",
         "size": "1.8-2",
         "description": "犬の頭・二本足で歩く設定",
-        "image": "assets/uma_dogman.png"
+        "image": "assets/uma_dogman.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_dogman-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_dogman-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_dogman-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_dogman-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_dogman-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_dogman-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_dogman.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 1603,
+            "y": 0,
+            "w": 116,
+            "h": 185,
+            "offsetX": 211,
+            "offsetY": 71,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C021",
         "name": "ボスニア・モンスター",
-        "image": "assets/uma_bosnian_monster.png",
         "emoji": "🐺",
         "hp": 15,
         "maxHp": 15,
@@ -300,12 +1192,59 @@ window.enemyData = [
         "type": "獣",
         "region": "ボスニア・ヘルツェゴビナ",
         "size": "0.5",
-        "description": "イタチ＋カエルの特徴設定"
+        "description": "イタチ＋カエルの特徴設定",
+        "image": "assets/uma_bosnian_monster.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_bosnian_monster-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_bosnian_monster-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_bosnian_monster-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_bosnian_monster-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_bosnian_monster-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_bosnian_monster-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_bosnian_monster.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 0,
+            "y": 0,
+            "w": 199,
+            "h": 340,
+            "offsetX": 165,
+            "offsetY": 1,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "C022",
         "name": "つばさネコ",
-        "image": "assets/uma_winged_cat.png",
         "emoji": "🐱",
         "hp": 15,
         "maxHp": 15,
@@ -314,7 +1253,55 @@ window.enemyData = [
         "type": "動物",
         "region": "世界各地",
         "size": "0.5",
-        "description": "鳥のような翼で空を飛ぶネコ"
+        "description": "鳥のような翼で空を飛ぶネコ",
+        "image": "assets/uma_winged_cat.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_winged_cat-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_winged_cat-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_winged_cat-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_winged_cat-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_winged_cat-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_winged_cat-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_winged_cat.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_C_0.png",
+            "x": 693,
+            "y": 209,
+            "w": 186,
+            "h": 143,
+            "offsetX": 170,
+            "offsetY": 100,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "F001",
@@ -328,12 +1315,58 @@ window.enemyData = [
         "region": "アメリカ/カナダ",
         "size": "1.5-4.5",
         "description": "足あとが大きい設定",
-        "image": "assets/uma_bigfoot.png"
+        "image": "assets/uma_bigfoot.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_bigfoot-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_bigfoot-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_bigfoot-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_bigfoot-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_bigfoot-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_bigfoot-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_bigfoot.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_F_0.png",
+            "x": 722,
+            "y": 0,
+            "w": 121,
+            "h": 193,
+            "offsetX": 200,
+            "offsetY": 65,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "F002",
         "name": "マピンガアリ",
-        "image": "assets/uma_mapinguari.png",
         "emoji": "🦍",
         "hp": 25,
         "maxHp": 25,
@@ -342,7 +1375,55 @@ window.enemyData = [
         "type": "獣人",
         "region": "ブラジル",
         "size": "1-2",
-        "description": "2本足で立って歩く設定"
+        "description": "2本足で立って歩く設定",
+        "image": "assets/uma_mapinguari.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_mapinguari-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_mapinguari-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_mapinguari-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_mapinguari-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_mapinguari-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_mapinguari-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_mapinguari.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_F_0.png",
+            "x": 0,
+            "y": 0,
+            "w": 197,
+            "h": 262,
+            "offsetX": 165,
+            "offsetY": 12,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "F003",
@@ -356,12 +1437,58 @@ window.enemyData = [
         "region": "アメリカ",
         "size": "2",
         "description": "体毛が長い設定",
-        "image": "assets/uma_skunk_ape.png"
+        "image": "assets/uma_skunk_ape.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_skunk_ape-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_skunk_ape-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_skunk_ape-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_skunk_ape-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_skunk_ape-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_skunk_ape-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_skunk_ape.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_F_0.png",
+            "x": 589,
+            "y": 0,
+            "w": 131,
+            "h": 202,
+            "offsetX": 192,
+            "offsetY": 64,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "F004",
         "name": "ブキッ・ティマ・モンキーマン",
-        // "image": "assets/uma_bukit_timah_monkey_man.png", // Removed
         "emoji": "🦍",
         "hp": 25,
         "maxHp": 25,
@@ -384,7 +1511,54 @@ window.enemyData = [
         "region": "インドネシア",
         "size": "0.8-1.5",
         "description": "おくびょうで逃げる設定",
-        "image": "assets/uma_orang_pendek.png"
+        "image": "assets/uma_orang_pendek.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_orang_pendek-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_orang_pendek-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_orang_pendek-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_orang_pendek-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_orang_pendek-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_orang_pendek-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_orang_pendek.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_F_0.png",
+            "x": 845,
+            "y": 0,
+            "w": 114,
+            "h": 180,
+            "offsetX": 207,
+            "offsetY": 78,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "F006",
@@ -398,12 +1572,58 @@ window.enemyData = [
         "region": "アメリカ",
         "size": "1.8-2.3",
         "description": "顔はオオカミ・体はクマ設定",
-        "image": "assets/uma_bearwolf.png"
+        "image": "assets/uma_bearwolf.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_bearwolf-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_bearwolf-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_bearwolf-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_bearwolf-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_bearwolf-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_bearwolf-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_bearwolf.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_F_0.png",
+            "x": 415,
+            "y": 0,
+            "w": 172,
+            "h": 208,
+            "offsetX": 181,
+            "offsetY": 62,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "F007",
         "name": "オラン・ダラム",
-        // "image": "assets/uma_orang_dalam.png", // Removed
         "emoji": "🦍",
         "hp": 25,
         "maxHp": 25,
@@ -417,7 +1637,6 @@ window.enemyData = [
     {
         "id": "F008",
         "name": "モルガン・ビースト",
-        "image": "assets/uma_mogollon_monster.png",
         "emoji": "👻",
         "hp": 25,
         "maxHp": 25,
@@ -425,13 +1644,60 @@ window.enemyData = [
         "habitat": "森",
         "type": "獣/怪異",
         "region": "アメリカ",
-        "size": "白い体・細い手足・光る目設定",
-        "description": ""
+        "size": "",
+        "description": "白い体・細い手足・光る目設定",
+        "image": "assets/uma_mogollon_monster.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_mogollon_monster-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_mogollon_monster-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_mogollon_monster-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_mogollon_monster-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_mogollon_monster-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_mogollon_monster-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_mogollon_monster.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_F_0.png",
+            "x": 199,
+            "y": 0,
+            "w": 214,
+            "h": 237,
+            "offsetX": 166,
+            "offsetY": 46,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "F009",
         "name": "ヒューマノイドがたUMA",
-        // "image": "assets/uma_humanoid_input.png", // Removed
         "emoji": "👾",
         "hp": 25,
         "maxHp": 25,
@@ -454,12 +1720,58 @@ window.enemyData = [
         "region": "中南米",
         "size": "0.9-1.2",
         "description": "家畜をおそう設定",
-        "image": "assets/uma_chupacabra.png"
+        "image": "assets/uma_chupacabra.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_chupacabra-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_chupacabra-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_chupacabra-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_chupacabra-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_chupacabra-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_chupacabra-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_chupacabra.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_G_0.png",
+            "x": 0,
+            "y": 0,
+            "w": 175,
+            "h": 191,
+            "offsetX": 165,
+            "offsetY": 83,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "G002",
         "name": "サーポパード",
-        "image": "assets/uma_serpopard.png",
         "emoji": "🐾",
         "hp": 20,
         "maxHp": 20,
@@ -467,13 +1779,60 @@ window.enemyData = [
         "habitat": "草原/さばく",
         "type": "動物",
         "region": "エジプト/ケニア",
-        "size": "首が長くヒョウ顔設定",
-        "description": ""
+        "size": "",
+        "description": "首が長くヒョウ顔設定",
+        "image": "assets/uma_serpopard.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_serpopard-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_serpopard-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_serpopard-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_serpopard-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_serpopard-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_serpopard-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_serpopard.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_G_0.png",
+            "x": 389,
+            "y": 0,
+            "w": 237,
+            "h": 160,
+            "offsetX": 168,
+            "offsetY": 100,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "G003",
         "name": "スクヴェイダー",
-        "image": "assets/uma_skvader.png",
         "emoji": "🐾",
         "hp": 20,
         "maxHp": 20,
@@ -482,12 +1841,59 @@ window.enemyData = [
         "type": "動物",
         "region": "スウェーデン",
         "size": "0.5-0.8",
-        "description": "ウサギ＋鳥の混ざった設定"
+        "description": "ウサギ＋鳥の混ざった設定",
+        "image": "assets/uma_skvader.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_skvader-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_skvader-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_skvader-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_skvader-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_skvader-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_skvader-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_skvader.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_G_0.png",
+            "x": 628,
+            "y": 0,
+            "w": 288,
+            "h": 157,
+            "offsetX": 141,
+            "offsetY": 97,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "G004",
         "name": "カーバンクル",
-        "image": "assets/uma_carbuncle.png",
         "emoji": "🐾",
         "hp": 20,
         "maxHp": 20,
@@ -496,7 +1902,55 @@ window.enemyData = [
         "type": "動物/精霊",
         "region": "パラグアイ",
         "size": "0.07-0.10",
-        "description": "ひたいの宝石が設定"
+        "description": "ひたいの宝石が設定",
+        "image": "assets/uma_carbuncle.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_carbuncle-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_carbuncle-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_carbuncle-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_carbuncle-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_carbuncle-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_carbuncle-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_carbuncle.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_G_0.png",
+            "x": 177,
+            "y": 0,
+            "w": 210,
+            "h": 176,
+            "offsetX": 192,
+            "offsetY": 87,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "G005",
@@ -549,7 +2003,54 @@ window.enemyData = [
         "region": "ヒマラヤ",
         "size": "1.5-6",
         "description": "雪山の生き物として有名",
-        "image": "assets/uma_yeti.png"
+        "image": "assets/uma_yeti.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_yeti-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_yeti-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_yeti-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_yeti-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_yeti-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_yeti-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_yeti.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_M_0.png",
+            "x": 286,
+            "y": 0,
+            "w": 133,
+            "h": 176,
+            "offsetX": 197,
+            "offsetY": 76,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "M002",
@@ -563,7 +2064,54 @@ window.enemyData = [
         "region": "オーストラリア",
         "size": "1.5-3",
         "description": "目はかわいい設定も",
-        "image": "assets/uma_yowie.png"
+        "image": "assets/uma_yowie.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_yowie-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_yowie-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_yowie-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_yowie-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_yowie-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_yowie-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_yowie.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_M_0.png",
+            "x": 151,
+            "y": 0,
+            "w": 133,
+            "h": 179,
+            "offsetX": 197,
+            "offsetY": 73,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "M003",
@@ -590,7 +2138,54 @@ window.enemyData = [
         "region": "アルプス",
         "size": "0.3-2",
         "description": "伝承の生き物",
-        "image": "assets/uma_tatzelwurm.png"
+        "image": "assets/uma_tatzelwurm.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_tatzelwurm-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_tatzelwurm-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_tatzelwurm-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_tatzelwurm-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_tatzelwurm-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_tatzelwurm-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_tatzelwurm.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_M_0.png",
+            "x": 0,
+            "y": 0,
+            "w": 149,
+            "h": 289,
+            "offsetX": 199,
+            "offsetY": 41,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "M005",
@@ -640,9 +2235,9 @@ window.enemyData = [
         "exp": 9,
         "habitat": "空",
         "type": "怪異/コウモリ",
-        "region": "3-10",
-        "size": "大きな翼で飛ぶ設定",
-        "description": ""
+        "region": "",
+        "size": "3-10",
+        "description": "大きな翼で飛ぶ設定"
     },
     {
         "id": "S003",
@@ -656,7 +2251,54 @@ window.enemyData = [
         "region": "アメリカ",
         "size": "3-10",
         "description": "でんせつの巨大鳥",
-        "image": "assets/uma_thunderbird.png"
+        "image": "assets/uma_thunderbird.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_thunderbird-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_thunderbird-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_thunderbird-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_thunderbird-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_thunderbird-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_thunderbird-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_thunderbird.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_S_0.png",
+            "x": 607,
+            "y": 0,
+            "w": 320,
+            "h": 166,
+            "offsetX": 96,
+            "offsetY": 90,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "S004",
@@ -696,7 +2338,54 @@ window.enemyData = [
         "region": "イギリス",
         "size": "1.5-1.7",
         "description": "フクロウのような見た目",
-        "image": "assets/uma_owlman.png"
+        "image": "assets/uma_owlman.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_owlman-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_owlman-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_owlman-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_owlman-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_owlman-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_owlman-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_owlman.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_S_0.png",
+            "x": 164,
+            "y": 0,
+            "w": 202,
+            "h": 211,
+            "offsetX": 163,
+            "offsetY": 59,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "S007",
@@ -708,8 +2397,8 @@ window.enemyData = [
         "habitat": "空",
         "type": "怪異/コウモリ",
         "region": "インドネシア",
-        "size": "子どもをさらう設定",
-        "description": ""
+        "size": "",
+        "description": "子どもをさらう設定"
     },
     {
         "id": "S008",
@@ -721,8 +2410,8 @@ window.enemyData = [
         "habitat": "空",
         "type": "怪異/翼竜",
         "region": "カメルーン",
-        "size": "大きな翼で山をすべる設定",
-        "description": ""
+        "size": "",
+        "description": "大きな翼で山をすべる設定"
     },
     {
         "id": "S009",
@@ -747,13 +2436,12 @@ window.enemyData = [
         "habitat": "空",
         "type": "怪異",
         "region": "プエルトリコ",
-        "size": "チュパカブラ(9ページ)と同じ説も",
-        "description": ""
+        "size": "",
+        "description": "チュパカブラ(9ページ)と同じ説も"
     },
     {
         "id": "S011",
         "name": "フライング・ヒューマノイド",
-        "image": "assets/uma_flying_humanoid.png",
         "emoji": "👾",
         "hp": 25,
         "maxHp": 25,
@@ -762,7 +2450,55 @@ window.enemyData = [
         "type": "ひと型",
         "region": "複数国",
         "size": "1-3",
-        "description": "空から降りて襲う設定"
+        "description": "空から降りて襲う設定",
+        "image": "assets/uma_flying_humanoid.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_flying_humanoid-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_flying_humanoid-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_flying_humanoid-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_flying_humanoid-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_flying_humanoid-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_flying_humanoid-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_flying_humanoid.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_S_0.png",
+            "x": 368,
+            "y": 0,
+            "w": 237,
+            "h": 173,
+            "offsetX": 144,
+            "offsetY": 88,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "S012",
@@ -774,8 +2510,8 @@ window.enemyData = [
         "habitat": "空",
         "type": "動物",
         "region": "イタリア/米国/メキシコ",
-        "size": "動画にとられたが謎が多い設定",
-        "description": ""
+        "size": "",
+        "description": "動画にとられたが謎が多い設定"
     },
     {
         "id": "S013",
@@ -793,16 +2529,63 @@ window.enemyData = [
     {
         "id": "S014",
         "name": "ライト・ビーイング",
-        "image": "assets/uma_light_being.png",
         "emoji": "👻",
         "hp": 25,
         "maxHp": 25,
         "exp": 9,
         "habitat": "空",
         "type": "怪異/発光",
-        "region": "光る存在の設定",
+        "region": "",
         "size": "",
-        "description": ""
+        "description": "光る存在の設定",
+        "image": "assets/uma_light_being.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_light_being-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_light_being-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_light_being-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_light_being-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_light_being-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_light_being-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_light_being.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_S_0.png",
+            "x": 0,
+            "y": 0,
+            "w": 162,
+            "h": 215,
+            "offsetX": 183,
+            "offsetY": 52,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "S015",
@@ -852,9 +2635,9 @@ window.enemyData = [
         "exp": 9,
         "habitat": "空",
         "type": "怪異/竜",
-        "region": "昔の空想生物として紹介されることも",
+        "region": "",
         "size": "",
-        "description": ""
+        "description": "昔の空想生物として紹介されることも"
     },
     {
         "id": "S019",
@@ -866,8 +2649,8 @@ window.enemyData = [
         "habitat": "空",
         "type": "怪異",
         "region": "メキシコ",
-        "size": "黒い糸のようなものを吐く設定",
-        "description": ""
+        "size": "",
+        "description": "黒い糸のようなものを吐く設定"
     },
     {
         "id": "O001",
@@ -881,7 +2664,54 @@ window.enemyData = [
         "region": "世界各地",
         "size": "20-60",
         "description": "巨大イカ/タコのような設定",
-        "image": "assets/uma_kraken.png"
+        "image": "assets/uma_kraken.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_kraken-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_kraken-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_kraken-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_kraken-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_kraken-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_kraken-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_kraken.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_O_0.png",
+            "x": 131,
+            "y": 0,
+            "w": 179,
+            "h": 162,
+            "offsetX": 168,
+            "offsetY": 80,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "O002",
@@ -899,7 +2729,6 @@ window.enemyData = [
     {
         "id": "O003",
         "name": "ニンゲン",
-        "image": "assets/uma_ningen.png",
         "emoji": "👻",
         "hp": 40,
         "maxHp": 40,
@@ -908,7 +2737,55 @@ window.enemyData = [
         "type": "怪異/人型",
         "region": "北極/南極",
         "size": "10-20",
-        "description": "白い体・手はひれ設定"
+        "description": "白い体・手はひれ設定",
+        "image": "assets/uma_ningen.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_ningen-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_ningen-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_ningen-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_ningen-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_ningen-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_ningen-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_ningen.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_O_0.png",
+            "x": 0,
+            "y": 0,
+            "w": 129,
+            "h": 215,
+            "offsetX": 197,
+            "offsetY": 58,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "O004",
@@ -1000,7 +2877,54 @@ window.enemyData = [
         "region": "イギリス",
         "size": "10-12",
         "description": "ネス湖で有名",
-        "image": "assets/uma_nessie.png"
+        "image": "assets/uma_nessie.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_nessie-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_nessie-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_nessie-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_nessie-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_nessie-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_nessie-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_nessie.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_L_0.png",
+            "x": 0,
+            "y": 0,
+            "w": 171,
+            "h": 170,
+            "offsetX": 184,
+            "offsetY": 80,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "L002",
@@ -1066,7 +2990,54 @@ window.enemyData = [
         "region": "アメリカ",
         "size": "1.2",
         "description": "ぬめぬめ・川に出る設定",
-        "image": "assets/uma_frogman.png"
+        "image": "assets/uma_frogman.png",
+        "srcset": {
+            "avif": [
+                [
+                    "assets/uma_frogman-256w.avif",
+                    256
+                ],
+                [
+                    "assets/uma_frogman-512w.avif",
+                    512
+                ]
+            ],
+            "webp": [
+                [
+                    "assets/uma_frogman-256w.webp",
+                    256
+                ],
+                [
+                    "assets/uma_frogman-512w.webp",
+                    512
+                ]
+            ],
+            "png": [
+                [
+                    "assets/uma_frogman-256w.png",
+                    256
+                ],
+                [
+                    "assets/uma_frogman-512w.png",
+                    512
+                ],
+                [
+                    "assets/uma_frogman.png",
+                    1536
+                ]
+            ]
+        },
+        "atlas": {
+            "image": "assets/atlas_L_0.png",
+            "x": 173,
+            "y": 0,
+            "w": 111,
+            "h": 167,
+            "offsetX": 206,
+            "offsetY": 92,
+            "sourceW": 512,
+            "sourceH": 341
+        }
     },
     {
         "id": "L007",
@@ -1220,9 +3191,9 @@ window.enemyData = [
         "exp": 15,
         "habitat": "危険ランキング",
         "type": "怪異/鳥",
-        "region": "村をおそう設定",
+        "region": "",
         "size": "",
-        "description": ""
+        "description": "村をおそう設定"
     },
     {
         "id": "R003",
@@ -1234,8 +3205,8 @@ window.enemyData = [
         "habitat": "危険ランキング",
         "type": "獣",
         "region": "フランス",
-        "size": "(C010と同じ)",
-        "description": ""
+        "size": "",
+        "description": "(C010と同じ)"
     },
     {
         "id": "R004",
@@ -1246,9 +3217,9 @@ window.enemyData = [
         "exp": 15,
         "habitat": "危険ランキング",
         "type": "怪異/ひと型",
-        "region": "(C001と同じ)",
+        "region": "",
         "size": "",
-        "description": ""
+        "description": "(C001と同じ)"
     },
     {
         "id": "R005",
@@ -0,0 +1 @@
+(window.enemyShards=window.enemyShards||{})["C"]={"n":23,"c":[["C000","C001","C002","C003","C004","C005","C006","C007","C008","C009","C010","C011","C012","C013","C014","C015","C016","C017","C018","C019","C020","C021","C022"],["ヒューマノイド型UMA","モスマン","モンキーマン","グレイ","キシュテム・ドワーフ","リザードマン","ドーバー・デーモン","フォウク・モンスター","ノーム","ナイト・クローラー","ジェヴォーダンのけもの","バウオコジ","ジャドーピープル","スレンダーマン","フラットウッズ・モンスター","ビッグマン","マナナンガル","レイク","トロール","ポンベロ","ドッグマン","ボスニア・モンスター","つばさネコ"],["👽","👻","👾","👽","🧚","🦍","👻","🦍","🧚","👻","🐺","👻","👻","👻","👻","👾","👻","👻","👾","👻","🐺","🐺","🐱"],["assets/uma_humanoid_final_03.jpg","assets/uma_mothman.png","assets/uma_monkey_man.png","assets/uma_gray.png","assets/uma_kistem_dwarf.png","assets/uma_lizardman.png","assets/uma_dover_demon.png","assets/uma_fouke_monster.png","assets/uma_gnome.png","assets/uma_night_crawler.png","assets/uma_beast_of_gevaudan.png","assets/uma_bauokoji.png","assets/uma_shadow_people.png","assets/uma_slenderman.png","assets/uma_flatwoods_monster.png","assets/uma_bigman.png",null,"assets/uma_rake.png","assets/uma_troll.png","assets/uma_pombero.png","assets/uma_dogman.png","assets/uma_bosnian_monster.png","assets/uma_winged_cat.png"],[16,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15],[3,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5],[1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],[null,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15],[null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],[null,1,2,3,4,5,1,5,4,6,7,8,1,1,9,2,10,1,11,12,5,7,13],[null,"","","","","","","","","","フランス","","アメリカ","","アメリカ","アメリカ","フィリピン","アメリカ","","","アメリカ","ボスニア・ヘルツェゴビナ","世界各地"],[null,"","","","0.5","","1.2","2","1","1","1.7","","1.7-2","1.8-3","3","1.8","","2","0.15-0.5","0.5","1.8-2","0.5","0.5"],[null,"目が赤い・毛が生えている設定","100人以上が目撃などの設定","小柄な人間くらい・体は灰色","頭が大きい赤ちゃんのよう","トカゲのような姿","細い手足・長いゆび","長い毛・におい設定","ヨーロッパなどの伝承系","白くて細い・足だけのような見た目","おおかみのような設定","コウモリ/サル/犬のような姿と言われる","人を体調不良にしたり家電をゆらす設定","背が高く顔や鼻がない設定","大きな目・ヘルメットのような頭","体は人間・顔はブタ風","夜にコウモリの羽で飛ぶ設定","家にしのびこみ泣く人の声など設定","空中に現れる設定","イタズラや家の中に入る設定","犬の頭・二本足で歩く設定","イタチ＋カエルの特徴設定","鳥のような翼で空を飛ぶネコ"],[null,{"avif":[["assets/uma_mothman-256w.avif",256],["assets/uma_mothman-512w.avif",512]],"webp":[["assets/uma_mothman-256w.webp",256],["assets/uma_mothman-512w.webp",512]],"png":[["assets/uma_mothman-256w.png",256],["assets/uma_mothman-512w.png",512],["assets/uma_mothman.png",1536]]},{"avif":[["assets/uma_monkey_man-256w.avif",256],["assets/uma_monkey_man-512w.avif",512]],"webp":[["assets/uma_monkey_man-256w.webp",256],["assets/uma_monkey_man-512w.webp",512]],"png":[["assets/uma_monkey_man-256w.png",256],["assets/uma_monkey_man-512w.png",512],["assets/uma_monkey_man.png",1536]]},{"avif":[["assets/uma_gray-256w.avif",256],["assets/uma_gray-512w.avif",512]],"webp":[["assets/uma_gray-256w.webp",256],["assets/uma_gray-512w.webp",512]],"png":[["assets/uma_gray-256w.png",256],["assets/uma_gray-512w.png",512],["assets/uma_gray.png",1536]]},{"avif":[["assets/uma_kistem_dwarf-256w.avif",256],["assets/uma_kistem_dwarf-512w.avif",512]],"webp":[["assets/uma_kistem_dwarf-256w.webp",256],["assets/uma_kistem_dwarf-512w.webp",512]],"png":[["assets/uma_kistem_dwarf-256w.png",256],["assets/uma_kistem_dwarf-512w.png",512],["assets/uma_kistem_dwarf.png",1536]]},{"avif":[["assets/uma_lizardman-256w.avif",256],["assets/uma_lizardman-512w.avif",512]],"webp":[["assets/uma_lizardman-256w.webp",256],["assets/uma_lizardman-512w.webp",512]],"png":[["assets/uma_lizardman-256w.png",256],["assets/uma_lizardman-512w.png",512],["assets/uma_lizardman.png",1536]]},{"avif":[["assets/uma_dover_demon-256w.avif",256],["assets/uma_dover_demon-512w.avif",512]],"webp":[["assets/uma_dover_demon-256w.webp",256],["assets/uma_dover_demon-512w.webp",512]],"png":[["assets/uma_dover_demon-256w.png",256],["assets/uma_dover_demon-512w.png",512],["assets/uma_dover_demon.png",1536]]},{"avif":[["assets/uma_fouke_monster-256w.avif",256],["assets/uma_fouke_monster-512w.avif",512]],"webp":[["assets/uma_fouke_monster-256w.webp",256],["assets/uma_fouke_monster-512w.webp",512]],"png":[["assets/uma_fouke_monster-256w.png",256],["assets/uma_fouke_monster-512w.png",512],["assets/uma_fouke_monster.png",1536]]},{"avif":[["assets/uma_gnome-256w.avif",256],["assets/uma_gnome-512w.avif",512]],"webp":[["assets/uma_gnome-256w.webp",256],["assets/uma_gnome-512w.webp",512]],"png":[["assets/uma_gnome-256w.png",256],["assets/uma_gnome-512w.png",512],["assets/uma_gnome.png",1536]]},{"avif":[["assets/uma_night_crawler-256w.avif",256],["assets/uma_night_crawler-512w.avif",512]],"webp":[["assets/uma_night_crawler-256w.webp",256],["assets/uma_night_crawler-512w.webp",512]],"png":[["assets/uma_night_crawler-256w.png",256],["assets/uma_night_crawler-512w.png",512],["assets/uma_night_crawler.png",1536]]},{"avif":[["assets/uma_beast_of_gevaudan-256w.avif",256],["assets/uma_beast_of_gevaudan-512w.avif",512]],"webp":[["assets/uma_beast_of_gevaudan-256w.webp",256],["assets/uma_beast_of_gevaudan-512w.webp",512]],"png":[["assets/uma_beast_of_gevaudan-256w.png",256],["assets/uma_beast_of_gevaudan-512w.png",512],["assets/uma_beast_of_gevaudan.png",1536]]},{"avif":[["assets/uma_bauokoji-256w.avif",256],["assets/uma_bauokoji-512w.avif",512]],"webp":[["assets/uma_bauokoji-256w.webp",256],["assets/uma_bauokoji-512w.webp",512]],"png":[["assets/uma_bauokoji-256w.png",256],["assets/uma_bauokoji-512w.png",512],["assets/uma_bauokoji.png",1536]]},{"avif":[["assets/uma_shadow_people-256w.avif",256],["assets/uma_shadow_people-512w.avif",512]],"webp":[["assets/uma_shadow_people-256w.webp",256],["assets/uma_shadow_people-512w.webp",512]],"png":[["assets/uma_shadow_people-256w.png",256],["assets/uma_shadow_people-512w.png",512],["assets/uma_shadow_people.png",1536]]},{"avif":[["assets/uma_slenderman-256w.avif",256],["assets/uma_slenderman-512w.avif",512]],"webp":[["assets/uma_slenderman-256w.webp",256],["assets/uma_slenderman-512w.webp",512]],"png":[["assets/uma_slenderman-256w.png",256],["assets/uma_slenderman-512w.png",512],["assets/uma_slenderman.png",1536]]},{"avif":[["assets/uma_flatwoods_monster-256w.avif",256],["assets/uma_flatwoods_monster-512w.avif",512]],"webp":[["assets/uma_flatwoods_monster-256w.webp",256],["assets/uma_flatwoods_monster-512w.webp",512]],"png":[["assets/uma_flatwoods_monster-256w.png",256],["assets/uma_flatwoods_monster-512w.png",512],["assets/uma_flatwoods_monster.png",1536]]},{"avif":[["assets/uma_bigman-256w.avif",256],["assets/uma_bigman-512w.avif",512]],"webp":[["assets/uma_bigman-256w.webp",256],["assets/uma_bigman-512w.webp",512]],"png":[["assets/uma_bigman-256w.png",256],["assets/uma_bigman-512w.png",512],["assets/uma_bigman.png",1536]]},null,{"avif":[["assets/uma_rake-256w.avif",256],["assets/uma_rake-512w.avif",512]],"webp":[["assets/uma_rake-256w.webp",256],["assets/uma_rake-512w.webp",512]],"png":[["assets/uma_rake-256w.png",256],["assets/uma_rake-512w.png",512],["assets/uma_rake.png",1536]]},{"avif":[["assets/uma_troll-256w.avif",256],["assets/uma_troll-512w.avif",512]],"webp":[["assets/uma_troll-256w.webp",256],["assets/uma_troll-512w.webp",512]],"png":[["assets/uma_troll-256w.png",256],["assets/uma_troll-512w.png",512],["assets/uma_troll.png",1536]]},{"avif":[["assets/uma_pombero-256w.avif",256],["assets/uma_pombero-512w.avif",512]],"webp":[["assets/uma_pombero-256w.webp",256],["assets/uma_pombero-512w.webp",512]],"png":[["assets/uma_pombero-256w.png",256],["assets/uma_pombero-512w.png",512],["assets/uma_pombero.png",1536]]},{"avif":[["assets/uma_dogman-256w.avif",256],["assets/uma_dogman-512w.avif",512]],"webp":[["assets/uma_dogman-256w.webp",256],["assets/uma_dogman-512w.webp",512]],"png":[["assets/uma_dogman-256w.png",256],["assets/uma_dogman-512w.png",512],["assets/uma_dogman.png",1536]]},{"avif":[["assets/uma_bosnian_monster-256w.avif",256],["assets/uma_bosnian_monster-512w.avif",512]],"webp":[["assets/uma_bosnian_monster-256w.webp",256],["assets/uma_bosnian_monster-512w.webp",512]],"png":[["assets/uma_bosnian_monster-256w.png",256],["assets/uma_bosnian_monster-512w.png",512],["assets/uma_bosnian_monster.png",1536]]},{"avif":[["assets/uma_winged_cat-256w.avif",256],["assets/uma_winged_cat-512w.avif",512]],"webp":[["assets/uma_winged_cat-256w.webp",256],["assets/uma_winged_cat-512w.webp",512]],"png":[["assets/uma_winged_cat-256w.png",256],["assets/uma_winged_cat-512w.png",512],["assets/uma_winged_cat.png",1536]]}],[null,{"image":"assets/atlas_C_0.png","x":980,"y":205,"w":236,"h":149,"offsetX":138,"offsetY":85,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":411,"y":0,"w":138,"h":211,"offsetX":190,"offsetY":59,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":1509,"y":0,"w":92,"h":186,"offsetX":213,"offsetY":65,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":1185,"y":0,"w":130,"h":192,"offsetX":202,"offsetY":70,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":1870,"y":183,"w":136,"h":172,"offsetX":206,"offsetY":78,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":1721,"y":185,"w":92,"h":172,"offsetX":215,"offsetY":79,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":1721,"y":0,"w":147,"h":183,"offsetX":193,"offsetY":72,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":861,"y":0,"w":117,"h":204,"offsetX":203,"offsetY":59,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":1870,"y":0,"w":93,"h":181,"offsetX":215,"offsetY":72,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":1509,"y":188,"w":170,"h":159,"offsetX":190,"offsetY":90,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":1317,"y":189,"w":166,"h":156,"offsetX":186,"offsetY":92,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":1096,"y":0,"w":87,"h":199,"offsetX":218,"offsetY":66,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":201,"y":0,"w":93,"h":249,"offsetX":212,"offsetY":40,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":551,"y":0,"w":140,"h":210,"offsetX":186,"offsetY":58,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":980,"y":0,"w":114,"h":203,"offsetX":214,"offsetY":61,"sourceW":512,"sourceH":341},null,{"image":"assets/atlas_C_0.png","x":296,"y":0,"w":113,"h":235,"offsetX":206,"offsetY":48,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":1317,"y":0,"w":190,"h":187,"offsetX":170,"offsetY":83,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":693,"y":0,"w":166,"h":207,"offsetX":175,"offsetY":61,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":1603,"y":0,"w":116,"h":185,"offsetX":211,"offsetY":71,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":0,"y":0,"w":199,"h":340,"offsetX":165,"offsetY":1,"sourceW":512,"sourceH":341},{"image":"assets/atlas_C_0.png","x":693,"y":209,"w":186,"h":143,"offsetX":170,"offsetY":100,"sourceW":512,"sourceH":341}]]};
@@ -0,0 +1 @@
+(window.enemyShards=window.enemyShards||{})["F"]={"n":9,"c":[["F001","F002","F003","F004","F005","F006","F007","F008","F009"],["ビッグフット","マピンガアリ","スカンクエイプ","ブキッ・ティマ・モンキーマン","オラン・ペンデク","ベアウルフ","オラン・ダラム","モルガン・ビースト","ヒューマノイドがたUMA"],["🦶","🦍","🦍","🦍","🦍","🐺","🦍","👻","👾"],["assets/uma_bigfoot.png","assets/uma_mapinguari.png","assets/uma_skunk_ape.png",null,"assets/uma_orang_pendek.png","assets/uma_bearwolf.png",null,"assets/uma_mogollon_monster.png",null],[25,25,25,25,25,25,25,25,25],[8,8,8,8,8,8,8,8,8],[null,null,null,null,null,null,null,null,null],[25,25,25,25,25,25,25,25,25],[14,14,14,14,14,14,14,14,14],[5,5,5,5,5,5,5,15,2],["アメリカ/カナダ","ブラジル","アメリカ","シンガポール","インドネシア","アメリカ","マレーシア","アメリカ","ブラジル"],["1.5-4.5","1-2","2","1-2","0.8-1.5","1.8-2.3","1.2-4","","0.5"],["足あとが大きい設定","2本足で立って歩く設定","体毛が長い設定","森の奥にひそむ設定","おくびょうで逃げる設定","顔はオオカミ・体はクマ設定","ジャングルにひそむ設定","白い体・細い手足・光る目設定","頭の大きい人のような姿"],[{"avif":[["assets/uma_bigfoot-256w.avif",256],["assets/uma_bigfoot-512w.avif",512]],"webp":[["assets/uma_bigfoot-256w.webp",256],["assets/uma_bigfoot-512w.webp",512]],"png":[["assets/uma_bigfoot-256w.png",256],["assets/uma_bigfoot-512w.png",512],["assets/uma_bigfoot.png",1536]]},{"avif":[["assets/uma_mapinguari-256w.avif",256],["assets/uma_mapinguari-512w.avif",512]],"webp":[["assets/uma_mapinguari-256w.webp",256],["assets/uma_mapinguari-512w.webp",512]],"png":[["assets/uma_mapinguari-256w.png",256],["assets/uma_mapinguari-512w.png",512],["assets/uma_mapinguari.png",1536]]},{"avif":[["assets/uma_skunk_ape-256w.avif",256],["assets/uma_skunk_ape-512w.avif",512]],"webp":[["assets/uma_skunk_ape-256w.webp",256],["assets/uma_skunk_ape-512w.webp",512]],"png":[["assets/uma_skunk_ape-256w.png",256],["assets/uma_skunk_ape-512w.png",512],["assets/uma_skunk_ape.png",1536]]},null,{"avif":[["assets/uma_orang_pendek-256w.avif",256],["assets/uma_orang_pendek-512w.avif",512]],"webp":[["assets/uma_orang_pendek-256w.webp",256],["assets/uma_orang_pendek-512w.webp",512]],"png":[["assets/uma_orang_pendek-256w.png",256],["assets/uma_orang_pendek-512w.png",512],["assets/uma_orang_pendek.png",1536]]},{"avif":[["assets/uma_bearwolf-256w.avif",256],["assets/uma_bearwolf-512w.avif",512]],"webp":[["assets/uma_bearwolf-256w.webp",256],["assets/uma_bearwolf-512w.webp",512]],"png":[["assets/uma_bearwolf-256w.png",256],["assets/uma_bearwolf-512w.png",512],["assets/uma_bearwolf.png",1536]]},null,{"avif":[["assets/uma_mogollon_monster-256w.avif",256],["assets/uma_mogollon_monster-512w.avif",512]],"webp":[["assets/uma_mogollon_monster-256w.webp",256],["assets/uma_mogollon_monster-512w.webp",512]],"png":[["assets/uma_mogollon_monster-256w.png",256],["assets/uma_mogollon_monster-512w.png",512],["assets/uma_mogollon_monster.png",1536]]},null],[{"image":"assets/atlas_F_0.png","x":722,"y":0,"w":121,"h":193,"offsetX":200,"offsetY":65,"sourceW":512,"sourceH":341},{"image":"assets/atlas_F_0.png","x":0,"y":0,"w":197,"h":262,"offsetX":165,"offsetY":12,"sourceW":512,"sourceH":341},{"image":"assets/atlas_F_0.png","x":589,"y":0,"w":131,"h":202,"offsetX":192,"offsetY":64,"sourceW":512,"sourceH":341},null,{"image":"assets/atlas_F_0.png","x":845,"y":0,"w":114,"h":180,"offsetX":207,"offsetY":78,"sourceW":512,"sourceH":341},{"image":"assets/atlas_F_0.png","x":415,"y":0,"w":172,"h":208,"offsetX":181,"offsetY":62,"sourceW":512,"sourceH":341},null,{"image":"assets/atlas_F_0.png","x":199,"y":0,"w":214,"h":237,"offsetX":166,"offsetY":46,"sourceW":512,"sourceH":341},null]]};
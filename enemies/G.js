@@ -0,0 +1 @@
+(window.enemyShards=window.enemyShards||{})["G"]={"n":7,"c":[["G001","G002","G003","G004","G005","G006","G007"],["チュパカブラ","サーポパード","スクヴェイダー","カーバンクル","チバ・フーフィー","モシナ","太さい"],["🦍","🐾","🐾","🐾","👻","👻","👻"],["assets/uma_chupacabra.png","assets/uma_serpopard.png","assets/uma_skvader.png","assets/uma_carbuncle.png",null,null,null],[20,20,20,20,20,20,20],[7,7,7,7,7,7,7],[null,null,null,null,null,null,null],[20,20,20,20,20,20,20],[16,16,16,16,16,16,16],[17,13,13,18,19,1,6],["中南米","エジプト/ケニア","スウェーデン","パラグアイ","コンゴ周辺","台湾","中国"],["0.9-1.2","","0.5-0.8","0.07-0.10","1.5","1-2","0.3"],["家畜をおそう設定","首が長くヒョウ顔設定","ウサギ＋鳥の混ざった設定","ひたいの宝石が設定","タランチュラの巨大版設定","人をさらう設定","目がある・せいれい設定"],[{"avif":[["assets/uma_chupacabra-256w.avif",256],["assets/uma_chupacabra-512w.avif",512]],"webp":[["assets/uma_chupacabra-256w.webp",256],["assets/uma_chupacabra-512w.webp",512]],"png":[["assets/uma_chupacabra-256w.png",256],["assets/uma_chupacabra-512w.png",512],["assets/uma_chupacabra.png",1536]]},{"avif":[["assets/uma_serpopard-256w.avif",256],["assets/uma_serpopard-512w.avif",512]],"webp":[["assets/uma_serpopard-256w.webp",256],["assets/uma_serpopard-512w.webp",512]],"png":[["assets/uma_serpopard-256w.png",256],["assets/uma_serpopard-512w.png",512],["assets/uma_serpopard.png",1536]]},{"avif":[["assets/uma_skvader-256w.avif",256],["assets/uma_skvader-512w.avif",512]],"webp":[["assets/uma_skvader-256w.webp",256],["assets/uma_skvader-512w.webp",512]],"png":[["assets/uma_skvader-256w.png",256],["assets/uma_skvader-512w.png",512],["assets/uma_skvader.png",1536]]},{"avif":[["assets/uma_carbuncle-256w.avif",256],["assets/uma_carbuncle-512w.avif",512]],"webp":[["assets/uma_carbuncle-256w.webp",256],["assets/uma_carbuncle-512w.webp",512]],"png":[["assets/uma_carbuncle-256w.png",256],["assets/uma_carbuncle-512w.png",512],["assets/uma_carbuncle.png",1536]]},null,null,null],[{"image":"assets/atlas_G_0.png","x":0,"y":0,"w":175,"h":191,"offsetX":165,"offsetY":83,"sourceW":512,"sourceH":341},{"image":"assets/atlas_G_0.png","x":389,"y":0,"w":237,"h":160,"offsetX":168,"offsetY":100,"sourceW":512,"sourceH":341},{"image":"assets/atlas_G_0.png","x":628,"y":0,"w":288,"h":157,"offsetX":141,"offsetY":97,"sourceW":512,"sourceH":341},{"image":"assets/atlas_G_0.png","x":177,"y":0,"w":210,"h":176,"offsetX":192,"offsetY":87,"sourceW":512,"sourceH":341},null,null,null]]};
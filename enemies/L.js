@@ -0,0 +1 @@
+(window.enemyShards=window.enemyShards||{})["L"]={"n":16,"c":[["L001","L002","L003","L004","L005","L006","L007","L008","L009","L010","L011","L012","L013","L014","L015","L016"],["ネッシー","オゴポゴ","マニポゴ","ゾデンデキ","チェナリバー・アイスモンスター","フロッグマン","ドアーチュ","ナーカ","ラウ","バビア・ビースト","セルマ","モケーレ・ムベンベ","メンフレ","チャンプ","ナウエリート","スクリムスル"],["🦕","🦕","🦕","🦕","👻","🦍","👻","👻","👻","🦍","🦕","🦕","🦕","🦕","🦕","🦕"],["assets/uma_nessie.png",null,null,null,null,"assets/uma_frogman.png",null,null,null,null,null,null,null,null,null,null],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11],[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31],[32,32,32,32,6,5,6,28,33,5,32,32,32,32,32,32],["イギリス","カナダ","カナダ","コンゴ","アメリカ","アメリカ","アイルランド","東南アジア","アフリカ","ブラジル","ノルウェー","コンゴ","アメリカ","アメリカ","アイルランド","アイスランド"],["10-12","5-10","5-12","5-8","5","1.2","2-3","10-70","12-30","1.5-2","6-10","8-15","6-15","4.5-18","5-20","14"],["ネス湖で有名","顔が馬やヤギに似る設定","細長い体を上下にくねらせる設定","こうらと丸み・長さ4-5m設定","こおりがついたままの見た目設定","ぬめぬめ・川に出る設定","水かき・泳ぎが得意設定","大きなヘビ・角がある設定","太いどう体の設定","角がある・武器を持つ設定","鳴き声のような音設定","恐竜のような姿設定","湖にすむ恐れられる設定","首が長い・写真の真偽議論","長い首・中にはこぶ設定","長い尾でうずまき設定"],[{"avif":[["assets/uma_nessie-256w.avif",256],["assets/uma_nessie-512w.avif",512]],"webp":[["assets/uma_nessie-256w.webp",256],["assets/uma_nessie-512w.webp",512]],"png":[["assets/uma_nessie-256w.png",256],["assets/uma_nessie-512w.png",512],["assets/uma_nessie.png",1536]]},null,null,null,null,{"avif":[["assets/uma_frogman-256w.avif",256],["assets/uma_frogman-512w.avif",512]],"webp":[["assets/uma_frogman-256w.webp",256],["assets/uma_frogman-512w.webp",512]],"png":[["assets/uma_frogman-256w.png",256],["assets/uma_frogman-512w.png",512],["assets/uma_frogman.png",1536]]},null,null,null,null,null,null,null,null,null,null],[{"image":"assets/atlas_L_0.png","x":0,"y":0,"w":171,"h":170,"offsetX":184,"offsetY":80,"sourceW":512,"sourceH":341},null,null,null,null,{"image":"assets/atlas_L_0.png","x":173,"y":0,"w":111,"h":167,"offsetX":206,"offsetY":92,"sourceW":512,"sourceH":341},null,null,null,null,null,null,null,null,null,null]]};
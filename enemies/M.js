@@ -0,0 +1 @@
+(window.enemyShards=window.enemyShards||{})["M"]={"n":6,"c":[["M001","M002","M003","M004","M005","M006"],["イエティ","ヨーウィ","モノス","ダッツェルヴルム","ゴウロウ","ジェイコブス・クリーチャー"],["🦍","🦍","🦍","👻","👻","👻"],["assets/uma_yeti.png","assets/uma_yowie.png",null,"assets/uma_tatzelwurm.png",null,null],[30,30,30,30,30,30],[10,10,10,10,10,10],[null,null,null,null,null,null],[30,30,30,30,30,30],[20,20,20,20,20,20],[5,5,5,21,21,21],["ヒマラヤ","オーストラリア","ベネズエラ","アルプス","アメリカ","アメリカ"],["1.5-6","1.5-3","1.5-1.6","0.3-2","6","1.5"],["雪山の生き物として有名","目はかわいい設定も","谷川で写真が公開された設定","伝承の生き物","山の岩場にひそむ設定","ビッグフット(8ページ)の子ども説など"],[{"avif":[["assets/uma_yeti-256w.avif",256],["assets/uma_yeti-512w.avif",512]],"webp":[["assets/uma_yeti-256w.webp",256],["assets/uma_yeti-512w.webp",512]],"png":[["assets/uma_yeti-256w.png",256],["assets/uma_yeti-512w.png",512],["assets/uma_yeti.png",1536]]},{"avif":[["assets/uma_yowie-256w.avif",256],["assets/uma_yowie-512w.avif",512]],"webp":[["assets/uma_yowie-256w.webp",256],["assets/uma_yowie-512w.webp",512]],"png":[["assets/uma_yowie-256w.png",256],["assets/uma_yowie-512w.png",512],["assets/uma_yowie.png",1536]]},null,{"avif":[["assets/uma_tatzelwurm-256w.avif",256],["assets/uma_tatzelwurm-512w.avif",512]],"webp":[["assets/uma_tatzelwurm-256w.webp",256],["assets/uma_tatzelwurm-512w.webp",512]],"png":[["assets/uma_tatzelwurm-256w.png",256],["assets/uma_tatzelwurm-512w.png",512],["assets/uma_tatzelwurm.png",1536]]},null,null],[{"image":"assets/atlas_M_0.png","x":286,"y":0,"w":133,"h":176,"offsetX":197,"offsetY":76,"sourceW":512,"sourceH":341},{"image":"assets/atlas_M_0.png","x":151,"y":0,"w":133,"h":179,"offsetX":197,"offsetY":73,"sourceW":512,"sourceH":341},null,{"image":"assets/atlas_M_0.png","x":0,"y":0,"w":149,"h":289,"offsetX":199,"offsetY":41,"sourceW":512,"sourceH":341},null,null]]};
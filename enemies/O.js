@@ -0,0 +1 @@
+(window.enemyShards=window.enemyShards||{})["O"]={"n":9,"c":[["O001","O002","O003","O004","O005","O006","O007","O008","O009"],["クラーケン","シーサーペント","ニンゲン","グロブスター","モーガウル","キャディ","ブランッキー","ニューネッシー","ニンポー"],["🦑","🐍","👻","👻","🦑","🦑","🦑","🦑","👻"],["assets/uma_kraken.png",null,"assets/uma_ningen.png",null,null,null,null,null,null],[40,40,40,40,40,40,40,40,40],[12,12,12,12,12,12,12,12,12],[null,null,null,null,null,null,null,null,null],[40,40,40,40,40,40,40,40,40],[34,34,34,34,34,34,34,34,34],[35,35,36,6,35,35,35,35,37],["世界各地","世界各地","北極/南極","世界各地","イギリス","カナダ","黒海","ニュージーランド","中国"],["20-60","15-60","10-20","6-24","4-18","9-15","10-40","10","12"],["巨大イカ/タコのような設定","大むかしから目撃が多い設定","白い体・手はひれ設定","毛のようなもの・正体不明設定","首が長い海の怪物設定","首にたてがみ設定","昔からの目撃・記録設定","1977年に死体が見つかった設定","頭に角・毛がある設定"],[{"avif":[["assets/uma_kraken-256w.avif",256],["assets/uma_kraken-512w.avif",512]],"webp":[["assets/uma_kraken-256w.webp",256],["assets/uma_kraken-512w.webp",512]],"png":[["assets/uma_kraken-256w.png",256],["assets/uma_kraken-512w.png",512],["assets/uma_kraken.png",1536]]},null,{"avif":[["assets/uma_ningen-256w.avif",256],["assets/uma_ningen-512w.avif",512]],"webp":[["assets/uma_ningen-256w.webp",256],["assets/uma_ningen-512w.webp",512]],"png":[["assets/uma_ningen-256w.png",256],["assets/uma_ningen-512w.png",512],["assets/uma_ningen.png",1536]]},null,null,null,null,null,null],[{"image":"assets/atlas_O_0.png","x":131,"y":0,"w":179,"h":162,"offsetX":168,"offsetY":80,"sourceW":512,"sourceH":341},null,{"image":"assets/atlas_O_0.png","x":0,"y":0,"w":129,"h":215,"offsetX":197,"offsetY":58,"sourceW":512,"sourceH":341},null,null,null,null,null,null]]};
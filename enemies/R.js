@@ -0,0 +1 @@
+(window.enemyShards=window.enemyShards||{})["R"]={"n":5,"c":[["R001","R002","R003","R004","R005"],["モンゴリアン・デスワーム","ピアサバード","ジェヴォーダンのけもの","モスマン","ネスキ"],["🐛","🦅","🐺","👻","🦕"],[null,null,null,null,null],[50,50,50,50,50],[15,15,15,15,15],[null,null,null,null,null],[50,50,50,50,50],[38,38,38,38,38],[19,39,7,1,32],["モンゴル","","フランス","","ロシア"],["0.5-1.2","","","","6-20"],["電気を出す設定","村をおそう設定","(C010と同じ)","(C001と同じ)","湖にひきずりこむ設定"],[null,null,null,null,null],[null,null,null,null,null]]};
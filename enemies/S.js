@@ -0,0 +1 @@
+(window.enemyShards=window.enemyShards||{})["S"]={"n":19,"c":[["S001","S002","S003","S004","S005","S006","S007","S008","S009","S010","S011","S012","S013","S014","S015","S016","S017","S018","S019"],["ビッグバード","アフール","サンダーバード","コンガマトー","ジーナフォイロ","オウルマン","オラン・バッチ","オリチアウ","ローペン","ガーゴイル","フライング・ヒューマノイド","フライング・ホース","フライング・ワーム","ライト・ビーイング","スカイフィッシュ","フライング・サーペント","オヨ・フリオ","ドラゴン","フライング・ストリングス"],["🦅","👻","🦅","👻","👻","👻","👻","👻","👻","👻","👾","🐾","🐛","👻","🐟","🐍","👻","🐉","👻"],[null,null,"assets/uma_thunderbird.png",null,null,"assets/uma_owlman.png",null,null,null,null,"assets/uma_flying_humanoid.png",null,null,"assets/uma_light_being.png",null,null,null,null,null],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9],[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22],[23,24,23,25,24,26,24,25,25,6,2,13,19,27,6,28,29,30,6],["複数国","","アメリカ","アフリカ","セネガル","イギリス","インドネシア","カメルーン","パプアニューギニア","プエルトリコ","複数国","イタリア/米国/メキシコ","世界各地","","世界各地","メキシコ/米国","メキシコ","","メキシコ"],["3-10","3-10","3-10","1.5-2","1.2","1.5-1.7","","","1-3","","1-3","","1-10","","0.3-30","5","25-30","",""],["つめやくちばしでさらう設定","大きな翼で飛ぶ設定","でんせつの巨大鳥","翼竜のような設定","家くらいまで体をかえる設定","フクロウのような見た目","子どもをさらう設定","大きな翼で山をすべる設定","人の死体を食べる設定","チュパカブラ(9ページ)と同じ説も","空から降りて襲う設定","動画にとられたが謎が多い設定","空を飛ぶ虫のような設定","光る存在の設定","日本の映像でも話題になった設定","体をくねらせ空をただよう設定","巨大イモムシの姿で空を飛ぶ設定","昔の空想生物として紹介されることも","黒い糸のようなものを吐く設定"],[null,null,{"avif":[["assets/uma_thunderbird-256w.avif",256],["assets/uma_thunderbird-512w.avif",512]],"webp":[["assets/uma_thunderbird-256w.webp",256],["assets/uma_thunderbird-512w.webp",512]],"png":[["assets/uma_thunderbird-256w.png",256],["assets/uma_thunderbird-512w.png",512],["assets/uma_thunderbird.png",1536]]},null,null,{"avif":[["assets/uma_owlman-256w.avif",256],["assets/uma_owlman-512w.avif",512]],"webp":[["assets/uma_owlman-256w.webp",256],["assets/uma_owlman-512w.webp",512]],"png":[["assets/uma_owlman-256w.png",256],["assets/uma_owlman-512w.png",512],["assets/uma_owlman.png",1536]]},null,null,null,null,{"avif":[["assets/uma_flying_humanoid-256w.avif",256],["assets/uma_flying_humanoid-512w.avif",512]],"webp":[["assets/uma_flying_humanoid-256w.webp",256],["assets/uma_flying_humanoid-512w.webp",512]],"png":[["assets/uma_flying_humanoid-256w.png",256],["assets/uma_flying_humanoid-512w.png",512],["assets/uma_flying_humanoid.png",1536]]},null,null,{"avif":[["assets/uma_light_being-256w.avif",256],["assets/uma_light_being-512w.avif",512]],"webp":[["assets/uma_light_being-256w.webp",256],["assets/uma_light_being-512w.webp",512]],"png":[["assets/uma_light_being-256w.png",256],["assets/uma_light_being-512w.png",512],["assets/uma_light_being.png",1536]]},null,null,null,null,null],[null,null,{"image":"assets/atlas_S_0.png","x":607,"y":0,"w":320,"h":166,"offsetX":96,"offsetY":90,"sourceW":512,"sourceH":341},null,null,{"image":"assets/atlas_S_0.png","x":164,"y":0,"w":202,"h":211,"offsetX":163,"offsetY":59,"sourceW":512,"sourceH":341},null,null,null,null,{"image":"assets/atlas_S_0.png","x":368,"y":0,"w":237,"h":173,"offsetX":144,"offsetY":88,"sourceW":512,"sourceH":341},null,null,{"image":"assets/atlas_S_0.png","x":0,"y":0,"w":162,"h":215,"offsetX":183,"offsetY":52,"sourceW":512,"sourceH":341},null,null,null,null,null]]};
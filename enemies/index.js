@@ -0,0 +1,2 @@
+// enemy_compiler build a5ce2d7b466119e6b1ffb451c082efe7
+window.enemyIndex={"keys":["id","name","emoji","image","hp","exp","level","maxHp","habitat","type","region","size","description","srcset","atlas"],"interned":["habitat","type"],"strings":["まち","怪異/ひと型","ひと型","宇宙人","小人","獣人","怪異","獣","怪異/こうもり系","宇宙/怪異","怪異/吸血系","小型UMA","小人/怪異","動物","森","獣/怪異","草原/さばく","怪異/獣人","動物/精霊","怪異/虫","山","怪異/獣","空","鳥","怪異/コウモリ","怪異/翼竜","怪異/鳥人","怪異/発光","怪異/ヘビ","怪異/巨大いもむし","怪異/竜","湖/川","湖の怪物","動物/怪異","海","海の怪物","怪異/人型","怪異/水棲","危険ランキング","怪異/鳥"],"shards":[{"prefix":"C","habitat":"まち","file":"enemies/C.js?v=42900ddc","count":23,"imaged":22},{"prefix":"F","habitat":"森","file":"enemies/F.js?v=0960ff6f","count":9,"imaged":6},{"prefix":"G","habitat":"草原/さばく","file":"enemies/G.js?v=e4a7efd9","count":7,"imaged":4},{"prefix":"M","habitat":"山","file":"enemies/M.js?v=982f83da","count":6,"imaged":3},{"prefix":"S","habitat":"空","file":"enemies/S.js?v=050ad3d8","count":19,"imaged":4},{"prefix":"L","habitat":"湖/川","file":"enemies/L.js?v=aa5b2c66","count":16,"imaged":2},{"prefix":"O","habitat":"海","file":"enemies/O.js?v=80811a58","count":9,"imaged":2},{"prefix":"R","habitat":"危険ランキング","file":"enemies/R.js?v=85f4578b","count":5,"imaged":0}]};
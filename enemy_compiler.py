@@ -0,0 +1,430 @@
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+
+# Compiles raw_enemies.txt (tab-separated bestiary) into enemies.js.
+# Replaces the duplicated logic of parse_enemies.py / generate_enemies_js.py:
+# rows are streamed one at a time, validated, merged with the overrides below
+# and written straight to the output, which is only rewritten when the input
+# or the rule tables change.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RAW_FILE = os.path.join(BASE_DIR, "raw_enemies.txt")
+OUTPUT_JS = os.path.join(BASE_DIR, "enemies.js")
+ASSETS_DIR = os.path.join(BASE_DIR, "assets")
+SHARD_DIR = os.path.join(BASE_DIR, "enemies") # --sharded output (index.js + one file per prefix)
+PAGE_FILE = "index.html" # Next to the shard dir; loads index.js with the same ?v= stamp as the shards
+
+COMPILER_VERSION = 1 # Bump when the output format changes
+STAMP_PREFIX = "// enemy_compiler build "
+
+# Row schema: ID, Name, Habitat, Type, Region, Size, Description
+COLUMNS = ["id", "name", "habitat", "type", "region", "size", "description"]
+ID_RE = re.compile(r"^[A-Z]\d{3,}$") # C001 ... (more digits once a habitat outgrows 999)
+
+# HP/EXP by ID prefix (C=まち, F=森, G=草原/さばく, M=山, S=空, O=海, L=湖/川, R=危険ランキング)
+STATS_BY_PREFIX = {
+    "C": (15, 5),
+    "F": (25, 8),
+    "G": (20, 7),
+    "M": (30, 10),
+    "S": (25, 9),
+    "O": (40, 12),
+    "L": (35, 11),
+    "R": (50, 15),
+}
+
+# Shard (and habitat) per ID prefix for --sharded, in the order the game reaches them
+HABITAT_BY_PREFIX = {
+    "C": "まち",
+    "F": "森",
+    "G": "草原/さばく",
+    "M": "山",
+    "S": "空",
+    "L": "湖/川",
+    "O": "海",
+    "R": "危険ランキング",
+}
+INTERNED_KEYS = ["habitat", "type"] # Stored once in the index, referenced by number
+
+# Emoji by keyword in the name, checked in order, then by keyword in the type
+NAME_EMOJI_RULES = [
+    (("ネコ", "キャット"), "🐱"),
+    (("イヌ", "ドッグ", "狼", "ウルフ"), "🐺"),
+    (("バット", "コウモリ"), "🦇"),
+    (("バード", "鳥"), "🦅"),
+    (("フィッシュ", "魚"), "🐟"),
+    (("ワーム",), "🐛"),
+    (("ドラゴン",), "🐉"),
+    (("スネーク", "サーペント"), "🐍"),
+    (("フット",), "🦶"),
+]
+TYPE_EMOJI_MAP = {
+    "獣人": "🦍", "怪異": "👻", "宇宙人": "👽", "小人": "🧚",
+    "動物": "🐾", "鳥": "🦅", "竜": "🐉", "翼竜": "🦖",
+    "虫": "🐛", "海の怪物": "🦑", "湖の怪物": "🦕",
+    "魚": "🐟", "ヘビ": "🐍", "コウモリ": "🦇", "吸血": "🧛",
+    "ロボ": "🤖", "幽霊": "👻", "精霊": "✨", "獣": "🐺"
+}
+DEFAULT_EMOJI = "👾"
+
+# Entries that are not in raw_enemies.txt and come first in the output
+FIXED_ENTRIES = [
+    {
+        "id": "C000", "name": "ヒューマノイド型UMA", "emoji": "👽",
+        "image": "assets/uma_humanoid_final_03.jpg",
+        "hp": 16, "exp": 3, "level": 1
+    },
+]
+
+# Hand-curated fields merged over the generated entry (mostly sprite images)
+OVERRIDES = {
+    "C001": {"image": "assets/uma_mothman.png"},
+    "C002": {"image": "assets/uma_monkey_man.png"},
+    "C003": {"image": "assets/uma_gray.png"},
+    "C004": {"image": "assets/uma_kistem_dwarf.png"},
+    "C005": {"image": "assets/uma_lizardman.png"},
+    "C006": {"image": "assets/uma_dover_demon.png"},
+    "C007": {"image": "assets/uma_fouke_monster.png"},
+    "C008": {"image": "assets/uma_gnome.png"},
+    "C009": {"image": "assets/uma_night_crawler.png"},
+    "C010": {"image": "assets/uma_beast_of_gevaudan.png"},
+    "C011": {"image": "assets/uma_bauokoji.png"},
+    "C012": {"image": "assets/uma_shadow_people.png"},
+    "C013": {"image": "assets/uma_slenderman.png"},
+    "C014": {"image": "assets/uma_flatwoods_monster.png"},
+    "C015": {"image": "assets/uma_bigman.png"},
+    # "C016": {"image": "assets/uma_manananggal.png"}, # Removed
+    "C017": {"image": "assets/uma_rake.png"},
+    "C018": {"image": "assets/uma_troll.png"},
+    "C019": {"image": "assets/uma_pombero.png"},
+    "C020": {"image": "assets/uma_dogman.png"},
+    "C021": {"image": "assets/uma_bosnian_monster.png"},
+    "C022": {"image": "assets/uma_winged_cat.png"},
+    "F001": {"image": "assets/uma_bigfoot.png"},
+    "F002": {"image": "assets/uma_mapinguari.png"},
+    "F003": {"image": "assets/uma_skunk_ape.png"},
+    # "F004": {"image": "assets/uma_bukit_timah_monkey_man.png"}, # Removed
+    "F005": {"image": "assets/uma_orang_pendek.png"},
+    "F006": {"image": "assets/uma_bearwolf.png"},
+    # "F007": {"image": "assets/uma_orang_dalam.png"}, # Removed
+    "F008": {"image": "assets/uma_mogollon_monster.png"},
+    # "F009": {"image": "assets/uma_humanoid_input.png"}, # Removed
+    "G001": {"image": "assets/uma_chupacabra.png"},
+    "G002": {"image": "assets/uma_serpopard.png"},
+    "G003": {"image": "assets/uma_skvader.png"},
+    "G004": {"image": "assets/uma_carbuncle.png"},
+    "M001": {"image": "assets/uma_yeti.png"},
+    "M002": {"image": "assets/uma_yowie.png"},
+    "M004": {"image": "assets/uma_tatzelwurm.png"},
+    "S003": {"image": "assets/uma_thunderbird.png"},
+    "S006": {"image": "assets/uma_owlman.png"},
+    "S011": {"image": "assets/uma_flying_humanoid.png"},
+    "S014": {"image": "assets/uma_light_being.png"},
+    "O001": {"image": "assets/uma_kraken.png"},
+    "O003": {"image": "assets/uma_ningen.png"},
+    "L001": {"image": "assets/uma_nessie.png"},
+    "L006": {"image": "assets/uma_frogman.png"},
+}
+
+class RowError(ValueError):
+    def __init__(self, line_no, message):
+        super().__init__(f"line {line_no}: {message}")
+        self.line_no = line_no
+
+def get_emoji(name, type_str):
+    for keywords, emoji in NAME_EMOJI_RULES:
+        if any(k in name for k in keywords):
+            return emoji
+    for k, v in TYPE_EMOJI_MAP.items():
+        if k in type_str:
+            return v
+    return DEFAULT_EMOJI
+
+def rules_hash():
+    # Everything besides the input file that affects the output
+    rules = {
+        "version": COMPILER_VERSION,
+        "columns": COLUMNS,
+        "stats": STATS_BY_PREFIX,
+        "name_emoji": NAME_EMOJI_RULES,
+        "type_emoji": TYPE_EMOJI_MAP,
+        "default_emoji": DEFAULT_EMOJI,
+        "fixed": FIXED_ENTRIES,
+        "overrides": OVERRIDES,
+    }
+    blob = json.dumps(rules, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+def file_hash(path):
+    h = hashlib.sha256()
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+def build_hash(raw_path, assets_dir):
+    # Input + rules + sprite atlas and variant report (both are embedded in the output)
+    from optimize_sprites import REPORT_FILE
+
+    h = hashlib.sha256()
+    h.update(file_hash(raw_path).encode())
+    h.update(rules_hash().encode())
+    h.update(file_hash(os.path.join(assets_dir, "atlas.json")).encode())
+    h.update(file_hash(os.path.join(assets_dir, REPORT_FILE)).encode())
+    return h.hexdigest()[:32]
+
+def parse_row(line, line_no):
+    # One raw line -> column dict, None for blank lines; raises RowError
+    line = line.rstrip("\r\n")
+    if not line.strip():
+        return None
+    parts = [p.strip() for p in line.split("\t")]
+    if len(parts) > len(COLUMNS):
+        if any(parts[len(COLUMNS):]):
+            raise RowError(line_no, f"expected at most {len(COLUMNS)} columns, got {len(parts)}")
+        parts = parts[:len(COLUMNS)]
+    parts += [""] * (len(COLUMNS) - len(parts))
+    row = dict(zip(COLUMNS, parts))
+
+    if not ID_RE.match(row["id"]):
+        raise RowError(line_no, f"invalid ID {row['id']!r}")
+    if row["id"][0] not in STATS_BY_PREFIX:
+        raise RowError(line_no, f"unknown ID prefix in {row['id']!r}")
+    if not row["name"]:
+        raise RowError(line_no, f"{row['id']} has no name")
+    return row
+
+def iter_rows(raw_path, errors=None):
+    # Yields (line_no, row) for valid rows; invalid ones are appended to
+    # errors (or raised if errors is None)
+    with open(raw_path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            try:
+                row = parse_row(line, line_no)
+            except RowError as e:
+                if errors is None:
+                    raise
+                errors.append(e)
+                continue
+            if row is not None:
+                yield line_no, row
+
+def make_entry(row):
+    hp, exp = STATS_BY_PREFIX[row["id"][0]]
+    entry = {
+        "id": row["id"], "name": row["name"], "emoji": get_emoji(row["name"], row["type"]),
+        "hp": hp, "maxHp": hp, "exp": exp,
+        "habitat": row["habitat"], "type": row["type"],
+        "region": row["region"], "size": row["size"],
+        "description": row["description"]
+    }
+    entry.update(OVERRIDES.get(row["id"], {}))
+    return entry
+
+def sprite_groups(raw_path=RAW_FILE):
+    # {ID prefix: sprite paths} for every enemy in the compiled table, in shard
+    # order; the atlas and the downscaled variants only cover these
+    groups = {prefix: set() for prefix in HABITAT_BY_PREFIX}
+    entries = list(FIXED_ENTRIES) + [make_entry(row) for _, row in iter_rows(raw_path, errors=[])]
+    for entry in entries:
+        if entry.get("image"):
+            groups[entry["id"][0]].add(entry["image"])
+    return {prefix: sorted(images) for prefix, images in groups.items() if images}
+
+def sprite_images(raw_path=RAW_FILE):
+    return sorted({image for images in sprite_groups(raw_path).values() for image in images})
+
+def sprite_srcset(image_path):
+    # {format: [[url, width], ...]} for the downscaled variants of an enemy's
+    # sprite that exist (optimize_sprites.py), smallest first; the original is
+    # the largest png candidate. None if there are no variants.
+    from PIL import Image
+    from optimize_sprites import FORMATS, TARGET_WIDTHS, variant_path
+
+    if not image_path:
+        return None
+    full_path = os.path.join(BASE_DIR, image_path)
+    srcset = {}
+    for ext in reversed(FORMATS): # Preferred format first (avif, webp, png)
+        urls = [[variant_path(image_path, w, ext), w] for w in TARGET_WIDTHS
+                if os.path.exists(variant_path(full_path, w, ext))]
+        if urls:
+            srcset[ext] = urls
+    if not srcset:
+        return None
+    if "png" in srcset and image_path.endswith(".png"):
+        with Image.open(full_path) as img: # Header only
+            srcset["png"].append([image_path, img.size[0]])
+    return srcset
+
+def iter_entries(raw_path=RAW_FILE, errors=None, atlas=None):
+    # Fixed entries, then one entry per valid row, with duplicate IDs rejected.
+    # Only the set of seen IDs is kept in memory.
+    from build_atlas import atlas_entry
+
+    seen = set()
+    for entry in FIXED_ENTRIES:
+        seen.add(entry["id"])
+        yield dict(entry)
+
+    for line_no, row in iter_rows(raw_path, errors):
+        if row["id"] in seen:
+            e = RowError(line_no, f"duplicate ID {row['id']}")
+            if errors is None:
+                raise e
+            errors.append(e)
+            continue
+        seen.add(row["id"])
+        entry = make_entry(row)
+        srcset = sprite_srcset(entry.get("image"))
+        if srcset:
+            entry["srcset"] = srcset
+        atlas_info = atlas_entry(atlas, entry.get("image"))
+        if atlas_info:
+            entry["atlas"] = atlas_info
+        yield entry
+
+def read_stamp(output_path):
+    try:
+        with open(output_path, "r", encoding="utf-8") as f:
+            first = f.readline().strip()
+    except OSError:
+        return None
+    return first[len(STAMP_PREFIX):] if first.startswith(STAMP_PREFIX) else None
+
+def write_js(entries, output_path, stamp):
+    # Streams entries into the same layout json.dumps(indent=4) would produce
+    tmp_path = output_path + ".tmp"
+    count = 0
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(f"{STAMP_PREFIX}{stamp}\n")
+            f.write("window.enemyData = [")
+            for entry in entries:
+                body = json.dumps(entry, ensure_ascii=False, indent=4).replace("\n", "\n    ")
+                f.write(("," if count else "") + "\n    " + body)
+                count += 1
+            f.write("\n];")
+    except BaseException:
+        # Keep the previous enemies.js if a row fails in --strict mode
+        os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, output_path)
+    return count
+
+def minified(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+def replace_file(path, text):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def encode_shard(entries, keys, strings):
+    # Column-major: one array per key, null where an entry lacks the key.
+    # Interned columns hold indexes into the index's string table.
+    columns = []
+    for key in keys:
+        column = [e.get(key) for e in entries]
+        if key in INTERNED_KEYS:
+            column = [None if v is None else strings.setdefault(v, len(strings)) for v in column]
+        columns.append(column)
+    return {"n": len(entries), "c": columns}
+
+def stamp_page(shard_dir):
+    # Points the page's <script src> for the shard index at ?v=<content hash>,
+    # like the shard URLs inside it, so browsers never keep a stale index
+    page_path = os.path.join(os.path.dirname(os.path.normpath(shard_dir)), PAGE_FILE)
+    index_path = os.path.join(shard_dir, "index.js")
+    if not os.path.exists(page_path) or not os.path.exists(index_path):
+        return
+    src = f"{os.path.basename(os.path.normpath(shard_dir))}/index.js"
+    version = file_hash(index_path)[:8]
+    with open(page_path, "r", encoding="utf-8") as f:
+        page = f.read()
+    stamped = re.sub(r'(src=["\'])' + re.escape(src) + r'(\?v=[^"\']*)?(["\'])',
+                     lambda m: f"{m.group(1)}{src}?v={version}{m.group(3)}", page)
+    if stamped != page:
+        replace_file(page_path, stamped)
+
+def write_sharded(entries, shard_dir, stamp):
+    # Writes shard_dir/<prefix>.js per ID prefix plus shard_dir/index.js with the
+    # key table, interned strings and shard list; index.js is written last so a
+    # failed build never points at missing shards.
+    by_prefix = {}
+    keys = []
+    for entry in entries:
+        for key in entry:
+            if key not in keys:
+                keys.append(key)
+        by_prefix.setdefault(entry["id"][0], []).append(entry)
+
+    os.makedirs(shard_dir, exist_ok=True)
+    rel_dir = os.path.basename(os.path.normpath(shard_dir))
+    strings = {}
+    shards = []
+    for prefix in sorted(by_prefix, key=list(HABITAT_BY_PREFIX).index):
+        shard = encode_shard(by_prefix[prefix], keys, strings)
+        text = f"(window.enemyShards=window.enemyShards||{{}})[{minified(prefix)}]={minified(shard)};\n"
+        replace_file(os.path.join(shard_dir, f"{prefix}.js"), text)
+        version = hashlib.sha256(text.encode("utf-8")).hexdigest()[:8]
+        shards.append({
+            "prefix": prefix, "habitat": HABITAT_BY_PREFIX[prefix],
+            "file": f"{rel_dir}/{prefix}.js?v={version}", "count": shard["n"],
+            "imaged": sum(1 for e in by_prefix[prefix] if e.get("image")),
+        })
+
+    index = {"keys": keys, "interned": INTERNED_KEYS, "strings": list(strings), "shards": shards}
+    replace_file(os.path.join(shard_dir, "index.js"),
+                 f"{STAMP_PREFIX}{stamp}\nwindow.enemyIndex={minified(index)};\n")
+    stamp_page(shard_dir)
+    return sum(s["count"] for s in shards)
+
+def compile_enemies(raw_path=RAW_FILE, output_path=OUTPUT_JS, assets_dir=ASSETS_DIR, force=False, strict=False,
+                    shard_dir=None):
+    # Returns the number of entries written, or None if the output was up to date.
+    # With shard_dir, writes the sharded layout there instead of output_path.
+    from build_atlas import load_atlas
+
+    stamp = build_hash(raw_path, assets_dir)
+    if shard_dir:
+        output_path = os.path.join(shard_dir, "index.js")
+    if not force and read_stamp(output_path) == stamp:
+        if shard_dir:
+            stamp_page(shard_dir)
+        print(f"{os.path.relpath(output_path, BASE_DIR)} is up to date.")
+        return None
+
+    errors = None if strict else []
+    entries = iter_entries(raw_path, errors, load_atlas(assets_dir))
+    if shard_dir:
+        count = write_sharded(entries, shard_dir, stamp)
+    else:
+        count = write_js(entries, output_path, stamp)
+    for e in errors or []:
+        print(f"  Skipped {e}")
+    print(f"Generated {os.path.relpath(output_path, BASE_DIR)} with {count} enemies.")
+    return count
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile raw_enemies.txt into enemies.js")
+    parser.add_argument("--input", default=RAW_FILE)
+    parser.add_argument("--output", default=OUTPUT_JS)
+    parser.add_argument("--force", action="store_true", help="rewrite even if nothing changed")
+    parser.add_argument("--strict", action="store_true", help="fail on the first invalid row")
+    parser.add_argument("--sharded", action="store_true",
+                        help="write minified per-habitat shards + index.js (loaded lazily by game.js)")
+    parser.add_argument("--shard-dir", default=SHARD_DIR)
+    args = parser.parse_args()
+    try:
+        compile_enemies(args.input, args.output, force=args.force, strict=args.strict,
+                        shard_dir=args.shard_dir if args.sharded else None)
+    except RowError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
@@ -0,0 +1,245 @@
+import os
+import re
+import json
+import time
+import queue
+import threading
+
+# Answer/battle analytics posted by game.js to /api/events.
+# Request threads only validate and enqueue; one writer thread appends the
+# events to numbered JSON-lines segment files and keeps running totals, so
+# the stats endpoint never has to rescan the raw logs.
+
+EVENTS_DIR = os.path.join(os.path.expanduser("~"), ".math_quest", "events")
+SNAPSHOT_FILE = "aggregates.json" # Totals + the log position they include
+SEGMENT_RE = re.compile(r"^events-(\d{6})\.jsonl$")
+
+SEGMENT_BYTES = 16 * 1024 * 1024 # Start a new segment file after this size
+QUEUE_BATCHES = 1000 # Batches waiting for the writer before posts get 503
+MAX_BATCH_EVENTS = 500
+MAX_BATCH_BYTES = 256 * 1024
+
+OPERATORS = ("+", "-")
+BATTLE_RESULTS = ("win", "lose", "run")
+
+def normalize_event(raw, now):
+    # Validated, compact copy of one posted event, or None if it is malformed
+    if not isinstance(raw, dict):
+        return None
+    kind = raw.get("type")
+    level = raw.get("level")
+    if not isinstance(level, int) or isinstance(level, bool) or not 0 < level < 1000:
+        return None
+    event = {"type": kind, "ts": round(now, 3), "level": level}
+    for key in ("player", "enemy"):
+        value = raw.get(key)
+        if isinstance(value, str) and 0 < len(value) <= 64:
+            event[key] = value
+
+    if kind == "answer":
+        op = raw.get("op")
+        correct = raw.get("correct")
+        ms = raw.get("ms")
+        if op not in OPERATORS or not isinstance(correct, bool):
+            return None
+        if not isinstance(ms, (int, float)) or isinstance(ms, bool) or not 0 <= ms < 3600 * 1000:
+            return None
+        event.update(op=op, correct=correct, ms=int(ms), missing=bool(raw.get("missing")))
+        return event
+    if kind == "battle":
+        if raw.get("result") not in BATTLE_RESULTS or "enemy" not in event:
+            return None
+        event["result"] = raw["result"]
+        return event
+    return None
+
+def parse_batch(body, now=None):
+    # JSON-lines body -> (valid events, number of rejected lines)
+    now = time.time() if now is None else now
+    events = []
+    rejected = 0
+    for line in body.splitlines():
+        if not line.strip():
+            continue
+        try:
+            event = normalize_event(json.loads(line), now)
+        except ValueError:
+            event = None
+        if event is None:
+            rejected += 1
+        else:
+            events.append(event)
+    return events, rejected
+
+class Aggregates:
+    # Streaming totals; add() is called once per event, in log order
+    def __init__(self, state=None):
+        state = state or {}
+        self.events = state.get("events", 0)
+        self.questions = state.get("questions", {}) # "op|level" -> [answered, correct, total_ms]
+        self.enemies = state.get("enemies", {}) # enemy -> [battles, wins, runs]
+
+    def add(self, event):
+        self.events += 1
+        if event["type"] == "answer":
+            totals = self.questions.setdefault(f"{event['op']}|{event['level']}", [0, 0, 0])
+            totals[0] += 1
+            totals[1] += event["correct"]
+            totals[2] += event["ms"]
+        elif event["type"] == "battle":
+            totals = self.enemies.setdefault(event["enemy"], [0, 0, 0])
+            totals[0] += 1
+            totals[1] += event["result"] == "win"
+            totals[2] += event["result"] == "run"
+
+    def state(self):
+        return {"events": self.events, "questions": self.questions, "enemies": self.enemies}
+
+    def summary(self):
+        accuracy = []
+        for key, (answered, correct, total_ms) in self.questions.items():
+            op, level = key.split("|")
+            accuracy.append({
+                "op": op, "level": int(level), "answered": answered, "correct": correct,
+                "accuracy": round(correct / answered, 4), "avg_ms": round(total_ms / answered),
+            })
+        accuracy.sort(key=lambda a: (a["level"], a["op"]))
+        enemies = [{
+            "enemy": enemy, "battles": battles, "wins": wins, "runs": runs,
+            "win_rate": round(wins / battles, 4),
+        } for enemy, (battles, wins, runs) in sorted(self.enemies.items())]
+        return {"events": self.events, "accuracy": accuracy, "enemies": enemies}
+
+class EventLog:
+    def __init__(self, directory=EVENTS_DIR, segment_bytes=SEGMENT_BYTES, queue_batches=QUEUE_BATCHES):
+        self.directory = os.path.abspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.queue = queue.Queue(maxsize=queue_batches)
+        self.lock = threading.Lock()
+        self.dropped = 0
+
+        self.aggregates = self._recover()
+        # Keep appending to the last segment until it is full
+        number = max(self._segments(), default=1)
+        if os.path.exists(self._segment_path(number)) and os.path.getsize(self._segment_path(number)) >= segment_bytes:
+            number += 1
+        self._open_segment(number)
+        self._writer = threading.Thread(target=self._write_loop, name="event-writer", daemon=True)
+        self._writer.start()
+
+    def _segments(self):
+        # Existing segment numbers, oldest first
+        numbers = []
+        for name in os.listdir(self.directory):
+            m = SEGMENT_RE.match(name)
+            if m:
+                numbers.append(int(m.group(1)))
+        return sorted(numbers)
+
+    def _segment_path(self, number):
+        return os.path.join(self.directory, f"events-{number:06d}.jsonl")
+
+    def _recover(self):
+        # Snapshot totals, plus whatever was logged after the snapshot was taken
+        snapshot = {}
+        try:
+            with open(os.path.join(self.directory, SNAPSHOT_FILE), "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            pass
+        aggregates = Aggregates(snapshot.get("aggregates"))
+        start_segment = snapshot.get("segment", 0)
+        start_offset = snapshot.get("offset", 0)
+
+        replayed = 0
+        for number in self._segments():
+            if number < start_segment:
+                continue
+            with open(self._segment_path(number), "rb") as f:
+                if number == start_segment:
+                    f.seek(start_offset)
+                for line in f:
+                    try:
+                        aggregates.add(json.loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        continue # Torn last line after a crash
+                    replayed += 1
+        if replayed:
+            print(f"Events: replayed {replayed} events not in {SNAPSHOT_FILE}.")
+        return aggregates
+
+    def _open_segment(self, number):
+        self.segment = number
+        self.file = open(self._segment_path(number), "ab+")
+        self.offset = self.file.tell()
+        if self.offset:
+            # End a line torn by a crash so it can't swallow the next event
+            self.file.seek(-1, os.SEEK_END)
+            if self.file.read(1) != b"\n":
+                self.file.write(b"\n")
+                self.offset += 1
+
+    def _save_snapshot(self):
+        with self.lock:
+            state = {"segment": self.segment, "offset": self.offset, "aggregates": self.aggregates.state()}
+            data = json.dumps(state, ensure_ascii=False)
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+
+    def submit(self, events):
+        # Queues a batch for the writer; False if the queue is full
+        if not events:
+            return True
+        try:
+            self.queue.put_nowait(events)
+        except queue.Full:
+            with self.lock:
+                self.dropped += len(events)
+            return False
+        return True
+
+    def _write_loop(self):
+        stopping = False
+        while not stopping:
+            batches = [self.queue.get()]
+            # Drain whatever else is waiting into the same write
+            while True:
+                try:
+                    batches.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batches:
+                stopping = True
+            events = [e for batch in batches if batch is not None for e in batch]
+            if not events:
+                continue
+
+            data = "".join(json.dumps(e, ensure_ascii=False, separators=(",", ":")) + "\n"
+                           for e in events).encode("utf-8")
+            self.file.write(data)
+            self.file.flush()
+            with self.lock:
+                self.offset += len(data)
+                for event in events:
+                    self.aggregates.add(event)
+            if self.offset >= self.segment_bytes:
+                self.file.close()
+                self._open_segment(self.segment + 1)
+                self._save_snapshot()
+
+    def summary(self):
+        with self.lock:
+            summary = self.aggregates.summary()
+            summary["dropped"] = self.dropped
+        summary["queued_batches"] = self.queue.qsize()
+        return summary
+
+    def close(self):
+        self.queue.put(None)
+        self._writer.join()
+        self.file.close()
+        self._save_snapshot()
+        print(f"Events: {self.aggregates.events} total, {self.dropped} dropped.")
@@ -1,13 +1,63 @@
 import os
+import io
+import sys
 import glob
 import math
+import time
+import mmap
+import argparse
+import tempfile
+import contextlib
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image
 
+import pipeline_cache
+import optimize_sprites
+
+# NumPy is optional: without it we fall back to the original pixel-by-pixel engine
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 ASSETS_DIR = "assets"
 
+# Edge sampling depth (px) and color-distance thresholds used by remove_background
+BORDER = 5
+CANDIDATE_THRESHOLD = 20 # Edge color vs. known checkerboard color
+BG_THRESHOLD = 25 # Pixel vs. background color (increased for compression artifacts)
+
+# Working memory for one background removal's temporaries. Images whose NumPy
+# temporaries would exceed it go through the tiled engine instead. This does
+# not bound the process: the decoded image (4 bytes/pixel) comes on top.
+TILE_BUDGET_MB = 256
+WORK_BYTES_PER_PIXEL = 64 # Rough peak of the NumPy engine's temporaries per pixel
+MIN_TILE = 64
+
+# Heuristic: Explicitly add "Common Checkerboard" colors if they are present in candidates
+CHECKER_COLORS = [
+    (255, 255, 255), # White
+    (204, 204, 204), # Standard Checkerboard Gray
+    (238, 238, 238), # Lighter Gray
+    (128, 128, 128)  # Mid Gray
+]
+
+def pipeline_params():
+    # Everything that affects remove_background's output; the incremental
+    # cache is invalidated whenever this changes.
+    return {
+        "border": BORDER,
+        "candidate_threshold": CANDIDATE_THRESHOLD,
+        "bg_threshold": BG_THRESHOLD,
+        "checker_colors": CHECKER_COLORS,
+        "variants": optimize_sprites.variant_params(),
+    }
+
 def get_target_images():
-    # Process all uma_*.png files
-    return glob.glob(os.path.join(ASSETS_DIR, "uma_*.png"))
+    # Process all uma_*.png files (but not their downscaled variants)
+    paths = glob.glob(os.path.join(ASSETS_DIR, "uma_*.png"))
+    return [p for p in paths if not optimize_sprites.is_variant(p)]
 
 def is_similar(c1, c2, threshold=30):
     # Euclidean distance in RGB space
@@ -17,122 +67,488 @@ def is_similar(c1, c2, threshold=30):
     dist = math.sqrt((r1-r2)**2 + (g1-g2)**2 + (b1-b2)**2)
     return dist < threshold
 
-def remove_background(img_path):
+def pick_background_colors(candidates, total_samples):
+    # candidates: most common edge colors as [(color, count), ...]
+    bg_target_colors = set()
+
+    # Heuristic: Add colors that appear frequently (>1%) on edges
+    for color, count in candidates:
+        if count > total_samples * 0.01:
+            bg_target_colors.add(color)
+
+    # Check if any candidate resembles a checkerboard color
+    for color, _ in candidates:
+        for cc in CHECKER_COLORS:
+            if is_similar(color, cc, threshold=CANDIDATE_THRESHOLD):
+                bg_target_colors.add(color)
+
+    return bg_target_colors
+
+# --- Pure-Python engine (original implementation, kept as the reference for parity checks) ---
+
+def edge_candidates_python(pixels, width, height, border=BORDER):
+    # Sample deeper into the image (5 px border) to catch checkerboard variations
+    samples = []
+    for x in range(width):
+        for y in range(border):
+            samples.append(pixels[x, y]) # Top
+            samples.append(pixels[x, height-1-y]) # Bottom
+    for y in range(height):
+        for x in range(border):
+            samples.append(pixels[x, y]) # Left
+            samples.append(pixels[width-1-x, y]) # Right
+
+    counts = Counter(samples)
+    return counts.most_common(10), len(samples)
+
+def flood_fill_python(pixels, width, height, bg_target_colors):
+    # Returns the list of (x, y) background pixels connected to the image border
+    def is_bg(color):
+        if color[3] == 0: return True # Already transparent
+        for target in bg_target_colors:
+            if is_similar(color, target, threshold=BG_THRESHOLD):
+                return True
+        return False
+
+    visited = set()
+    queue = deque()
+
+    # Scan edges for seeds. We assume the background touches the edges.
+    for x in range(width):
+        if is_bg(pixels[x, 0]): queue.append((x, 0)); visited.add((x, 0))
+        if is_bg(pixels[x, height-1]): queue.append((x, height-1)); visited.add((x, height-1))
+    for y in range(1, height-1):
+        if is_bg(pixels[0, y]): queue.append((0, y)); visited.add((0, y))
+        if is_bg(pixels[width-1, y]): queue.append((width-1, y)); visited.add((width-1, y))
+
+    print(f"  Starting fill with {len(queue)} seeds...")
+
+    filled = []
+    while queue:
+        x, y = queue.popleft()
+        filled.append((x, y))
+
+        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                if (nx, ny) not in visited:
+                    if is_bg(pixels[nx, ny]):
+                        visited.add((nx, ny))
+                        queue.append((nx, ny))
+    return filled
+
+def remove_background_python(img):
+    width, height = img.size
+    pixels = img.load()
+
+    candidates, total_samples = edge_candidates_python(pixels, width, height)
+    bg_target_colors = pick_background_colors(candidates, total_samples)
+    if not bg_target_colors:
+        return None
+
+    count_removed = 0
+    for x, y in flood_fill_python(pixels, width, height, bg_target_colors):
+        if pixels[x, y][3] != 0:
+            pixels[x, y] = (0, 0, 0, 0)
+            count_removed += 1
+    return count_removed
+
+# --- NumPy engine ---
+
+def edge_candidates_numpy(arr, border=BORDER):
+    height, width = arr.shape[:2]
+    rows = np.arange(border)
+    return count_edge_candidates(arr[rows], arr[height-1-rows], arr[:, rows], arr[:, width-1-rows])
+
+def count_edge_candidates(top, bottom, left, right):
+    # top/bottom: (border, width, 4) rows, left/right: (height, border, 4) columns,
+    # each counted inward from its edge.
+    # Same samples, in the same order, as edge_candidates_python so that
+    # Counter.most_common tie-breaking (first occurrence wins) is reproduced exactly.
+    top_bottom = np.stack([top, bottom], axis=2) # (border, width, 2, 4)
+    top_bottom = top_bottom.transpose(1, 0, 2, 3).reshape(-1, 4)
+    left_right = np.stack([left, right], axis=2).reshape(-1, 4)
+    samples = np.concatenate([top_bottom, left_right])
+
+    # Pack RGBA into one integer per sample so np.unique can count colors
+    packed = samples.astype(np.uint32) @ np.array([1 << 24, 1 << 16, 1 << 8, 1], dtype=np.uint32)
+    colors, first_seen, counts = np.unique(packed, return_index=True, return_counts=True)
+    order = np.lexsort((first_seen, -counts))[:10]
+
+    candidates = [(tuple(int(v) for v in samples[first_seen[i]]), int(counts[i])) for i in order]
+    return candidates, len(samples)
+
+def background_mask_numpy(arr, bg_target_colors):
+    # One vectorized distance test per target color instead of is_similar() per pixel.
+    # dist < threshold  <=>  dist^2 < threshold^2 for integer channels.
+    rgb = arr[..., :3].astype(np.int32)
+    mask = arr[..., 3] == 0 # Already transparent
+    for target in bg_target_colors:
+        diff = rgb - np.array(target[:3], dtype=np.int32)
+        mask |= (diff * diff).sum(axis=2) < BG_THRESHOLD * BG_THRESHOLD
+    return mask
+
+def border_components_numpy(mask, seeds=None):
+    # Labeled connected components (4-neighbour) over horizontal runs of the mask,
+    # keeping only the components that touch the image border (or, if given,
+    # that contain a pixel of the boolean seeds array).
+    height, width = mask.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    run_rows, run_starts = np.nonzero(edges == 1)
+    _, run_ends = np.nonzero(edges == -1) # exclusive; same row-major order as the starts
+
+    if len(run_rows) == 0:
+        return np.zeros_like(mask)
+
+    # Runs in adjacent rows are connected when their column ranges overlap.
+    # Row-major keys let one searchsorted pass find all overlapping pairs.
+    stride = width + 1
+    start_keys = run_rows * stride + run_starts
+    end_keys = run_rows * stride + run_ends
+    next_row = (run_rows + 1) * stride
+    lo = np.searchsorted(end_keys, next_row + run_starts, side="right")
+    hi = np.searchsorted(start_keys, next_row + run_ends, side="left")
+    n_pairs = np.maximum(hi - lo, 0)
+    pair_a = np.repeat(np.arange(len(run_rows)), n_pairs)
+    pair_b = np.arange(n_pairs.sum()) - np.repeat(np.cumsum(n_pairs) - n_pairs, n_pairs) + np.repeat(lo, n_pairs)
+
+    # Union the pairs by hooking each root onto the smaller one, then pointer-jumping
+    labels = np.arange(len(run_rows))
+    while True:
+        la, lb = labels[pair_a], labels[pair_b]
+        differ = la != lb
+        if not differ.any():
+            break
+        np.minimum.at(labels, np.maximum(la, lb)[differ], np.minimum(la, lb)[differ])
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+    if seeds is None:
+        # Seeds: runs containing a border pixel
+        on_border = (run_rows == 0) | (run_rows == height - 1) | (run_starts == 0) | (run_ends == width)
+    else:
+        seen = np.zeros((height, width + 1), dtype=np.int32)
+        np.cumsum(seeds, axis=1, out=seen[:, 1:])
+        on_border = seen[run_rows, run_ends] > seen[run_rows, run_starts]
+    keep = np.isin(labels, labels[on_border])
+
+    # Paint the kept runs back into a pixel mask
+    delta = np.zeros((height, width + 1), dtype=np.int32)
+    np.add.at(delta, (run_rows[keep], run_starts[keep]), 1)
+    np.add.at(delta, (run_rows[keep], run_ends[keep]), -1)
+    return np.cumsum(delta, axis=1)[:, :width] > 0
+
+def remove_background_numpy(img):
+    arr = np.array(img)
+
+    candidates, total_samples = edge_candidates_numpy(arr)
+    bg_target_colors = pick_background_colors(candidates, total_samples)
+    if not bg_target_colors:
+        return None
+
+    filled = border_components_numpy(background_mask_numpy(arr, bg_target_colors))
+    print(f"  Filled {int(filled.sum())} background pixels...")
+
+    # Only wipe pixels that are not already transparent (matches the Python engine)
+    wipe = filled & (arr[..., 3] != 0)
+    count_removed = int(wipe.sum())
+    if count_removed:
+        arr[wipe] = 0
+        img.paste(Image.fromarray(arr, "RGBA"))
+    return count_removed
+
+# --- Tiled engine (NumPy, bounded temporaries) ---
+# The RGBA pixels and the fill mask live in memory-mapped temp files and are
+# processed in square tiles sized from TILE_BUDGET_MB. Each tile is filled
+# from its own border seeds plus the filled pixels just outside its edges;
+# tiles whose edge pixels change requeue their neighbours until nothing
+# changes, which yields exactly the mask of border_components_numpy.
+# Mapped pages are dropped after every tile so the working memory stays at
+# about one tile's worth, whatever the image size. Peak RSS is NOT bounded:
+# PIL decodes a PNG whole (one zlib stream, row filters that depend on the
+# previous row), so the decoded frame is held in full on top of that and RSS
+# still grows with the image. For a 6000x6000 frame (144 MB) the peak was
+# 324/363/525 MB at a 16/64/256 MB budget.
+
+def set_tile_budget(budget_mb):
+    # Also run in pool workers, see run_batch
+    global TILE_BUDGET_MB
+    TILE_BUDGET_MB = budget_mb
+
+def tile_size(budget_mb):
+    side = int(math.sqrt(budget_mb * 1024 * 1024 / WORK_BYTES_PER_PIXEL))
+    return max(MIN_TILE, side // MIN_TILE * MIN_TILE)
+
+def mapped_array(shape, dtype, directory=None):
+    # Zero-filled array backed by an anonymous temp file -> (array, mmap)
+    size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    with tempfile.TemporaryFile(dir=directory) as f:
+        f.truncate(size)
+        mapping = mmap.mmap(f.fileno(), size)
+    return np.ndarray(shape, dtype=dtype, buffer=mapping), mapping
+
+def release(mapping):
+    # Drop the mapping's pages from our resident set; the data stays in the file
+    if hasattr(mapping, "madvise") and hasattr(mmap, "MADV_DONTNEED"):
+        mapping.madvise(mmap.MADV_DONTNEED)
+
+def tile_seeds(filled, mask_shape, y0, x0):
+    # Image border pixels in the tile, plus pixels next to filled ones in the neighbouring tiles
+    height, width = filled.shape
+    y1, x1 = y0 + mask_shape[0], x0 + mask_shape[1]
+    seeds = np.zeros(mask_shape, dtype=bool)
+    seeds[0] = True if y0 == 0 else filled[y0 - 1, x0:x1]
+    seeds[-1] |= True if y1 == height else filled[y1, x0:x1]
+    seeds[:, 0] |= True if x0 == 0 else filled[y0:y1, x0 - 1]
+    seeds[:, -1] |= True if x1 == width else filled[y0:y1, x1]
+    return seeds
+
+def remove_background_tiled(img, budget_mb=None, tile_dir=None):
+    width, height = img.size
+    tile = tile_size(budget_mb or TILE_BUDGET_MB)
+    band_rows = max(1, tile * tile // width) # Rows copied in or out at a time
+    rgba, rgba_map = mapped_array((height, width, 4), np.uint8, tile_dir)
+    filled, filled_map = mapped_array((height, width), bool, tile_dir)
+
+    for y0 in range(0, height, band_rows):
+        band = img.crop((0, y0, width, min(y0 + band_rows, height)))
+        rgba[y0:y0 + band.height] = np.asarray(band.convert("RGBA"))
+        release(rgba_map)
+
+    rows = np.arange(BORDER)
+    sides = [(rgba[y0:y0 + band_rows, rows], rgba[y0:y0 + band_rows, width-1-rows])
+             for y0 in range(0, height, band_rows)]
+    left = np.concatenate([l for l, _ in sides])
+    right = np.concatenate([r for _, r in sides])
+    candidates, total_samples = count_edge_candidates(rgba[rows], rgba[height-1-rows], left, right)
+    bg_target_colors = pick_background_colors(candidates, total_samples)
+    if not bg_target_colors:
+        return None
+
+    tiles = [(y0, x0) for y0 in range(0, height, tile) for x0 in range(0, width, tile)]
+    queue = deque(tiles)
+    queued = set(tiles)
+    passes = 0
+    while queue:
+        y0, x0 = queue.popleft()
+        queued.discard((y0, x0))
+        passes += 1
+        region = (slice(y0, y0 + tile), slice(x0, x0 + tile))
+        mask = background_mask_numpy(rgba[region], bg_target_colors)
+        new = border_components_numpy(mask, tile_seeds(filled, mask.shape, y0, x0))
+        grown = new & ~filled[region]
+        if grown.any():
+            filled[region] = new
+            # Neighbours across an edge that gained filled pixels
+            for edge, neighbour in ((grown[0], (y0 - tile, x0)), (grown[-1], (y0 + tile, x0)),
+                                    (grown[:, 0], (y0, x0 - tile)), (grown[:, -1], (y0, x0 + tile))):
+                if 0 <= neighbour[0] < height and 0 <= neighbour[1] < width and edge.any() \
+                        and neighbour not in queued:
+                    queue.append(neighbour)
+                    queued.add(neighbour)
+        release(rgba_map)
+        release(filled_map)
+
+    count_filled = 0
+    count_removed = 0
+    for y0, x0 in tiles:
+        region = (slice(y0, y0 + tile), slice(x0, x0 + tile))
+        pixels = rgba[region]
+        count_filled += int(filled[region].sum())
+        # Only wipe pixels that are not already transparent (matches the Python engine)
+        wipe = filled[region] & (pixels[..., 3] != 0)
+        count_removed += int(wipe.sum())
+        pixels[wipe] = 0
+        release(rgba_map)
+        release(filled_map)
+    print(f"  Filled {count_filled} background pixels ({len(tiles)} tiles of {tile}px, {passes} passes)...")
+
+    if count_removed:
+        for y0 in range(0, height, band_rows):
+            img.paste(Image.fromarray(np.array(rgba[y0:y0 + band_rows]), "RGBA"), (0, y0))
+            release(rgba_map)
+    return count_removed
+
+ENGINES = {
+    "python": remove_background_python,
+}
+if np is not None:
+    ENGINES["numpy"] = remove_background_numpy
+    ENGINES["tiled"] = remove_background_tiled
+
+DEFAULT_ENGINE = "numpy" if np is not None else "python"
+
+def remove_background(img_path, engine=DEFAULT_ENGINE):
+    # Pixels removed (0 when there was nothing to remove), or None on failure
     print(f"Processing {img_path}...")
     try:
         if not os.path.exists(img_path):
             print(f"  Not found: {img_path}")
-            return
-
-        img = Image.open(img_path).convert("RGBA")
-        width, height = img.size
-        pixels = img.load()
-
-        # 1. Identify Background Candidates using Edge Sampling
-        # Sample deeper into the image (5 px border) to catch checkerboard variations
-        samples = []
-        border = 5
-        for x in range(width):
-            for y in range(border):
-                samples.append(pixels[x, y]) # Top
-                samples.append(pixels[x, height-1-y]) # Bottom
-        for y in range(height):
-            for x in range(border):
-                samples.append(pixels[x, y]) # Left
-                samples.append(pixels[width-1-x, y]) # Right
-
-        from collections import Counter
-        counts = Counter(samples)
-        total_samples = len(samples)
-        
-        candidates = counts.most_common(10)
-        # print(f"  Top edge colors: {candidates}")
-
-        bg_target_colors = set()
-        
-        # Heuristic: Add colors that appear frequently (>1%) on edges
-        for color, count in candidates:
-             if count > total_samples * 0.01:
-                 bg_target_colors.add(color)
-
-        # Heuristic: Explicitly add "Common Checkerboard" colors if they are present in candidates
-        # White, Light Gray, Dark Gray
-        checker_colors = [
-            (255, 255, 255), # White
-            (204, 204, 204), # Standard Checkerboard Gray
-            (238, 238, 238), # Lighter Gray
-            (128, 128, 128)  # Mid Gray
-        ]
-        
-        # Check if any candidate resembles a checkerboard color
-        for cand in candidates:
-            c = cand[0]
-            for cc in checker_colors:
-                if is_similar(c, cc, threshold=20):
-                     bg_target_colors.add(c)
-
-        # print(f"  Target Removal Colors (Exact): {bg_target_colors}")
-
-        if not bg_target_colors:
+            return None
+
+        img = Image.open(img_path)
+        # The decoded frame is edited in place; convert() would copy it even when it's already RGBA
+        if img.mode == "RGBA":
+            img.load()
+        else:
+            img = img.convert("RGBA")
+        if engine == "numpy" and img.width * img.height * WORK_BYTES_PER_PIXEL > TILE_BUDGET_MB * 1024 * 1024:
+            engine = "tiled" # Same mask, bounded temporaries
+        count_removed = ENGINES[engine](img)
+
+        if count_removed is None:
             print("  No clear background detected.")
-            return
-
-        # 2. Flood Fill with Fuzzy Matching
-        visited = set()
-        queue = []
-        
-        # Initialize queue with all edge pixels that match target colors (fuzzy)
-        # We assume the background touches the edges.
-        
-        # Helper to check if a pixel should be removed
-        def is_bg(color):
-            if color[3] == 0: return True # Already transparent
-            for target in bg_target_colors:
-                if is_similar(color, target, threshold=25): # Increased threshold for compression artifacts
-                    return True
-            return False
-
-        # Scan edges for seeds
-        for x in range(width):
-            if is_bg(pixels[x, 0]): queue.append((x, 0)); visited.add((x, 0))
-            if is_bg(pixels[x, height-1]): queue.append((x, height-1)); visited.add((x, height-1))
-        for y in range(1, height-1):
-            if is_bg(pixels[0, y]): queue.append((0, y)); visited.add((0, y))
-            if is_bg(pixels[width-1, y]): queue.append((width-1, y)); visited.add((width-1, y))
-
-        print(f"  Starting fill with {len(queue)} seeds...")
-        
-        count_removed = 0
-        while queue:
-            x, y = queue.pop(0)
-            
-            # Wipe
-            if pixels[x, y][3] != 0:
-                pixels[x, y] = (0, 0, 0, 0)
-                count_removed += 1
-            
-            # Neighbors
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < width and 0 <= ny < height:
-                    if (nx, ny) not in visited:
-                        # Check if neighbor is also background
-                        if is_bg(pixels[nx, ny]):
-                            visited.add((nx, ny))
-                            queue.append((nx, ny))
-                            
+            return 0
+
         print(f"  Removed {count_removed} pixels.")
         if count_removed > 0:
             img.save(img_path)
-            # print(f"  Saved {img_path}")
         else:
             print("  No changes made.")
+        return count_removed
 
     except Exception as e:
         print(f"  Error processing {img_path}: {e}")
+        return None
+
+# --- Batch mode ---
+
+def _run_captured(worker, item):
+    # Run one task with its print() output captured, so the parent can
+    # replay the log lines in submission order instead of interleaved.
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        result = worker(item)
+    return buf.getvalue(), result
+
+def run_batch(worker, items, jobs=None):
+    # Fan worker(item) out over a process pool. worker must be a module-level
+    # function returning (pixels_removed, info); None for pixels_removed means
+    # the item was skipped as up to date, None for info that it failed.
+    # Returns the list of infos in submission order.
+    items = list(items)
+    jobs = jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    total_removed = 0
+    skipped = 0
+    failed = 0
+    infos = []
+
+    parallel = jobs > 1 and len(items) > 1
+    # Workers get this process's tile budget (spawned ones don't inherit globals)
+    pool = ProcessPoolExecutor(max_workers=min(jobs, len(items)), initializer=set_tile_budget,
+                               initargs=(TILE_BUDGET_MB,)) if parallel else contextlib.nullcontext()
+    with pool:
+        if parallel:
+            # map() yields in submission order, keeping the log deterministic
+            results = pool.map(_run_captured, [worker] * len(items), items)
+        else:
+            results = (_run_captured(worker, item) for item in items)
+
+        for log, (removed, info) in results:
+            sys.stdout.write(log)
+            if removed is None:
+                skipped += 1
+            elif info is None:
+                failed += 1
+            else:
+                total_removed += removed
+            infos.append(info)
+
+    elapsed = time.perf_counter() - start
+    processed = len(items) - skipped - failed
+    rate = processed / elapsed if elapsed > 0 else 0.0
+    print(f"Processed {processed} images ({skipped} up to date) in {elapsed:.2f}s with {jobs} job(s) "
+          f"({rate:.1f} images/sec), removed {total_removed} pixels.")
+    if failed:
+        print(f"{failed} image(s) failed and were left out of the cache, they are retried next run.")
+    return infos
+
+def sprite_variants(img_path):
+    # optimize_sprite(), or None if an encoder failed
+    try:
+        return optimize_sprites.optimize_sprite(img_path)
+    except Exception as e:
+        print(f"  Error writing variants for {img_path}: {e}")
+        return None
+
+def process_file(img_path):
+    # Background removal followed by the sprite variant stage.
+    # Returns (pixels_removed, info) where info feeds update_manifest;
+    # info is None if the file failed, so it is never recorded as done.
+    if not os.path.exists(img_path):
+        print(f"Not found: {img_path}")
+        return 0, None
+    source_hash = pipeline_cache.file_hash(img_path)
+    removed = remove_background(img_path)
+    if removed is None:
+        return 0, None
+    variants = sprite_variants(img_path)
+    if variants is None:
+        return 0, None
+    info = {
+        "name": os.path.basename(img_path),
+        "source": source_hash,
+        "output": pipeline_cache.file_hash(img_path),
+        "variants": variants,
+    }
+    return removed, info
+
+def process_cached(job):
+    # process_file() unless the manifest says the file's current content is
+    # already our output and its variants exist.
+    img_path, cached_output = job
+    if pipeline_cache.is_up_to_date(img_path, cached_output):
+        if optimize_sprites.has_variants(img_path):
+            print(f"Up to date: {img_path}")
+            return None, None
+        print(f"Rebuilding variants: {img_path}")
+        variants = sprite_variants(img_path)
+        if variants is None:
+            return 0, None
+        return 0, {
+            "name": os.path.basename(img_path),
+            "source": None,
+            "output": cached_output,
+            "variants": variants,
+        }
+    return process_file(img_path)
+
+def update_manifest(manifest, infos):
+    variants = {}
+    for info in infos:
+        if info is None:
+            continue
+        entry = manifest["files"].get(info["name"], {})
+        pipeline_cache.record(manifest, info["name"], info["source"] or entry.get("source"), info["output"])
+        variants[info["name"]] = info["variants"]
+    pipeline_cache.save_manifest(ASSETS_DIR, manifest)
+    if variants:
+        optimize_sprites.update_report(variants, ASSETS_DIR)
+
+def parse_jobs_args(description, tile_budget=False):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore the incremental cache and reprocess everything")
+    if tile_budget:
+        parser.add_argument("--tile-budget", type=int, default=TILE_BUDGET_MB, metavar="MB",
+                            help="working memory for the fill temporaries per image before switching to tiles "
+                                 f"(default: {TILE_BUDGET_MB}); the decoded image, 4 bytes/pixel, comes on top")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    targets = get_target_images()
+    args = parse_jobs_args("Remove checkerboard/flat backgrounds from assets/uma_*.png", tile_budget=True)
+    set_tile_budget(args.tile_budget)
+    targets = sorted(get_target_images())
     print(f"Found {len(targets)} images to process.")
-    for p in targets:
-        remove_background(p)
+    manifest = pipeline_cache.load_manifest(ASSETS_DIR, pipeline_params())
+    jobs = [(p, None if args.force else pipeline_cache.cached_output(manifest, os.path.basename(p)))
+            for p in targets]
+    update_manifest(manifest, run_batch(process_cached, jobs, jobs=args.jobs))
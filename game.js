@@ -19,6 +19,48 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 });
 
+// Rendered width of the enemy sprite, for picking a srcset candidate
+// (.enemy-image: 3:2 sprites at most 60vh tall, full width on phones)
+const SPRITE_SIZES = '(max-width: 600px) 100vw, 90vh';
+
+// Pre-rendered sample (render_audio.py) for each playSound type. playSFX has
+// its own 'pi', so this one is sfx_select; 'win' has no sound here.
+const SOUND_SAMPLES = {
+    attack: 'sfx_attack', miss: 'sfx_miss', heal: 'sfx_heal',
+    approaching: 'sfx_approaching', pi: 'sfx_select', darkness: 'sfx_darkness'
+};
+
+// Offline support: sw.js is generated by build_manifest.py (needs http://, not file://)
+if ('serviceWorker' in navigator && location.protocol.startsWith('http')) {
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register('sw.js').catch(e => console.warn("Service worker not registered", e));
+    });
+}
+
+// Live reload (host_quest.py --watch / --live-reload): reload when the version
+// changes. The --prod server holds each poll open until a rebuild; the dev
+// server answers at once, so poll again shortly. A 404 means it's switched off.
+function watchForReload(known) {
+    fetch('api/reload' + (known ? '?v=' + encodeURIComponent(known) : ''), { cache: 'no-store' })
+        .then(response => {
+            if (!response.ok) throw new Error(response.status === 404 ? 'off' : 'status ' + response.status);
+            return response.json();
+        })
+        .then(body => {
+            if (known && body.version !== known) {
+                location.reload();
+                return;
+            }
+            setTimeout(() => watchForReload(body.version), 300);
+        })
+        .catch(e => {
+            if (e.message !== 'off') setTimeout(() => watchForReload(known), 1000);
+        });
+}
+if (location.protocol.startsWith('http')) {
+    window.addEventListener('load', () => watchForReload(null));
+}
+
 class GameController {
     constructor() {
         // UI Elements
@@ -73,6 +115,12 @@ class GameController {
 
         // Load Save Data
         this.loadGame();
+
+        // Server save sync (host_quest.py --save-db, /api/save/), keyed by ?player=NAME
+        const params = new URLSearchParams(location.search);
+        if (params.get('player')) localStorage.setItem('mathQuestPlayer', params.get('player'));
+        this.playerId = localStorage.getItem('mathQuestPlayer');
+        this.loadRemoteSave();
     }
 
     init() {
@@ -139,6 +187,7 @@ class GameController {
         }
         // ^ Close if (soundTestBtn)
 
+        this.nextEnemyReady = this.prepareNextEnemy(); // While the title screen shows
     }
 
 
@@ -180,8 +229,11 @@ class GameController {
     async startBattle() {
         this.isBattleActive = false; // Disable input
 
+        await (this.nextEnemyReady || this.prepareNextEnemy());
+        this.loadProblemBank(this.player.lv); // Ready by the first question
         this.currentEnemy = this.generateEnemy();
         this.updateEnemyDisplay(); // Set enemy data (but we will hide it)
+        this.nextEnemyReady = this.prepareNextEnemy(); // Fetched during this battle
 
         // Hide Enemy & Interface initially
         this.elements.enemySprite.style.transition = 'none'; // Instant hide
@@ -366,6 +418,7 @@ class GameController {
                 this.enemyAttack();
             }, 1500);
         } else {
+            this.recordBattle('run');
             this.logMessage("えいとくんは にげだした！");
             this.bgm.stop();
             setTimeout(() => {
@@ -417,11 +470,44 @@ class GameController {
         }, 1500);
     }
 
-    generateEnemy() {
+    // The next battle's enemy is picked ahead of time, while the title screen or
+    // the current battle is showing, and its sprite is requested then: it is
+    // ready when the enemy appears, and in the service worker's cache in the
+    // format this browser picks if the connection drops.
+    async prepareNextEnemy() {
+        await this.ensureEnemyData();
+        const template = this.pickEnemyTemplate();
+        this.nextEnemyTemplate = template;
+        // Held on to so the request isn't dropped with the element
+        this.nextEnemySprite = template.image ? this.createSpriteImage(template, true) : null;
+    }
+
+    pickEnemyTemplate() {
         // World Youkai Data (C001-C022, F001)
-        const enemies = window.enemyData || [];
+        // enemies.js sets window.enemyData; the sharded build has loaded the shard chosen for this battle
+        const enemies = window.enemyData || this.getEnemyPool();
 
+        // Image-based Selection (Registered 47 Yokai)
+        // Filter enemies that have an 'image' property
+        const validEnemies = enemies.filter(e => e.image);
+
+        let enemyTemplate;
+        if (validEnemies.length > 0) {
+            const randomIndex = Math.floor(Math.random() * validEnemies.length);
+            enemyTemplate = validEnemies[randomIndex];
+        } else {
+            // Fallback if no images found
+            const randomIndex = Math.floor(Math.random() * enemies.length);
+            enemyTemplate = enemies[randomIndex];
+        }
+        if (!enemyTemplate) {
+            // No enemy data at all (e.g. the shard failed to load while offline)
+            enemyTemplate = { id: "UMA", name: "なぞのUMA", emoji: "👾", hp: 15, maxHp: 15, exp: 5 };
+        }
+        return enemyTemplate;
+    }
 
+    generateEnemy() {
         // Boss Battle: King Monkey (Level 1 Last Boss)
         // Trigger: Level 1 and close to Level Up (exp >= 8)
         if (this.player.lv === 1 && this.player.exp >= 8 && !this.lvl1BossDefeated) {
@@ -454,21 +540,8 @@ class GameController {
             };
         }
 
-        // Image-based Selection (Registered 47 Yokai)
-        // Filter enemies that have an 'image' property
-        const validEnemies = enemies.filter(e => e.image);
-
-        let enemyTemplate;
-        if (validEnemies.length > 0) {
-            const randomIndex = Math.floor(Math.random() * validEnemies.length);
-            enemyTemplate = validEnemies[randomIndex];
-        } else {
-            // Fallback if no images found
-            const randomIndex = Math.floor(Math.random() * enemies.length);
-            enemyTemplate = enemies[randomIndex];
-        }
-
-        console.log(`[DEBUG] Selected Enemy: ${enemyTemplate.name} (${enemyTemplate.id}) Image: ${enemyTemplate.image}`);
+        const enemyTemplate = this.nextEnemyTemplate || this.pickEnemyTemplate();
+        this.nextEnemyTemplate = null;
 
         // Determine Enemy Level (Player LV +/- 1, min 1)
         let enemyLv = this.player.lv + (Math.floor(Math.random() * 3) - 1);
@@ -495,6 +568,76 @@ class GameController {
         };
     }
 
+    // --- Sharded Enemy Data (enemy_compiler.py --sharded) ---
+    // enemies/index.js lists one script per habitat with how many of its
+    // enemies have a sprite. Enemies are drawn like the enemies.js build does
+    // (uniformly from every enemy with a sprite), but only one shard is loaded
+    // per battle: it is picked weighted by that count, then generateEnemy
+    // picks uniformly within it.
+
+    async ensureEnemyData() {
+        const index = window.enemyIndex;
+        if (window.enemyData || !index) return;
+        if (!this.enemyPools) {
+            this.enemyPools = {}; // prefix -> enemies
+            this.enemyShardLoads = {};
+        }
+
+        const imaged = index.shards.filter(s => s.imaged > 0);
+        const candidates = imaged.length > 0 ? imaged : index.shards;
+        const weight = s => imaged.length > 0 ? s.imaged : s.count;
+        let pick = Math.random() * candidates.reduce((sum, s) => sum + weight(s), 0);
+        const shard = candidates.find(s => (pick -= weight(s)) < 0) || candidates[candidates.length - 1];
+        this.enemyShard = shard.prefix;
+        try {
+            await this.loadEnemyShard(shard);
+        } catch (e) {
+            console.error(e);
+        }
+    }
+
+    getEnemyPool() {
+        // The shard picked for this battle; if it failed to load, whatever is loaded
+        const pools = this.enemyPools || {};
+        return pools[this.enemyShard] || Object.values(pools).flat();
+    }
+
+    loadEnemyShard(shard) {
+        if (!this.enemyShardLoads[shard.prefix]) {
+            this.enemyShardLoads[shard.prefix] = new Promise((resolve, reject) => {
+                const script = document.createElement('script');
+                script.src = shard.file;
+                script.onload = resolve;
+                script.onerror = () => {
+                    delete this.enemyShardLoads[shard.prefix]; // Retry next battle
+                    reject(new Error(`Failed to load ${shard.file}`));
+                };
+                document.head.appendChild(script);
+            }).then(() => {
+                const data = window.enemyShards[shard.prefix];
+                this.enemyPools[shard.prefix] = this.decodeEnemyShard(window.enemyIndex, data);
+                delete window.enemyShards[shard.prefix];
+            });
+        }
+        return this.enemyShardLoads[shard.prefix];
+    }
+
+    decodeEnemyShard(index, data) {
+        // Columnar -> array of enemy objects (null means "no such key")
+        const enemies = [];
+        for (let i = 0; i < data.n; i++) {
+            const enemy = {};
+            index.keys.forEach((key, k) => {
+                let value = data.c[k][i];
+                if (value === null) return;
+                if (index.interned.includes(key)) value = index.strings[value];
+                enemy[key] = value;
+            });
+            enemies.push(enemy);
+        }
+        return enemies;
+    }
+
     getHabitatForLevel(level) {
         if (level <= 3) return "まち";
         if (level <= 10) return "森";
@@ -513,15 +656,9 @@ class GameController {
         this.elements.enemySprite.innerHTML = ''; // Clear previous content
 
         if (this.currentEnemy.image) {
-            const img = document.createElement('img');
-            img.src = this.currentEnemy.image;
-            img.className = 'enemy-image ' + (this.currentEnemy.isBoss ? 'boss' : '');
-            // Handle error (fallback to emoji)
-            img.onerror = () => {
-                this.elements.enemySprite.textContent = this.currentEnemy.emoji;
-                this.elements.enemySprite.classList.remove('has-image');
-            };
-            this.elements.enemySprite.appendChild(img);
+            const sheet = this.loadedAtlasSheet(this.currentEnemy);
+            this.elements.enemySprite.appendChild(sheet ? this.createAtlasSprite(this.currentEnemy, sheet)
+                : this.createSpriteImage(this.currentEnemy));
             this.elements.enemySprite.classList.add('has-image');
         } else {
             this.elements.enemySprite.textContent = this.currentEnemy.emoji;
@@ -552,6 +689,75 @@ class GameController {
         this.updateEnemyStats();
     }
 
+    createSpriteImage(enemy, preload = false) {
+        // preload: only fetch it (a detached element still picks a source)
+        const img = document.createElement('img');
+        img.className = 'enemy-image ' + (enemy.isBoss ? 'boss' : '');
+        if (!preload) {
+            // Handle error (fallback to emoji)
+            img.onerror = () => {
+                this.elements.enemySprite.textContent = enemy.emoji;
+                this.elements.enemySprite.classList.remove('has-image');
+            };
+            img.addEventListener('load', () => this.warmAtlasSheet(enemy), { once: true });
+        }
+        img.src = enemy.image;
+        if (!enemy.srcset) return img;
+
+        // Downscaled variants (optimize_sprites.py): the browser picks the first
+        // format it supports and the smallest width that covers the sprite
+        const candidates = list => list.map(([url, width]) => `${url} ${width}w`).join(', ');
+        const picture = document.createElement('picture');
+        Object.entries(enemy.srcset).forEach(([format, list]) => {
+            if (format === 'png') {
+                img.srcset = candidates(list);
+                img.sizes = SPRITE_SIZES;
+                return;
+            }
+            const source = document.createElement('source');
+            source.type = 'image/' + format;
+            source.srcset = candidates(list);
+            source.sizes = SPRITE_SIZES;
+            picture.appendChild(source);
+        });
+        picture.appendChild(img);
+        return picture;
+    }
+
+    // Per-habitat sprite sheets (build_atlas.py). A sheet is far larger than one
+    // downscaled sprite, so it never blocks a battle: it is fetched when the page
+    // is idle after an enemy of that habitat is on screen (or comes straight from
+    // the cache), and only enemies shown after it has loaded are drawn from it.
+
+    loadedAtlasSheet(enemy) {
+        const sheet = enemy.atlas && this.atlasSheets && this.atlasSheets[enemy.atlas.image];
+        return sheet && sheet.complete && sheet.naturalWidth > 0 ? sheet : null;
+    }
+
+    warmAtlasSheet(enemy) {
+        if (!enemy.atlas) return;
+        const url = enemy.atlas.image;
+        this.atlasSheets = this.atlasSheets || {};
+        if (this.atlasSheets[url]) return;
+        const sheet = new Image();
+        this.atlasSheets[url] = sheet;
+        sheet.addEventListener('error', () => delete this.atlasSheets[url], { once: true });
+        const idle = window.requestIdleCallback || (callback => setTimeout(callback, 1000));
+        idle(() => { sheet.src = url; });
+    }
+
+    createAtlasSprite(enemy, sheet) {
+        const atlas = enemy.atlas;
+        // Canvas keeps the untrimmed frame size so it lays out like the <img>
+        const canvas = document.createElement('canvas');
+        canvas.width = atlas.sourceW;
+        canvas.height = atlas.sourceH;
+        canvas.className = 'enemy-image ' + (enemy.isBoss ? 'boss' : '');
+        canvas.getContext('2d').drawImage(sheet, atlas.x, atlas.y, atlas.w, atlas.h,
+            atlas.offsetX, atlas.offsetY, atlas.w, atlas.h);
+        return canvas;
+    }
+
     updateEnemyStats() {
         if (!this.currentEnemy) return;
 
@@ -597,8 +803,74 @@ class GameController {
         this.logMessage("もんだい！");
     }
 
+    // --- Problem Banks (problem_bank.py) ---
+    // problems/index.json lists one precomputed table per level tier. Until the
+    // tier for a level has loaded (or when it can't be fetched), problems are
+    // generated at runtime as before.
+
+    loadProblemBank(level) {
+        if (!this.problemIndex) {
+            this.problemIndex = fetch('problems/index.json')
+                .then(res => res.ok ? res.json() : null)
+                .catch(() => null)
+                .then(index => {
+                    this.problemShards = index ? index.shards : [];
+                    this.problemRowWidth = index ? index.fields.length : 0;
+                });
+        }
+        return this.problemIndex.then(() => {
+            const shard = this.findProblemShard(level);
+            if (!shard) return null;
+            if (!shard.loading) {
+                shard.loading = fetch(shard.file)
+                    .then(res => res.ok ? res.json() : Promise.reject(new Error(res.status)))
+                    .then(bank => { shard.rows = bank.rows; })
+                    .catch(() => { shard.loading = null; }); // Retry later
+            }
+            return shard.loading;
+        });
+    }
+
+    findProblemShard(level) {
+        return (this.problemShards || []).find(s =>
+            level >= s.minLevel && (s.maxLevel === null || level <= s.maxLevel));
+    }
+
+    getBankProblem(level) {
+        // A problem from the loaded bank for this level, or null (and start loading it)
+        const shard = this.findProblemShard(level);
+        if (shard && shard.rows) return { ...this.pickBankProblem(shard.rows, this.problemRowWidth), level: level };
+        this.loadProblemBank(level);
+        return null;
+    }
+
+    pickBankProblem(rows, width) {
+        // Row: n1, n2, op (0 = +, 1 = -), missing (0 none, 1 first, 2 second), 4 choices, correct index
+        const i = Math.floor(Math.random() * (rows.length / width)) * width;
+        const [n1, n2, op, missing] = rows.slice(i, i + 4);
+        const choices = rows.slice(i + 4, i + 8);
+        const sign = op === 1 ? '-' : '+';
+        const result = op === 1 ? n1 - n2 : n1 + n2;
+
+        let question = `${n1} ${sign} ${n2} = ?`;
+        if (missing === 1) question = `? ${sign} ${n2} = ${result}`;
+        if (missing === 2) question = `${n1} ${sign} ? = ${result}`;
+
+        return {
+            question: question,
+            answer: choices[rows[i + 8]],
+            choices: choices,
+            op: sign,
+            missing: missing !== 0
+        };
+    }
+
     generateMathProblem(level) {
+        const banked = this.getBankProblem(level);
+        if (banked) return banked;
+
         let n1, n2, operator, answer, question;
+        let missing = false;
 
         // Level 1-2: Addition sum <= 10
         // Level 3-4: Subtraction (start <= 10, result >= 0)
@@ -644,6 +916,7 @@ class GameController {
             // 40% chance of missing operand
             if (mode === 'add') {
                 // n1 + n2 = answer
+                missing = true;
                 if (Math.random() > 0.5) {
                     // ? + n2 = answer
                     question = `? + ${n2} = ${answer}`; // Answer is n1
@@ -655,6 +928,7 @@ class GameController {
                 }
             } else {
                 // n1 - n2 = answer
+                missing = true;
                 if (Math.random() > 0.5) {
                     // ? - n2 = answer
                     question = `? - ${n2} = ${answer}`; // Answer is n1
@@ -669,7 +943,10 @@ class GameController {
 
         return {
             question: question,
-            answer: answer
+            answer: answer,
+            op: operator,
+            missing: missing,
+            level: level
         };
     }
 
@@ -677,23 +954,10 @@ class GameController {
         const buttons = Array.from(this.elements.answerButtons);
         const correctAnswer = problem.answer;
 
-        // Generate 3 unique wrong answers
-        const wrongAnswers = new Set();
-        while (wrongAnswers.size < 3) {
-            let offset = Math.floor(Math.random() * 5) + 1; // 1 to 5
-            offset *= Math.random() > 0.5 ? 1 : -1;
-            let wrong = correctAnswer + offset;
-            if (wrong >= 0 && wrong !== correctAnswer) {
-                wrongAnswers.add(wrong);
-            }
-        }
+        this.problemShownAt = performance.now();
 
-        const choices = [correctAnswer, ...wrongAnswers];
-        // Shuffle
-        for (let i = choices.length - 1; i > 0; i--) {
-            const j = Math.floor(Math.random() * (i + 1));
-            [choices[i], choices[j]] = [choices[j], choices[i]];
-        }
+        // Banked problems come with shuffled choices already
+        const choices = problem.choices ? [...problem.choices] : this.makeChoices(correctAnswer);
 
         buttons.forEach((btn, index) => {
             btn.textContent = choices[index];
@@ -702,6 +966,28 @@ class GameController {
         });
     }
 
+    makeChoices(correctAnswer) {
+        // 3 unique wrong answers within +/-5 (never negative), drawn without
+        // retries so small answers can't keep the loop spinning
+        const candidates = [];
+        for (let offset = -5; offset <= 5; offset++) {
+            const wrong = correctAnswer + offset;
+            if (offset !== 0 && wrong >= 0) candidates.push(wrong);
+        }
+        for (let i = 0; i < 3; i++) {
+            const j = i + Math.floor(Math.random() * (candidates.length - i));
+            [candidates[i], candidates[j]] = [candidates[j], candidates[i]];
+        }
+
+        const choices = [correctAnswer, ...candidates.slice(0, 3)];
+        // Shuffle
+        for (let i = choices.length - 1; i > 0; i--) {
+            const j = Math.floor(Math.random() * (i + 1));
+            [choices[i], choices[j]] = [choices[j], choices[i]];
+        }
+        return choices;
+    }
+
 
     updatePlayerStats() {
         if (!this.player) return;
@@ -765,6 +1051,15 @@ class GameController {
 
         const playerAnswer = parseInt(btn.dataset.value);
         const isCorrect = playerAnswer === this.currentProblem.answer;
+        this.recordEvent({
+            type: 'answer',
+            level: this.currentProblem.level,
+            op: this.currentProblem.op,
+            missing: this.currentProblem.missing,
+            correct: isCorrect,
+            ms: Math.round(performance.now() - this.problemShownAt),
+            enemy: this.currentEnemy ? this.currentEnemy.id : undefined
+        });
 
         // Disable buttons temporarily
         this.elements.answerButtons.forEach(b => b.disabled = true);
@@ -897,6 +1192,7 @@ class GameController {
     }
 
     winBattle() {
+        this.recordBattle('win');
         this.logMessage(`${this.currentEnemy.name}を たおした！`);
         this.playSound('attack'); // Victory sound placeholder
 
@@ -985,6 +1281,7 @@ class GameController {
     }
 
     handleGameOver() {
+        this.recordBattle('lose');
         this.isBattleActive = false;
         this.bgm.stop();
         this.playSound('miss'); // Sad sound
@@ -1100,6 +1397,7 @@ class GameController {
 
     playSound(type) {
         // return; // Muted for now -> Re-enabling for specific SFX request
+        if (SOUND_SAMPLES[type] && this.bgm.playSample(SOUND_SAMPLES[type])) return;
         const AudioContext = window.AudioContext || window.webkitAudioContext;
         if (!AudioContext) return;
 
@@ -1208,6 +1506,51 @@ class GameController {
     }
     // --- Save System ---
 
+    // --- Analytics (host_quest.py --events-dir, /api/events) ---
+    // Events are batched and posted as JSON lines; whatever is left is sent
+    // with sendBeacon when the page is hidden.
+
+    recordEvent(event) {
+        if (!this.eventQueue) {
+            this.eventQueue = [];
+            setInterval(() => this.flushEvents(), 15000);
+            document.addEventListener('visibilitychange', () => {
+                if (document.visibilityState === 'hidden') this.flushEvents(true);
+            });
+        }
+        if (this.playerId) event.player = this.playerId;
+        this.eventQueue.push(event);
+        if (this.eventQueue.length >= 20) this.flushEvents();
+    }
+
+    recordBattle(result) {
+        if (!this.currentEnemy) return;
+        this.recordEvent({
+            type: 'battle',
+            level: this.currentEnemy.level || this.player.lv,
+            enemy: this.currentEnemy.id,
+            result: result
+        });
+    }
+
+    flushEvents(beacon = false) {
+        if (!this.eventQueue || this.eventQueue.length === 0) return;
+        const events = this.eventQueue.splice(0, 500);
+        const body = events.map(e => JSON.stringify(e)).join('\n') + '\n';
+        if (beacon && navigator.sendBeacon) {
+            navigator.sendBeacon('api/events', new Blob([body], { type: 'application/x-ndjson' }));
+            return;
+        }
+        fetch('api/events', { method: 'POST', headers: { 'Content-Type': 'application/x-ndjson' }, body: body })
+            .then(res => {
+                // 404: no analytics on this server; 503: busy, try again later
+                if (res.status === 503) return Promise.reject(new Error('busy'));
+            })
+            .catch(() => {
+                if (this.eventQueue.length < 500) this.eventQueue.unshift(...events);
+            });
+    }
+
     saveGame() {
         const saveData = {
             player: this.player,
@@ -1216,6 +1559,53 @@ class GameController {
         };
         localStorage.setItem('mathQuestSave', JSON.stringify(saveData));
         console.log("Game Saved", saveData);
+        this.syncSave(saveData);
+    }
+
+    saveUrl() {
+        return `api/save/${encodeURIComponent(this.playerId)}`;
+    }
+
+    syncSave(saveData) {
+        // Upload to the server; 'mathQuestSaveDirty' stays set until it confirms
+        if (!this.playerId) return;
+        localStorage.setItem('mathQuestSaveDirty', '1');
+        fetch(this.saveUrl(), {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(saveData),
+            keepalive: true
+        })
+            .then(res => res.ok ? res.json() : Promise.reject(new Error(`HTTP ${res.status}`)))
+            .then(result => {
+                localStorage.setItem('mathQuestSaveUpdated', result.updated);
+                localStorage.removeItem('mathQuestSaveDirty');
+            })
+            .catch(e => console.warn("Save sync failed", e));
+    }
+
+    loadRemoteSave() {
+        // Progress saved on another tablet wins if it is newer than ours.
+        // Unsynced local progress is uploaded instead.
+        if (!this.playerId) return;
+        const localSave = localStorage.getItem('mathQuestSave');
+        if (localSave && localStorage.getItem('mathQuestSaveDirty')) {
+            this.syncSave(JSON.parse(localSave));
+            return;
+        }
+        fetch(this.saveUrl())
+            .then(res => res.ok ? res.json() : null)
+            .then(remote => {
+                if (!remote) return;
+                const localUpdated = Number(localStorage.getItem('mathQuestSaveUpdated') || 0);
+                if (remote.updated <= localUpdated) return;
+                if (!this.screens.title.classList.contains('active')) return; // Don't swap mid-adventure
+                localStorage.setItem('mathQuestSave', JSON.stringify(remote.data));
+                localStorage.setItem('mathQuestSaveUpdated', remote.updated);
+                this.loadGame();
+                this.updatePlayerStats();
+            })
+            .catch(e => console.warn("Save sync unavailable", e));
     }
 
     loadGame() {
@@ -1241,6 +1631,14 @@ class GameController {
     resetGame() {
         if (confirm("ぼうけんの しょ を けします。\nほんとうに よろしいですか？")) {
             localStorage.removeItem('mathQuestSave');
+            localStorage.removeItem('mathQuestSaveUpdated');
+            localStorage.removeItem('mathQuestSaveDirty');
+            if (this.playerId) {
+                fetch(this.saveUrl(), { method: 'DELETE', keepalive: true })
+                    .catch(() => { })
+                    .then(() => location.reload());
+                return;
+            }
             location.reload();
         }
     }
@@ -1255,13 +1653,49 @@ class BGMController {
         this.intervalIds = [];
         this.isPlaying = false;
         this.currentType = null;
+        this.samples = {}; // name -> decoded AudioBuffer from render_audio.py
+        this.source = null; // Looping BGM buffer
     }
 
     init() {
         if (!this.audioCtx) {
             const AudioContext = window.AudioContext || window.webkitAudioContext;
             this.audioCtx = new AudioContext();
+            this.loadSamples();
+        }
+    }
+
+    // Pre-rendered sounds (render_audio.py writes assets/audio.json). Until one
+    // is decoded, or if it was never rendered, the oscillators play instead.
+    loadSamples() {
+        fetch('assets/audio.json')
+            .then(response => response.ok ? response.json() : {})
+            .then(index => Object.keys(index).forEach(name => {
+                fetch(index[name].url)
+                    .then(response => response.arrayBuffer())
+                    // Callback form: older Safari has no promise-based decodeAudioData
+                    .then(data => new Promise((resolve, reject) => this.audioCtx.decodeAudioData(data, resolve, reject)))
+                    .then(buffer => { this.samples[name] = { buffer: buffer, info: index[name] }; })
+                    .catch(e => console.warn("Sound not loaded: " + name, e));
+            }))
+            .catch(() => {});
+    }
+
+    playSample(name) {
+        // Returns the playing source, or null if the sound isn't loaded
+        const sample = this.samples[name];
+        if (!sample || !this.audioCtx) return null;
+        if (this.audioCtx.state === 'suspended') this.audioCtx.resume();
+        const source = this.audioCtx.createBufferSource();
+        source.buffer = sample.buffer;
+        if (sample.info.loopEnd) {
+            source.loop = true;
+            source.loopStart = sample.info.loopStart;
+            source.loopEnd = sample.info.loopEnd;
         }
+        source.connect(this.audioCtx.destination);
+        source.start();
+        return source;
     }
 
     resumeAudio() {
@@ -1285,18 +1719,6 @@ class BGMController {
             source.connect(this.audioCtx.destination);
             source.start(0);
             console.log("Audio unlocked via silent buffer");
-
-            // Also warm up HTML5 Audio elements
-            const audios = document.querySelectorAll('audio');
-            audios.forEach(a => {
-                a.volume = 0;
-                a.play().then(() => {
-                    a.pause();
-                    a.currentTime = 0;
-                    a.volume = 1;
-                }).catch(e => console.log("Warmup failed", e));
-            });
-
         } catch (e) {
             console.error("Audio unlock failed", e);
         }
@@ -1304,6 +1726,7 @@ class BGMController {
 
     playSFX(type) {
         if (!this.audioCtx) this.init();
+        if (this.playSample('sfx_' + type)) return;
         if (this.audioCtx.state === 'suspended') this.audioCtx.resume();
 
         const ctx = this.audioCtx;
@@ -1380,6 +1803,9 @@ class BGMController {
             this.audioCtx.resume();
         }
 
+        this.source = this.playSample('bgm_' + type);
+        if (this.source) return;
+
         if (type === 'battle') {
             this.playBattleTheme();
         } else if (type === 'boss') {
@@ -1394,6 +1820,10 @@ class BGMController {
         this.currentType = null;
         this.intervalIds.forEach(id => clearInterval(id));
         this.intervalIds = [];
+        if (this.source) {
+            this.source.stop();
+            this.source = null;
+        }
         this.stopSound();
     }
 
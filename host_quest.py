@@ -2,10 +2,44 @@ import socket
 import http.server
 import socketserver
 import os
+import re
+import signal
+import argparse
+import json
+import time
+import threading
+import email.utils
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from asset_cache import AssetCache, MAX_BYTES
+from asset_bundle import AssetBundle, BUNDLE_FILE
+from save_store import SaveStore, SAVE_DB, MAX_SAVE_BYTES
+from event_log import EventLog, EVENTS_DIR, MAX_BATCH_BYTES, MAX_BATCH_EVENTS, parse_batch
+from build_manifest import load_manifest, preload_header
+from build_dist import DIST_DIR, HASHED_RE
 
 # Port to serve on
 PORT = 8001 # Changed port to avoid conflict with flag-quiz-app
 
+# Production mode defaults
+WORKERS = 32 # Max connections handled at once (enough for a classroom of ~30 devices)
+KEEPALIVE_TIMEOUT = 5 # Seconds an idle keep-alive connection may hold a worker
+MISS_MAX_AGE = 60 # Seconds browsers may cache a 404 for a missing asset
+LOG_INTERVAL = 60 # Log a repeated 404 for the same path at most this often
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600 # For content-hashed files from build_dist.py
+RELOAD_WAIT = 20 # Seconds a --prod worker holds a live-reload poll open waiting for a rebuild
+
+# JSON API: GET/PUT/DELETE /api/save/<player> (POST works like PUT),
+# POST /api/events (JSON lines), GET /api/stats,
+# GET /api/reload?v=<version> (live reload; POST from localhost bumps the version)
+API_PREFIX = "/api/"
+SAVE_API = "/api/save/"
+EVENTS_API = "/api/events"
+STATS_API = "/api/stats"
+RELOAD_API = "/api/reload"
+PLAYER_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
 # Find the best local IP address
 def get_ip():
     s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -19,32 +53,656 @@ def get_ip():
         s.close()
     return IP
 
-IP_ADDRESS = get_ip()
+def print_banner(port):
+    ip_address = get_ip()
+    print(f"\n\n{'='*40}")
+    print(f"  🏰 さんすうクエスト サーバー起動中！")
+    print(f"  PCやスマホのブラウザでアクセスしてね！")
+    print(f"\n  http://localhost:{port}")
+    print(f"  http://{ip_address}:{port}")
+    print(f"\n{'='*40}\n")
+    print(" (おわるときは、この画面で Ctrl と C を同時におしてね)")
+
+class AccessLog:
+    # JSON-lines access log, one object per request (analyze_log.py reads it)
+    def __init__(self, path):
+        self.file = open(path, "a", encoding="utf-8", buffering=1)
+        self.lock = threading.Lock()
+
+    def write(self, entry):
+        line = json.dumps(entry, ensure_ascii=False)
+        with self.lock:
+            self.file.write(line + "\n")
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+class LiveReload:
+    # Version the open pages poll; bumped after each watch-mode rebuild
+    def __init__(self):
+        self.started = int(time.time())
+        self.count = 0
+        self.changed = threading.Condition()
+
+    @property
+    def version(self):
+        # The start time makes a restarted server count as a change too
+        return f"{self.started}-{self.count}"
+
+    def bump(self):
+        with self.changed:
+            self.count += 1
+            self.changed.notify_all()
+
+    def wait(self, known, timeout):
+        # Current version, once it differs from `known` or after timeout seconds
+        with self.changed:
+            self.changed.wait_for(lambda: self.version != known, timeout)
+            return self.version
+
+class CountingWriter:
+    # Wraps wfile to count the bytes sent (headers + body)
+    def __init__(self, raw):
+        self.raw = raw
+        self.count = 0
+
+    def write(self, data):
+        n = self.raw.write(data)
+        self.count += len(data) if n is None else n
+        return n
+
+    def flush(self):
+        self.raw.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
+class QuestHandler(http.server.SimpleHTTPRequestHandler):
+    extensions_map = {
+        **http.server.SimpleHTTPRequestHandler.extensions_map,
+        ".js": "application/javascript",
+    }
+    access_log = None # AccessLog, set by main() with --access-log
+    save_store = None # SaveStore behind /api/save/, set by main()
+    event_log = None # EventLog behind /api/events and /api/stats, set by main()
+    preload_links = None # Link header for the page, from asset-manifest.json
+    sets_cache_control = False # Subclasses that send Cache-Control themselves
+    live_reload = None # LiveReload behind /api/reload, set by main() with --watch/--live-reload
+    reload_wait = 0 # The dev server is single-threaded, so reload polls answer right away
+
+    def setup(self):
+        super().setup()
+        self.wfile = CountingWriter(self.wfile)
+
+    def handle_one_request(self):
+        self.status = None
+        self.cache_status = "-"
+        self.requestline = ""
+        # parse_request sends its 400/505 before setting these; reset them so
+        # that is logged (not a previous keep-alive request's path)
+        self.command = None
+        self.path = ""
+        self.headers = None
+        self.wfile.count = 0
+        start = time.perf_counter()
+        super().handle_one_request()
+        if self.access_log is not None and self.status is not None:
+            self.access_log.write({
+                "ts": round(time.time(), 3),
+                "client": self.client_address[0],
+                "method": self.command,
+                "path": self.path,
+                "status": self.status,
+                "bytes": self.wfile.count,
+                "ms": round((time.perf_counter() - start) * 1000, 3),
+                "cache": self.cache_status,
+                "ua": self.headers.get("User-Agent", "") if self.headers else "",
+            })
+
+    def send_response(self, code, message=None):
+        self.status = code
+        super().send_response(code, message)
+
+    def end_headers(self):
+        # Let the browser fetch the critical assets while it parses the page
+        if self.preload_links and self.status == 200 and self.command == "GET" \
+                and self.path.split("?", 1)[0] in ("/", "/index.html"):
+            self.send_header("Link", self.preload_links)
+        if not self.sets_cache_control and self.status in (200, 206) and self.command in ("GET", "HEAD"):
+            cache_control = self.cache_control()
+            if cache_control:
+                self.send_header("Cache-Control", cache_control)
+        super().end_headers()
+
+    def cache_control(self, default=None):
+        # Content-hashed names (dist/ builds) never change content, so browsers
+        # can keep them for good without revalidating
+        if HASHED_RE.search(self.path.split("?", 1)[0]):
+            return f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+        return default
+
+    def do_GET(self):
+        if self.path.startswith(API_PREFIX):
+            self.send_api()
+        else:
+            super().do_GET()
 
-print(f"\n\n{'='*40}")
-print(f"  🏰 さんすうクエスト サーバー起動中！")
-print(f"  PCやスマホのブラウザでアクセスしてね！")
-print(f"\n  http://localhost:{PORT}")
-print(f"  http://{IP_ADDRESS}:{PORT}")
-print(f"\n{'='*40}\n")
-print(" (おわるときは、この画面で Ctrl と C を同時におしてね)")
+    def do_PUT(self):
+        self.send_api()
 
-# Allow playing in the current directory
-os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    do_POST = do_PUT # navigator.sendBeacon can only POST
+    do_DELETE = do_PUT
 
-Handler = http.server.SimpleHTTPRequestHandler
-# Prevent caching so updates appear immediately
-Handler.extensions_map.update({
-    ".js": "application/javascript",
-})
+    def send_json(self, code, body):
+        # body is a dict, or already-encoded JSON text
+        if not isinstance(body, str):
+            body = json.dumps(body, ensure_ascii=False)
+        data = body.encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(data)
 
-# Allow reusing the address to avoid "Address already in use" errors during quick restarts
-socketserver.TCPServer.allow_reuse_address = True
+    def read_body(self, max_bytes):
+        # Request body, or None after sending an error response
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0 or length > max_bytes:
+            self.close_connection = True # Body left unread
+            self.send_json(413 if length > max_bytes else 400, {"error": "bad Content-Length"})
+            return None
+        return self.rfile.read(length)
 
-with socketserver.TCPServer(("", PORT), Handler) as httpd:
-    print(f"Serving at port {PORT}...")
+    def send_api(self):
+        path = self.path.split("?", 1)[0]
+        if path.startswith(SAVE_API) and self.save_store is not None:
+            return self.send_save_api(path[len(SAVE_API):])
+        if path == EVENTS_API and self.event_log is not None:
+            return self.send_events_api()
+        if path == STATS_API and self.event_log is not None and self.command == "GET":
+            return self.send_json(200, self.event_log.summary())
+        if path == RELOAD_API and self.live_reload is not None:
+            return self.send_reload_api()
+        self.send_json(404, {"error": "not found"})
+
+    def send_save_api(self, player):
+        if not PLAYER_RE.match(player):
+            return self.send_json(400, {"error": "invalid player id"})
+
+        if self.command == "GET":
+            record = self.save_store.get(player)
+            if record is None:
+                return self.send_json(404, {"error": "no save"})
+            # data is stored as JSON text, so splice it in rather than re-encoding
+            head = json.dumps({"player": player, "updated": record["updated"]}, ensure_ascii=False)
+            return self.send_json(200, head[:-1] + ', "data": ' + record["data"] + "}")
+
+        if self.command == "DELETE":
+            self.save_store.delete(player)
+            return self.send_json(200, {"player": player})
+        if self.command not in ("PUT", "POST"):
+            return self.send_json(405, {"error": "method not allowed"})
+        body = self.read_body(MAX_SAVE_BYTES)
+        if body is None:
+            return
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return self.send_json(400, {"error": "body must be JSON"})
+        if not isinstance(data, dict):
+            return self.send_json(400, {"error": "save must be a JSON object"})
+        record = self.save_store.put(player, json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+        self.send_json(200, {"player": player, "updated": record["updated"]})
+
+    def send_events_api(self):
+        # JSON-lines batch of answer/battle events; never waits on the disk
+        if self.command != "POST":
+            return self.send_json(405, {"error": "method not allowed"})
+        body = self.read_body(MAX_BATCH_BYTES)
+        if body is None:
+            return
+        events, rejected = parse_batch(body.decode("utf-8", errors="replace"))
+        if len(events) > MAX_BATCH_EVENTS:
+            return self.send_json(413, {"error": f"at most {MAX_BATCH_EVENTS} events per batch"})
+        if not self.event_log.submit(events):
+            self.send_response(503)
+            self.send_header("Retry-After", "5")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_json(202, {"accepted": len(events), "rejected": rejected})
+
+    def send_reload_api(self):
+        if self.command == "GET":
+            known = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query).get("v", [""])[0]
+            version = self.live_reload.version
+            if known == version and self.reload_wait > 0:
+                version = self.live_reload.wait(known, self.reload_wait)
+            return self.send_json(200, {"version": version})
+        if self.command != "POST":
+            return self.send_json(405, {"error": "method not allowed"})
+        # Only watch.py --notify on this machine may trigger a reload
+        if self.client_address[0] not in ("127.0.0.1", "::1"):
+            return self.send_json(403, {"error": "forbidden"})
+        self.live_reload.bump()
+        self.send_json(200, {"version": self.live_reload.version})
+
+    def log_request(self, code="-", size="-"):
+        # Open pages poll the reload endpoint constantly
+        if str(code) == "200" and self.path.startswith(RELOAD_API):
+            return
+        super().log_request(code, size)
+
+def parse_range(header, size):
+    # Single "bytes=" range -> (start, end) inclusive; None to serve the whole
+    # file (no/unsupported/multi range); ValueError if unsatisfiable.
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[len("bytes="):].strip().partition("-")
     try:
-        httpd.serve_forever()
-    except KeyboardInterrupt:
+        if first == "":
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length <= 0:
+                raise ValueError("empty suffix range")
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        if first == "" or first.isdigit():
+            raise
+        return None
+    if start >= size or end < start:
+        raise ValueError("unsatisfiable range")
+    return start, min(end, size - 1)
+
+class KeepAliveHandler(QuestHandler):
+    # HTTP/1.1 so browsers reuse one connection for the page and all its assets.
+    # Files are sent with socket.sendfile (zero-copy) and honour Range requests,
+    # which mobile Safari uses for <audio>.
+    protocol_version = "HTTP/1.1"
+    timeout = KEEPALIVE_TIMEOUT
+    # Headers and small bodies go out as separate writes; with Nagle on, a
+    # reused connection stalls ~40 ms on the client's delayed ACK
+    disable_nagle_algorithm = True
+    sets_cache_control = True
+    reload_wait = RELOAD_WAIT
+    body_range = None # (offset, count) of the file body to send
+
+    def send_head(self):
+        self.body_range = None
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) or self.path.split("?", 1)[0].endswith("/"):
+            return super().send_head()
+        try:
+            f = open(path, "rb")
+        except OSError:
+            return super().send_head()
+
+        try:
+            fs = os.fstat(f.fileno())
+            size = fs.st_size
+            last_modified = self.date_time_string(fs.st_mtime)
+
+            # Conditional GET, as in SimpleHTTPRequestHandler
+            if "If-Modified-Since" in self.headers and "If-None-Match" not in self.headers:
+                try:
+                    since = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+                    if since.tzinfo is not None and int(fs.st_mtime) <= since.timestamp():
+                        self.send_response(304)
+                        self.end_headers()
+                        f.close()
+                        return None
+                except (TypeError, IndexError, OverflowError, ValueError):
+                    pass
+
+            byte_range = None
+            if_range = self.headers.get("If-Range")
+            if if_range is None or if_range == last_modified:
+                try:
+                    byte_range = parse_range(self.headers.get("Range"), size)
+                except ValueError:
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    f.close()
+                    return None
+
+            if byte_range:
+                start, end = byte_range
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            else:
+                start, end = 0, size - 1
+                self.send_response(200)
+            self.send_header("Content-Type", self.guess_type(path))
+            self.send_header("Content-Length", str(end - start + 1))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Last-Modified", last_modified)
+            cache_control = self.cache_control()
+            if cache_control:
+                self.send_header("Cache-Control", cache_control)
+            self.end_headers()
+            self.body_range = (start, end - start + 1)
+            return f
+        except:
+            f.close()
+            raise
+
+    def copyfile(self, source, outputfile):
+        if self.body_range is None:
+            return super().copyfile(source, outputfile)
+        offset, count = self.body_range
+        if count > 0:
+            # Kernel-side copy; falls back to send() where sendfile is unavailable
+            self.wfile.count += self.connection.sendfile(source, offset, count)
+
+class LogLimiter:
+    # Lets one message per key through every interval and counts the rest
+    def __init__(self, interval=LOG_INTERVAL):
+        self.interval = interval
+        self.state = {} # key -> [last logged time, suppressed count]
+        self.lock = threading.Lock()
+
+    def allow(self, key):
+        # Returns None to suppress, else the number suppressed since the last log
+        now = time.monotonic()
+        with self.lock:
+            last = self.state.get(key)
+            if last is None or now - last[0] >= self.interval:
+                suppressed = last[1] if last else 0
+                self.state[key] = [now, 0]
+                return suppressed
+            last[1] += 1
+            return None
+
+class CachedHandler(KeepAliveHandler):
+    # Serves files from an AssetCache (RAM, precomputed ETags, pre-compressed
+    # text); anything the cache can't hold falls through to the disk handler.
+    # Missing files are remembered and answered with a bodiless, cacheable 404.
+    cache = None
+    miss_log = LogLimiter()
+
+    def do_GET(self):
+        if self.path.startswith(API_PREFIX) or not self.send_cached(send_body=True):
+            super().do_GET()
+
+    def do_HEAD(self):
+        if not self.send_cached(send_body=False):
+            super().do_HEAD()
+
+    def cache_key(self):
+        # Path relative to the served directory, or None to let the disk handler decide
+        url_path = self.path.split("?", 1)[0].split("#", 1)[0]
+        if url_path.startswith(API_PREFIX):
+            return None
+        path = self.translate_path(self.path)
+        if url_path.endswith("/"):
+            path = os.path.join(path, "index.html")
+        rel_path = os.path.relpath(path, self.directory)
+        if rel_path.startswith(".."):
+            return None
+        return rel_path.replace(os.sep, "/")
+
+    def send_cached(self, send_body):
+        if self.cache is None:
+            return False
+        rel_path = self.cache_key()
+        if rel_path is None:
+            return False
+        if self.cache.is_missing(rel_path):
+            self.cache_status = "negative"
+            self.send_missing()
+            return True
+        asset, hit = self.cache.lookup(rel_path)
+        if asset is None:
+            # A directory without index.html gets a listing from the disk handler
+            if self.path.split("?", 1)[0].endswith("/") or os.path.exists(os.path.join(self.directory, rel_path)):
+                self.cache_status = "bypass"
+                return False
+            self.cache.mark_missing(rel_path)
+            self.cache_status = "miss"
+            self.send_missing()
+            return True
+        self.cache_status = "hit" if hit else "miss"
+
+        body, etag, encoding = asset.select(self.headers.get("Accept-Encoding"))
+
+        byte_range = None
+        if "Range" in self.headers and self.headers.get("If-Range", asset.etag) in (asset.etag, asset.last_modified):
+            # Ranges are served from the identity body
+            body, etag, encoding = asset.body, asset.etag, None
+            try:
+                byte_range = parse_range(self.headers["Range"], len(body))
+            except ValueError:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return True
+
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match:
+            tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+            if etag in tags or "*" in tags:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", self.cache_control("no-cache"))
+                self.end_headers()
+                return True
+
+        if byte_range:
+            start, end = byte_range
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+            body = memoryview(body)[start:end + 1]
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", asset.last_modified)
+        # Revalidate every time (unchanged files come back as a bodiless 304),
+        # except content-hashed files
+        self.send_header("Cache-Control", self.cache_control("no-cache"))
+        if asset.encodings:
+            self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+        return True
+
+    def send_missing(self):
+        # No error page, no filesystem probe
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.send_header("Cache-Control", f"public, max-age={MISS_MAX_AGE}")
+        self.end_headers()
+
+    def log_request(self, code="-", size="-"):
+        if str(code) != "404":
+            return super().log_request(code, size)
+        suppressed = self.miss_log.allow(self.path.split("?", 1)[0])
+        if suppressed is None:
+            return
+        if suppressed:
+            self.log_message('"%s" 404 (%d repeats not logged)', self.requestline, suppressed)
+        else:
+            super().log_request(code, size)
+
+class PooledHTTPServer(http.server.HTTPServer):
+    # Hands each connection to a bounded thread pool instead of serving one at a time.
+    # Connections beyond the worker limit wait in the pool's queue.
+    allow_reuse_address = True
+    request_queue_size = 128 # listen() backlog; the default 5 drops a classroom connecting at once
+
+    def __init__(self, server_address, handler_class, workers=WORKERS):
+        super().__init__(server_address, handler_class)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="quest")
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        # Let in-flight requests finish (idle keep-alives end within KEEPALIVE_TIMEOUT)
+        self.pool.shutdown(wait=True)
+
+def serve_dev(port):
+    # Allow reusing the address to avoid "Address already in use" errors during quick restarts
+    socketserver.TCPServer.allow_reuse_address = True
+
+    with socketserver.TCPServer(("", port), QuestHandler) as httpd:
+        print(f"Serving at port {port}...")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\nStopping server...")
+            httpd.shutdown()
+
+def serve_production(port, workers=WORKERS, cache_bytes=MAX_BYTES, preload_files=None, bundle=None):
+    handler = KeepAliveHandler
+    cache = None
+    if bundle is not None:
+        # Every response is a slice of the mapped archive
+        CachedHandler.cache = bundle
+        handler = CachedHandler
+    elif cache_bytes > 0:
+        cache = AssetCache(os.getcwd(), max_bytes=cache_bytes)
+        if preload_files is None:
+            cache.preload()
+        else:
+            cache.preload(files=preload_files)
+        cache.start_watching()
+        CachedHandler.cache = cache
+        handler = CachedHandler
+
+    httpd = PooledHTTPServer(("", port), handler, workers=workers)
+
+    def stop(signum, frame):
+        # shutdown() blocks until serve_forever returns, so call it off the main thread
         print("\nStopping server...")
-        httpd.shutdown()
+        threading.Thread(target=httpd.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    print(f"Serving at port {port} (production mode, {workers} workers, HTTP/1.1 keep-alive)...")
+    try:
+        httpd.serve_forever()
+    finally:
+        httpd.server_close()
+        if cache is not None:
+            cache.stop_watching()
+        print("Server stopped.")
+
+def main():
+    parser = argparse.ArgumentParser(description="さんすうクエスト local server")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--prod", action="store_true",
+                        help="threaded HTTP/1.1 keep-alive server for a whole classroom")
+    parser.add_argument("--workers", type=int, default=WORKERS,
+                        help=f"max concurrent connections in --prod mode (default: {WORKERS})")
+    parser.add_argument("--access-log", metavar="PATH",
+                        help="append a JSON-lines access log (latency, bytes, cache) to PATH")
+    parser.add_argument("--cache-mb", type=int, default=MAX_BYTES // (1024 * 1024),
+                        help="in-memory asset cache size in --prod mode, 0 to disable")
+    parser.add_argument("--save-db", nargs="?", const=SAVE_DB, metavar="PATH",
+                        help=f"enable the /api/save/ progress sync, stored in this SQLite file (default: {SAVE_DB}). "
+                             "Saves are keyed by player name only, so anyone on the network can overwrite them")
+    parser.add_argument("--events-dir", nargs="?", const=EVENTS_DIR, metavar="DIR",
+                        help=f"enable answer analytics (/api/events, /api/stats), kept in DIR (default: {EVENTS_DIR})")
+    parser.add_argument("--dist", action="store_true",
+                        help="serve the content-hashed build from build_dist.py (dist/)")
+    parser.add_argument("--bundle", nargs="?", const=BUNDLE_FILE, metavar="PATH",
+                        help=f"serve everything from one archive built by asset_bundle.py (default: {os.path.basename(BUNDLE_FILE)}; implies --prod)")
+    parser.add_argument("--live-reload", action="store_true",
+                        help="let open pages reload when told to (POST /api/reload, e.g. from watch.py --notify)")
+    parser.add_argument("--watch", action="store_true",
+                        help="rebuild what changed while editing (see watch.py) and reload open pages")
+    args = parser.parse_args()
+
+    if args.watch and args.dist:
+        parser.error("--watch serves the sources; run watch.py --dist --notify URL beside a --dist --live-reload server instead")
+
+    if args.dist and not os.path.isfile(os.path.join(DIST_DIR, "index.html")):
+        parser.error(f"no build in {DIST_DIR}, run build_dist.py first")
+
+    bundle = None
+    if args.bundle:
+        if args.dist or args.watch:
+            parser.error("--bundle serves a fixed archive; rebuild it with asset_bundle.py --build instead")
+        try:
+            bundle = AssetBundle(args.bundle)
+        except (OSError, ValueError) as e:
+            parser.error(f"can't open bundle: {e}")
+        print(f"Serving {len(bundle.entries)} files ({bundle.nbytes // 1024} KB) mapped from {bundle.path}")
+
+    print_banner(args.port)
+
+    if args.access_log:
+        QuestHandler.access_log = AccessLog(os.path.abspath(args.access_log))
+
+    if args.save_db:
+        QuestHandler.save_store = SaveStore(os.path.abspath(args.save_db))
+        print(f"Saves stored in {QuestHandler.save_store.path} (no login: only use on a trusted network)")
+
+    if args.events_dir:
+        QuestHandler.event_log = EventLog(os.path.abspath(args.events_dir))
+        print(f"Events logged to {QuestHandler.event_log.directory}")
+
+    # Allow playing in the current directory
+    os.chdir(DIST_DIR if args.dist else os.path.dirname(os.path.abspath(__file__)))
+    # dist/ keeps the hashed game.js etc. at the top level
+    preload_files = [n for n in sorted(os.listdir(".")) if os.path.isfile(n) and not n.startswith(".")] if args.dist else None
+
+    QuestHandler.preload_links = preload_header(bundle.load_manifest() if bundle else load_manifest(os.getcwd()))
+    if QuestHandler.preload_links is None:
+        print("No asset-manifest.json (run build_manifest.py), sending no preload hints.")
+
+    if args.live_reload or args.watch:
+        QuestHandler.live_reload = LiveReload()
+    if args.watch:
+        import watch
+
+        def rebuilt():
+            # The asset cache's own watcher polls once a second; don't let a
+            # reloading page get there first
+            if CachedHandler.cache is not None:
+                CachedHandler.cache.refresh()
+            QuestHandler.live_reload.bump()
+
+        watcher = watch.Watcher(os.getcwd(), on_rebuild=rebuilt)
+        threading.Thread(target=watcher.run, daemon=True, name="watch").start()
+
+    try:
+        if args.prod or bundle:
+            serve_production(args.port, args.workers, args.cache_mb * 1024 * 1024, preload_files, bundle)
+        else:
+            serve_dev(args.port)
+    finally:
+        if QuestHandler.save_store is not None:
+            QuestHandler.save_store.close()
+        if QuestHandler.event_log is not None:
+            QuestHandler.event_log.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import tempfile
+import subprocess
+import http.client
+from urllib.parse import urlsplit
+
+# What a device fetches on "ぼうけんにでる": the page, scripts, styles and a few sprites
+DEFAULT_PATHS = [
+    "/",
+    "/style.css",
+    "/enemies/index.js",
+    "/enemies/C.js",
+    "/game.js",
+    "/assets/hero.png",
+    "/assets/title_bg.png",
+    "/assets/uma_yeti.png",
+    "/assets/uma_nessie.png",
+]
+
+# Roughly what game.js saveGame() uploads after a battle
+SAVE_BODY = json.dumps({
+    "player": {"name": "ゆうしゃ", "lv": 7, "hp": 52, "maxHp": 60, "mp": 9, "maxMp": 12, "exp": 41, "nextExp": 70},
+    "lvl1BossDefeated": True,
+    "bossDefeated": False,
+}, ensure_ascii=False).encode("utf-8")
+
+# One /api/events post: a battle's worth of answers plus its result
+EVENTS_PER_BATCH = 20
+EVENTS_BODY = "".join(
+    json.dumps({"type": "answer", "level": 5, "op": "+-"[i % 2], "correct": i % 3 != 0, "ms": 2500 + i * 40,
+                "enemy": "F003", "player": "loadtest"}) + "\n"
+    for i in range(EVENTS_PER_BATCH - 1)
+).encode("utf-8") + b'{"type": "battle", "level": 5, "enemy": "F003", "result": "win", "player": "loadtest"}\n'
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def client_loop(host, port, requests, deadline, latencies, errors, lock):
+    # One simulated device: sends the (method, path, body) requests in order,
+    # reusing the connection whenever the server allows keep-alive.
+    conn = None
+    local = []
+    failed = 0
+    while time.perf_counter() < deadline:
+        for method, path, body in requests:
+            if conn is None:
+                conn = http.client.HTTPConnection(host, port, timeout=10)
+            start = time.perf_counter()
+            try:
+                headers = {"Content-Type": "application/json"} if body is not None else {}
+                conn.request(method, path, body=body, headers=headers)
+                resp = conn.getresponse()
+                resp.read()
+                if resp.status >= 400:
+                    failed += 1
+                local.append(time.perf_counter() - start)
+                if resp.will_close:
+                    conn.close()
+                    conn = None
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                conn.close()
+                conn = None
+    if conn is not None:
+        conn.close()
+    with lock:
+        latencies.extend(local)
+        errors[0] += failed
+
+def run_load(url, clients, duration, paths=DEFAULT_PATHS, mode="pages"):
+    # mode "pages" fetches paths, "saves" PUTs one save per client,
+    # "events" posts batches of EVENTS_PER_BATCH analytics events
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client_requests(i):
+        if mode == "saves":
+            return [("PUT", f"/api/save/loadtest-{i}", SAVE_BODY)]
+        if mode == "events":
+            return [("POST", "/api/events", EVENTS_BODY)]
+        return [("GET", path, None) for path in paths]
+
+    threads = [threading.Thread(target=client_loop,
+                                args=(host, port, client_requests(i), deadline, latencies, errors, lock))
+               for i in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "rps": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+    }
+
+def print_result(label, result, mode="pages"):
+    print(f"{label:<12} {result['requests']:>7} req  {result['rps']:>8.1f} req/s  "
+          f"p50 {result['p50_ms']:>7.1f} ms  p95 {result['p95_ms']:>7.1f} ms  errors {result['errors']}"
+          + (f"  ({result['rps'] * EVENTS_PER_BATCH:,.0f} events/s)" if mode == "events" else ""))
+
+def wait_for_port(port, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket_conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            socket_conn.request("HEAD", "/")
+            socket_conn.getresponse()
+            socket_conn.close()
+            return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+def compare(clients, duration, base_port, mode="pages"):
+    # Start the default server and --prod on neighbouring ports and load both the same way
+    server = os.path.join(os.path.dirname(os.path.abspath(__file__)), "host_quest.py")
+    modes = [("dev", []), ("prod", ["--prod"])]
+    with tempfile.TemporaryDirectory() as tmp:
+        for offset, (label, extra) in enumerate(modes):
+            port = base_port + offset
+            # Throwaway save database and event log so benchmark data never reaches the real ones
+            save_db = os.path.join(tmp, f"{label}.sqlite3")
+            events_dir = os.path.join(tmp, f"{label}-events")
+            proc = subprocess.Popen([sys.executable, server, "--port", str(port),
+                                     "--save-db", save_db, "--events-dir", events_dir] + extra,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            try:
+                if not wait_for_port(port):
+                    print(f"{label}: server did not start on port {port}")
+                    continue
+                print_result(label, run_load(f"http://127.0.0.1:{port}", clients, duration, mode=mode), mode)
+            finally:
+                proc.terminate()
+                proc.wait()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test for host_quest.py")
+    parser.add_argument("--url", default="http://127.0.0.1:8001", help="server to load (ignored with --compare)")
+    parser.add_argument("--clients", type=int, default=30, help="concurrent simulated devices")
+    parser.add_argument("--duration", type=float, default=10, help="seconds to run")
+    parser.add_argument("--compare", action="store_true",
+                        help="start the default and --prod servers and compare them")
+    parser.add_argument("--base-port", type=int, default=8101, help="first port used by --compare")
+    parser.add_argument("--saves", dest="mode", action="store_const", const="saves", default="pages",
+                        help="benchmark the save API (each client PUTs its own save) instead of page loads")
+    parser.add_argument("--events", dest="mode", action="store_const", const="events",
+                        help=f"benchmark /api/events with batches of {EVENTS_PER_BATCH} events")
+    args = parser.parse_args()
+
+    print(f"{args.clients} clients, {args.duration:g}s, {args.mode}")
+    if args.compare:
+        compare(args.clients, args.duration, args.base_port, args.mode)
+    else:
+        print_result(args.url, run_load(args.url, args.clients, args.duration, mode=args.mode), args.mode)
@@ -0,0 +1,138 @@
+import os
+import re
+import json
+from PIL import Image, features
+
+ASSETS_DIR = "assets"
+
+# Downscaled variants written next to each sprite, e.g.
+#   assets/uma_yeti.png -> assets/uma_yeti-256w.png, assets/uma_yeti-256w.webp, ...
+# The game shows sprites at a few hundred CSS pixels, so 512w covers 2x displays.
+TARGET_WIDTHS = (256, 512)
+PALETTE_COLORS = 256
+WEBP_QUALITY = 80
+WEBP_METHOD = 4 # method=6 is ~100x slower for a few % smaller files
+AVIF_QUALITY = 60
+AVIF_SPEED = 8
+
+FORMATS = ["png", "webp"]
+if features.check("avif"):
+    FORMATS.append("avif")
+
+# Per-sprite variant sizes; enemy_compiler.py rebuilds enemyData (srcset) when it changes
+REPORT_FILE = "variants.json"
+
+VARIANT_RE = re.compile(r"-\d+w\.(png|webp|avif)$")
+
+def variant_params():
+    # Everything that affects the variant files (part of the pipeline cache key)
+    return {
+        "widths": list(TARGET_WIDTHS),
+        "palette_colors": PALETTE_COLORS,
+        "webp_quality": WEBP_QUALITY,
+        "webp_method": WEBP_METHOD,
+        "avif_quality": AVIF_QUALITY,
+        "avif_speed": AVIF_SPEED,
+        "formats": FORMATS,
+    }
+
+def is_variant(path):
+    return VARIANT_RE.search(os.path.basename(path)) is not None
+
+def variant_path(img_path, width, ext):
+    base, _ = os.path.splitext(img_path)
+    return f"{base}-{width}w.{ext}"
+
+def target_widths(width):
+    # Never upscale; sprites narrower than every target get no variants
+    return [w for w in TARGET_WIDTHS if w < width]
+
+def referenced_sprites():
+    # Basenames of the sprites the enemy table uses; nothing else gets variants
+    import enemy_compiler
+    return {os.path.basename(p) for p in enemy_compiler.sprite_images()}
+
+def variant_widths(img_path, width):
+    if os.path.basename(img_path) not in referenced_sprites():
+        return []
+    return target_widths(width)
+
+def has_variants(img_path):
+    with Image.open(img_path) as img:
+        width = img.size[0]
+    return all(os.path.exists(variant_path(img_path, w, ext))
+               for w in variant_widths(img_path, width) for ext in FORMATS)
+
+def save_variant(img, path, ext):
+    if ext == "png":
+        # Palette-quantized PNG (keeps the alpha channel)
+        img.quantize(colors=PALETTE_COLORS, method=Image.Quantize.FASTOCTREE).save(path, optimize=True)
+    elif ext == "webp":
+        img.save(path, "WEBP", quality=WEBP_QUALITY, method=WEBP_METHOD)
+    elif ext == "avif":
+        img.save(path, "AVIF", quality=AVIF_QUALITY, speed=AVIF_SPEED)
+    return os.path.getsize(path)
+
+def optimize_sprite(img_path):
+    # Writes the downscaled variants of one sprite (and drops stale ones of a
+    # sprite no enemy uses any more).
+    # Returns {"bytes": original size, "variants": {"256": {"png": bytes, ...}, ...}}
+    img = Image.open(img_path).convert("RGBA")
+    width, height = img.size
+    result = {"bytes": os.path.getsize(img_path), "variants": {}}
+
+    widths = variant_widths(img_path, width)
+    for path in [variant_path(img_path, w, ext) for w in TARGET_WIDTHS if w not in widths for ext in FORMATS]:
+        if os.path.exists(path):
+            os.remove(path)
+    for w in widths:
+        h = max(1, round(height * w / width))
+        small = img.resize((w, h), Image.LANCZOS)
+        sizes = {}
+        for ext in FORMATS:
+            sizes[ext] = save_variant(small, variant_path(img_path, w, ext), ext)
+        result["variants"][str(w)] = sizes
+        print(f"  {w}w: " + ", ".join(f"{ext} {size // 1024} KB" for ext, size in sizes.items()))
+    return result
+
+def load_report(assets_dir=ASSETS_DIR):
+    try:
+        with open(os.path.join(assets_dir, REPORT_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_report(report, assets_dir=ASSETS_DIR):
+    with open(os.path.join(assets_dir, REPORT_FILE), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+def update_report(entries, assets_dir=ASSETS_DIR):
+    # entries: {filename: optimize_sprite() result}
+    report = load_report(assets_dir)
+    report.update(entries)
+    referenced = referenced_sprites()
+    report = {name: entry for name, entry in report.items() if name in referenced}
+    save_report(report, assets_dir)
+
+    # Payload summary: originals vs. the smallest variant of each sprite
+    original = sum(e["bytes"] for e in report.values())
+    smallest = sum(min((s for v in e["variants"].values() for s in v.values()), default=e["bytes"])
+                   for e in report.values())
+    if original:
+        print(f"Sprite payload: {original // 1024} KB originals -> {smallest // 1024} KB smallest variants "
+              f"({original / max(smallest, 1):.1f}x smaller).")
+    return report
+
+def optimize_job(img_path):
+    # run_batch worker
+    print(f"Optimizing {img_path}...")
+    return 0, (os.path.basename(img_path), optimize_sprite(img_path))
+
+if __name__ == "__main__":
+    import glob
+    from fix_backgrounds import run_batch, parse_jobs_args
+
+    args = parse_jobs_args("Write downscaled PNG/WebP variants of assets/uma_*.png")
+    targets = sorted(p for p in glob.glob(os.path.join(ASSETS_DIR, "uma_*.png")) if not is_variant(p))
+    print(f"Found {len(targets)} sprites to optimize.")
+    update_report(dict(run_batch(optimize_job, targets, jobs=args.jobs)))
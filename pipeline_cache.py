@@ -0,0 +1,55 @@
+import os
+import json
+import hashlib
+
+# Persistent manifest of processed assets, so reruns only touch new or modified files.
+# Layout:
+#   {"params": <hash of pipeline parameters>,
+#    "files": {"uma_yeti.png": {"source": <sha256 before>, "output": <sha256 after>}, ...}}
+CACHE_FILE = ".pipeline_cache.json"
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def params_hash(params):
+    blob = json.dumps(params, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+def load_manifest(assets_dir, params):
+    # Returns an empty manifest if there is none yet or if the pipeline
+    # parameters (thresholds, border, ...) changed since it was written.
+    path = os.path.join(assets_dir, CACHE_FILE)
+    expected = params_hash(params)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"params": expected, "files": {}}
+
+    if manifest.get("params") != expected:
+        print("Pipeline parameters changed, invalidating cache.")
+        return {"params": expected, "files": {}}
+    manifest.setdefault("files", {})
+    return manifest
+
+def save_manifest(assets_dir, manifest):
+    path = os.path.join(assets_dir, CACHE_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def cached_output(manifest, name):
+    # Output hash recorded for an asset, or None
+    entry = manifest["files"].get(name)
+    return entry["output"] if entry else None
+
+def is_up_to_date(path, output_hash):
+    return output_hash is not None and os.path.exists(path) and file_hash(path) == output_hash
+
+def record(manifest, name, source_hash, output_hash):
+    manifest["files"][name] = {"source": source_hash, "output": output_hash}
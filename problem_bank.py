@@ -0,0 +1,172 @@
+import os
+import json
+import time
+import hashlib
+import argparse
+
+import numpy as np
+
+# Precomputes the arithmetic questions game.js would ask, so the client can
+# pick a row from a table instead of generating problems and distractors at
+# runtime. Mirrors generateMathProblem(level) / setupAnswerButtons in game.js;
+# keep the two in sync.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_DIR = os.path.join(BASE_DIR, "problems")
+
+# Rule tiers: (first level, max operand/sum, subtraction, missing operand)
+TIERS = [
+    (1, 10, False, False),
+    (3, 10, True, False),
+    (5, 20, True, False),
+    (7, 20, True, True),
+    (10, 30, True, True),
+]
+
+SAMPLES = 1_000_000 # Problems drawn per tier before deduplication
+BATCH_SIZE = 250_000
+BANK_SIZE = 1024 # Unique rows shipped to the client per tier
+SEED = 2026
+
+NUM_CHOICES = 4
+OFFSETS = np.array([-5, -4, -3, -2, -1, 1, 2, 3, 4, 5]) # Distractor = answer + offset, must be >= 0
+
+OP_ADD, OP_SUB = 0, 1
+MISSING_NONE, MISSING_FIRST, MISSING_SECOND = 0, 1, 2 # Which operand is shown as "?"
+FIELDS = ["n1", "n2", "op", "missing", "c0", "c1", "c2", "c3", "correct"]
+FIELD_BITS = 6 # Every field fits in 0..63 (max choice is 30 + 5)
+
+def tier_levels(index):
+    # (min_level, max_level or None) covered by TIERS[index]
+    min_level = TIERS[index][0]
+    max_level = TIERS[index + 1][0] - 1 if index + 1 < len(TIERS) else None
+    return min_level, max_level
+
+def generate_batch(rng, max_value, subtraction, missing, size):
+    # Returns an int16 array of shape (size, len(FIELDS))
+    n1 = rng.integers(0, max_value + 1, size)
+    if subtraction:
+        op = np.where(rng.random(size) > 0.5, OP_ADD, OP_SUB)
+    else:
+        op = np.full(size, OP_ADD)
+    # Same draws as game.js: n1 + n2 <= max for addition, n2 <= n1 for subtraction
+    n2_range = np.where(op == OP_ADD, max_value - n1, n1) + 1
+    n2 = (rng.random(size) * n2_range).astype(np.int64)
+    result = np.where(op == OP_ADD, n1 + n2, n1 - n2)
+
+    hidden = np.full(size, MISSING_NONE)
+    if missing:
+        # 40% of questions hide one operand, either one with equal odds
+        show = rng.random(size) > 0.6
+        which = np.where(rng.random(size) > 0.5, MISSING_FIRST, MISSING_SECOND)
+        hidden = np.where(show, which, MISSING_NONE)
+    answer = np.select([hidden == MISSING_FIRST, hidden == MISSING_SECOND], [n1, n2], result)
+
+    # Three distinct distractors drawn uniformly from the valid offsets:
+    # random sort keys, invalid (negative) candidates pushed to the end.
+    # There are always at least 5 valid candidates, so no retry loop.
+    candidates = answer[:, None] + OFFSETS[None, :]
+    keys = rng.random(candidates.shape)
+    keys[candidates < 0] = 2.0
+    picked = np.argpartition(keys, NUM_CHOICES - 1, axis=1)[:, :NUM_CHOICES - 1]
+    wrong = np.take_along_axis(candidates, picked, axis=1)
+
+    correct = rng.integers(0, NUM_CHOICES, size)
+    is_correct = np.arange(NUM_CHOICES)[None, :] == correct[:, None]
+    choices = np.empty((size, NUM_CHOICES), dtype=np.int64)
+    choices[is_correct] = answer
+    choices[~is_correct] = wrong.ravel()
+
+    return np.column_stack([n1, n2, op, hidden, choices, correct]).astype(np.int16)
+
+def pack_rows(rows):
+    # One int64 key per row so deduplication is a 1-D np.unique
+    keys = np.zeros(len(rows), dtype=np.int64)
+    for i in range(rows.shape[1]):
+        keys |= rows[:, i].astype(np.int64) << (FIELD_BITS * i)
+    return keys
+
+def unpack_rows(keys):
+    mask = (1 << FIELD_BITS) - 1
+    return np.column_stack([(keys >> (FIELD_BITS * i)) & mask for i in range(len(FIELDS))]).astype(np.int16)
+
+def build_tier(index, samples=SAMPLES, batch_size=BATCH_SIZE, seed=SEED):
+    # Unique rows for TIERS[index] and how often each was drawn
+    _, max_value, subtraction, missing = TIERS[index]
+    rng = np.random.default_rng([seed, index])
+    keys = np.empty(0, dtype=np.int64)
+    counts = np.empty(0, dtype=np.int64)
+    remaining = samples
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        batch_keys, batch_counts = np.unique(pack_rows(generate_batch(rng, max_value, subtraction, missing, size)),
+                                             return_counts=True)
+        # Merge into the running totals (memory stays bounded by the unique count)
+        keys, inverse = np.unique(np.concatenate([keys, batch_keys]), return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate([counts, batch_counts])).astype(np.int64)
+        remaining -= size
+    return unpack_rows(keys), counts
+
+def select_bank(rows, counts, bank_size, seed, index):
+    # Draws bank_size distinct rows weighted by frequency, so picking uniformly
+    # from the bank stays close to game.js's own distribution
+    if len(rows) <= bank_size:
+        return rows
+    rng = np.random.default_rng([seed, index, 1])
+    picked = rng.choice(len(rows), size=bank_size, replace=False, p=counts / counts.sum())
+    return rows[np.sort(picked)]
+
+def write_json(path, data):
+    text = json.dumps(data, separators=(",", ":"))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:8]
+
+def build_banks(output_dir=OUTPUT_DIR, samples=SAMPLES, bank_size=BANK_SIZE, seed=SEED, corpus_path=None):
+    os.makedirs(output_dir, exist_ok=True)
+    rel_dir = os.path.basename(os.path.normpath(output_dir))
+    shards = []
+    corpus = {}
+    for index in range(len(TIERS)):
+        start = time.perf_counter()
+        rows, counts = build_tier(index, samples, seed=seed)
+        elapsed = time.perf_counter() - start
+        min_level, max_level = tier_levels(index)
+        bank = select_bank(rows, counts, bank_size, seed, index)
+
+        name = f"lv{min_level}.json"
+        version = write_json(os.path.join(output_dir, name), {
+            "minLevel": min_level, "maxLevel": max_level,
+            "fields": FIELDS, "rows": bank.ravel().tolist(),
+        })
+        shards.append({
+            "minLevel": min_level, "maxLevel": max_level,
+            "file": f"{rel_dir}/{name}?v={version}", "count": len(bank), "unique": len(rows),
+        })
+        if corpus_path:
+            corpus[f"lv{min_level}_rows"] = rows
+            corpus[f"lv{min_level}_counts"] = counts
+
+        levels = f"Lv{min_level}-{max_level}" if max_level else f"Lv{min_level}+"
+        print(f"{levels:<8} {samples} drawn, {len(rows)} unique, {len(bank)} in bank "
+              f"({elapsed:.2f}s, {samples / elapsed:,.0f} problems/sec)")
+
+    write_json(os.path.join(output_dir, "index.json"),
+               {"seed": seed, "samples": samples, "fields": FIELDS, "shards": shards})
+    if corpus_path:
+        np.savez_compressed(corpus_path, fields=np.array(FIELDS), **corpus)
+        print(f"Wrote corpus to {corpus_path}")
+    return shards
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate per-level math problem banks for game.js")
+    parser.add_argument("--output", default=OUTPUT_DIR)
+    parser.add_argument("--samples", type=int, default=SAMPLES, help="problems drawn per level tier")
+    parser.add_argument("--bank-size", type=int, default=BANK_SIZE, help="unique rows kept per tier")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--corpus", help="also save every unique row with its count to this .npz file")
+    args = parser.parse_args()
+
+    build_banks(args.output, args.samples, args.bank_size, args.seed, args.corpus)
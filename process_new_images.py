@@ -1,15 +1,8 @@
 import os
 import shutil
-from PIL import Image
 
-# Import background removal logic
-try:
-    from fix_backgrounds import remove_background
-except ImportError:
-    # If import fails (e.g. running standalone), duplicate simple logic or warn
-    print("Warning: fix_backgrounds module not found. Background removal might be skipped if not integrated.")
-    def remove_background(path):
-        print(f"Mock background removal for {path}")
+import pipeline_cache
+from fix_backgrounds import run_batch, parse_jobs_args, pipeline_params, process_cached, update_manifest
 
 ASSETS_DIR = "assets"
 
@@ -58,40 +51,63 @@ ID_MAP = {
     "S014": "uma_light_being.png"
 }
 
-def process_images():
-    print("Starting image processing...")
-    
-    # List all files in assets
-    files = os.listdir(ASSETS_DIR)
-    
-    for filename in files:
+def plan_jobs(files):
+    # Group the work per target file: every new "<ID>_*.png" that maps to a target
+    # is moved onto it (in listing order, last one wins), and targets that are
+    # already renamed are re-processed. One job per target keeps workers from
+    # racing on the same file.
+    jobs = {}
+    for filename in sorted(files):
         # Check if file starts with one of our IDs
         found_id = None
         for icon_id in ID_MAP.keys():
             if filename.startswith(icon_id) and (filename.endswith(".png") or filename.endswith(".jpg") or filename.endswith(".jpeg")):
                 found_id = icon_id
                 break
-        
+
         if found_id:
             target_name = ID_MAP[found_id]
-            source_path = os.path.join(ASSETS_DIR, filename)
-            target_path = os.path.join(ASSETS_DIR, target_name)
-            
-            print(f"Found {found_id}: {filename} -> {target_name}")
-            
-            # Rename (Move)
-            shutil.move(source_path, target_path)
-            
-            # Process Background
-            print(f"  Removing background for {target_name}...")
-            remove_background(target_path)
-            
-        else:
+            jobs.setdefault(target_name, []).append((found_id, filename))
+        elif filename in ID_MAP.values():
             # Check if it IS the target name already (re-run case)
-            if filename in ID_MAP.values():
-                print(f"File already renamed: {filename}. Processing background just in case.")
-                target_path = os.path.join(ASSETS_DIR, filename)
-                remove_background(target_path)
+            jobs.setdefault(filename, [])
+    return list(jobs.items())
+
+def process_job(job):
+    # Rename + background removal (+ sprite variants) for one target; runs
+    # inside a worker process. Returns (pixels_removed, info) like
+    # fix_backgrounds.process_cached.
+    target_name, sources, cached_output = job
+    target_path = os.path.join(ASSETS_DIR, target_name)
+
+    if not sources:
+        print(f"File already renamed: {target_name}.")
+        return process_cached((target_path, cached_output))
+
+    for found_id, filename in sources:
+        print(f"Found {found_id}: {filename} -> {target_name}")
+
+        # Rename (Move)
+        shutil.move(os.path.join(ASSETS_DIR, filename), target_path)
+
+    # Process Background
+    print(f"  Removing background for {target_name}...")
+    return process_cached((target_path, None))
+
+def process_images(jobs=None, force=False):
+    print("Starting image processing...")
+
+    # Only new or modified files are processed; the manifest resets itself
+    # when the fix_backgrounds parameters change.
+    manifest = pipeline_cache.load_manifest(ASSETS_DIR, pipeline_params())
+
+    # List all files in assets
+    files = os.listdir(ASSETS_DIR)
+    work = [(target_name, sources, None if force else pipeline_cache.cached_output(manifest, target_name))
+            for target_name, sources in plan_jobs(files)]
+
+    update_manifest(manifest, run_batch(process_job, work, jobs=jobs))
 
 if __name__ == "__main__":
-    process_images()
+    args = parse_jobs_args("Rename new artwork to its uma_*.png name and remove backgrounds")
+    process_images(jobs=args.jobs, force=args.force)
@@ -0,0 +1,237 @@
+import os
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# lameenc is optional: without it the MP3s are encoded by an ffmpeg on PATH
+try:
+    import lameenc
+except ImportError:
+    lameenc = None
+
+# Renders the music and effects game.js synthesizes with WebAudio oscillators
+# into MP3s in assets/, so pages play one decoded buffer instead of
+# scheduling an oscillator per note. Each sound below is the same notes,
+# waveforms and gain/frequency automation as its game.js function; WebAudio
+# ramps are reproduced exactly and the waveforms are band-limited like the
+# browser's. BGM loops are rendered as two periods: pages loop the second
+# one (audio.json has the loop points), which stays seamless whatever
+# padding the MP3 encoder adds at the start.
+# A sound is only re-rendered when its definition (or the render settings)
+# changed. game.js falls back to the oscillators for anything not rendered.
+# Sound names are the file names pages used to request (bgm_*, sfx_*); the
+# playSound 'pi' blip is sfx_select, since playSFX has its own 'pi'.
+
+ASSETS_DIR = "assets"
+INDEX_FILE = "audio.json" # Rendered sounds and loop points, read by game.js
+AUDIO_CACHE_FILE = ".audio_cache.json"
+RENDER_VERSION = 1 # Bump when the synthesis changes to re-render everything
+SAMPLE_RATE = 44100
+BITRATE = 96 # kbps, mono
+PEAK = 0.95 # Louder mixes are scaled down to this instead of clipping
+
+def tone(wave, start, duration, freq, gain):
+    # One oscillator; freq/gain are numbers or AudioParam events
+    # [kind, time, value] with kind "set", "linear" or "exp" (times relative to start)
+    return {"wave": wave, "start": start, "stop": start + duration,
+            "freq": freq if isinstance(freq, list) else [["set", 0, freq]],
+            "gain": gain if isinstance(gain, list) else [["set", 0, gain]]}
+
+def play_tone(freq, start, duration, wave, vol):
+    # BGMController.playTone
+    return tone(wave, start, duration, freq, [["set", 0, vol], ["exp", duration, 0.001]])
+
+def sequence(notes, step, duration, wave, vol):
+    # A setInterval loop over notes (0 = rest), one period
+    return [play_tone(f, i * step, duration, wave, vol) for i, f in enumerate(notes) if f > 0]
+
+SOUNDS = {
+    # BGMController.playBattleTheme: bass every 200 ms, melody every 400 ms
+    "bgm_battle": {
+        "loop": 3.2,
+        "voices": sequence([110, 0, 110, 0, 130, 0, 98, 0] * 2, 0.2, 0.15, "triangle", 0.15)
+                  + sequence([440, 0, 440, 493, 440, 392, 349, 329], 0.4, 0.3, "square", 0.05),
+    },
+    # BGMController.playBossTheme
+    "bgm_boss": {
+        "loop": 0.96,
+        "voices": sequence([65, 73, 82, 87, 65, 87, 73, 65], 0.12, 0.1, "sawtooth", 0.15),
+    },
+    # GameController.playSound
+    "sfx_attack": {"voices": [tone("square", 0, 0.1, [["set", 0, 440], ["exp", 0.1, 880]],
+                                   [["set", 0, 0.1], ["exp", 0.1, 0.01]])]},
+    "sfx_miss": {"voices": [tone("sawtooth", 0, 0.3, [["set", 0, 150], ["linear", 0.3, 100]],
+                                 [["set", 0, 0.1], ["linear", 0.3, 0.01]])]},
+    "sfx_heal": {"voices": [tone("sine", 0, 0.2, [["set", 0, 440], ["linear", 0.2, 880]],
+                                 [["set", 0, 0.1], ["linear", 0.2, 0]])]},
+    "sfx_approaching": {"voices": [tone("triangle", 0, 0.15, [["set", 0, 100], ["exp", 0.1, 50]],
+                                        [["set", 0, 0.3], ["exp", 0.15, 0.01]])]},
+    "sfx_select": {"voices": [tone("square", 0, 0.1, 880, [["set", 0, 0.05], ["exp", 0.1, 0.001]])]},
+    "sfx_darkness": {"voices": [
+        tone("sawtooth", 0, 2.0, [["set", 0, 60], ["linear", 1.5, 80]], [["set", 0, 0.2], ["linear", 2.0, 0.01]]),
+        tone("sine", 0, 2.0, [["set", 0, 300], ["linear", 1.5, 290]], [["set", 0, 0.1], ["linear", 2.0, 0.01]]),
+    ]},
+    # BGMController.playSFX
+    "sfx_pi": {"voices": [tone("square", 0, 0.1, 880, [["set", 0, 0.1], ["exp", 0.1, 0.01]])]},
+    "sfx_decision": {"voices": [tone("square", 0, 0.15, [["set", 0, 1200], ["exp", 0.1, 1800]],
+                                     [["set", 0, 0.1], ["linear", 0.15, 0]])]},
+    "sfx_damage": {"voices": [tone("sawtooth", 0, 0.2, [["set", 0, 150], ["linear", 0.2, 100]],
+                                   [["set", 0, 0.3], ["linear", 0.2, 0]])]},
+}
+
+def render_params():
+    # Everything besides the definition that changes the output (part of the cache key)
+    return {"version": RENDER_VERSION, "sample_rate": SAMPLE_RATE, "bitrate": BITRATE, "peak": PEAK}
+
+def definition_hash(sound):
+    blob = json.dumps({"sound": sound, "params": render_params()}, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+def automation(events, t):
+    # AudioParam value at times t (seconds from the oscillator start), following
+    # WebAudio: a ramp runs from the previous event to its own time, and the
+    # last value holds afterwards
+    values = np.full(len(t), float(events[0][2]))
+    prev_time, prev_value = events[0][1], float(events[0][2])
+    for kind, time, value in events[1:]:
+        span = (t >= prev_time) & (t < time)
+        if kind == "linear" and time > prev_time:
+            values[span] = prev_value + (value - prev_value) * (t[span] - prev_time) / (time - prev_time)
+        elif kind == "exp" and time > prev_time and prev_value * value > 0:
+            values[span] = prev_value * (value / prev_value) ** ((t[span] - prev_time) / (time - prev_time))
+        else:
+            values[span] = prev_value
+        values[t >= time] = value
+        prev_time, prev_value = time, float(value)
+    return values
+
+def oscillator(wave, freq):
+    # Band-limited waveform for a per-sample frequency curve: the Fourier
+    # series of the shape, cut off below Nyquist like the browser's tables
+    phase = 2 * np.pi * np.cumsum(freq) / SAMPLE_RATE
+    if wave == "sine":
+        return np.sin(phase)
+    out = np.zeros(len(freq))
+    nyquist = SAMPLE_RATE / 2
+    for k in range(1, int(nyquist / max(freq.min(), 1)) + 1):
+        audible = k * freq < nyquist
+        if wave == "square" and k % 2:
+            out += audible * np.sin(k * phase) * (4 / np.pi / k)
+        elif wave == "sawtooth":
+            out += audible * np.sin(k * phase) * (2 / np.pi / k * (-1) ** (k + 1))
+        elif wave == "triangle" and k % 2:
+            out += audible * np.sin(k * phase) * (8 / np.pi ** 2 / k ** 2 * (-1) ** ((k - 1) // 2))
+    return out
+
+def render(sound):
+    # float64 mono samples; loops are two periods, each with the tails that
+    # ring past the period end wrapped back to its start
+    loop = sound.get("loop")
+    end = max(v["stop"] for v in sound["voices"])
+    length = int(round((loop or end) * SAMPLE_RATE))
+    mix = np.zeros(max(length, int(np.ceil(end * SAMPLE_RATE))))
+    for v in sound["voices"]:
+        first = int(round(v["start"] * SAMPLE_RATE))
+        t = np.arange(int(round((v["stop"] - v["start"]) * SAMPLE_RATE))) / SAMPLE_RATE
+        mix[first:first + len(t)] += oscillator(v["wave"], automation(v["freq"], t)) * automation(v["gain"], t)
+    if loop:
+        period = mix[:length].copy()
+        for offset in range(length, len(mix), length):
+            tail = mix[offset:offset + length]
+            period[:len(tail)] += tail
+        mix = np.tile(period, 2)
+    peak = np.abs(mix).max()
+    if peak > PEAK:
+        mix *= PEAK / peak
+    return mix
+
+def encode_mp3(samples, path):
+    pcm = (np.clip(samples, -1, 1) * 32767).astype("<i2").tobytes()
+    if lameenc is not None:
+        encoder = lameenc.Encoder()
+        encoder.set_bit_rate(BITRATE)
+        encoder.set_in_sample_rate(SAMPLE_RATE)
+        encoder.set_channels(1)
+        encoder.set_quality(2)
+        data = encoder.encode(pcm) + encoder.flush()
+    else:
+        result = subprocess.run(
+            ["ffmpeg", "-v", "error", "-f", "s16le", "-ar", str(SAMPLE_RATE), "-ac", "1", "-i", "-",
+             "-codec:a", "libmp3lame", "-b:a", f"{BITRATE}k", "-f", "mp3", "-"],
+            input=pcm, capture_output=True, check=True)
+        data = result.stdout
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+def load_cache(assets_dir):
+    try:
+        with open(os.path.join(assets_dir, AUDIO_CACHE_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_json(path, data):
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(path + ".tmp", path)
+
+def render_all(assets_dir=ASSETS_DIR, names=None, jobs=None, force=False):
+    # Renders and encodes the sounds whose definition changed; returns the names rendered
+    cache = {} if force else load_cache(assets_dir)
+    todo = []
+    for name in names or sorted(SOUNDS):
+        path = os.path.join(assets_dir, name + ".mp3")
+        if cache.get(name) == definition_hash(SOUNDS[name]) and os.path.exists(path):
+            continue
+        todo.append(name)
+
+    def job(name):
+        # NumPy and the encoder release the GIL for most of this
+        samples = render(SOUNDS[name])
+        size = encode_mp3(samples, os.path.join(assets_dir, name + ".mp3"))
+        print(f"  {name}.mp3: {len(samples) / SAMPLE_RATE:.2f}s, {size // 1024} KB")
+        return name
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs or os.cpu_count() or 1)) as pool:
+        for name in pool.map(job, todo):
+            cache[name] = definition_hash(SOUNDS[name])
+
+    index = {}
+    for name in sorted(SOUNDS):
+        if not os.path.exists(os.path.join(assets_dir, name + ".mp3")):
+            continue
+        entry = {"url": f"{ASSETS_DIR}/{name}.mp3"}
+        if SOUNDS[name].get("loop"):
+            entry["loopStart"] = SOUNDS[name]["loop"]
+            entry["loopEnd"] = SOUNDS[name]["loop"] * 2
+        index[name] = entry
+    write_json(os.path.join(assets_dir, INDEX_FILE), index)
+    write_json(os.path.join(assets_dir, AUDIO_CACHE_FILE), {k: v for k, v in cache.items() if k in SOUNDS})
+    return todo
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the game's synthesized music and effects to MP3")
+    parser.add_argument("names", nargs="*", help=f"sounds to render (default: all of {', '.join(sorted(SOUNDS))})")
+    parser.add_argument("--assets", default=ASSETS_DIR)
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="sounds rendered at once (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="ignore the cache and render everything")
+    args = parser.parse_args()
+
+    unknown = [n for n in args.names if n not in SOUNDS]
+    if unknown:
+        parser.error(f"unknown sound(s): {', '.join(unknown)}")
+    if lameenc is None and shutil.which("ffmpeg") is None:
+        print("No MP3 encoder: pip install lameenc, or put ffmpeg on PATH.")
+        sys.exit(1)
+    rendered = render_all(args.assets, args.names, jobs=args.jobs, force=args.force)
+    print(f"Rendered {len(rendered)} sound(s), {len(args.names or SOUNDS) - len(rendered)} up to date.")
@@ -0,0 +1,193 @@
+import os
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+
+# Kept outside the game directory so the static file handler never serves it
+SAVE_DB = os.path.join(os.path.expanduser("~"), ".math_quest", "saves.sqlite3")
+
+FLUSH_INTERVAL = 0.05 # Seconds the writer waits to gather more saves into one transaction
+MAX_PENDING = 10000 # Players with unwritten saves before put() waits for the writer
+CACHE_ENTRIES = 4096 # Saves kept in RAM for reads
+MAX_SAVE_BYTES = 64 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    player TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated REAL NOT NULL
+)
+"""
+
+class SaveStore:
+    # Player save blobs (JSON text) in SQLite, WAL mode.
+    # put() only touches memory: the save goes into an LRU read cache and a
+    # pending map keyed by player, so repeated saves from one device collapse
+    # into one row. A single writer thread commits everything pending in one
+    # transaction, so a classroom saving at once costs one fsync, not thirty.
+
+    def __init__(self, path=SAVE_DB, flush_interval=FLUSH_INTERVAL, cache_entries=CACHE_ENTRIES):
+        self.path = os.path.abspath(path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.flush_interval = flush_interval
+        self.cache_entries = cache_entries
+        self.cache = OrderedDict() # player -> record
+        self.pending = {} # player -> record not yet written
+        self.writing = {} # batch currently being committed (still readable)
+        self.saves = 0
+        self.rows_written = 0
+        self.transactions = 0
+        self.lock = threading.Lock()
+        self.wakeup = threading.Condition(self.lock)
+        self.drained = threading.Condition(self.lock)
+        self.closed = False
+        self.local = threading.local()
+
+        conn = self._connect()
+        conn.execute(SCHEMA)
+        conn.close()
+        self._writer = threading.Thread(target=self._write_loop, name="save-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        # Autocommit mode; the writer opens its own transactions
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # With WAL, NORMAL only fsyncs on checkpoints and survives app crashes
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self):
+        # One read connection per server thread; WAL readers don't block the writer
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = self.local.conn = self._connect()
+        return conn
+
+    def _remember(self, player, record):
+        self.cache[player] = record
+        self.cache.move_to_end(player)
+        while len(self.cache) > self.cache_entries:
+            self.cache.popitem(last=False)
+
+    def _latest(self, player):
+        # Newest record in memory, or None
+        return self.pending.get(player) or self.writing.get(player) or self.cache.get(player)
+
+    def get(self, player):
+        # {"player", "data", "updated"} or None if the player has no save
+        with self.lock:
+            record = self._latest(player)
+            if record is not None:
+                if player in self.cache:
+                    self.cache.move_to_end(player)
+                return record if record["data"] is not None else None
+
+        row = self._reader().execute("SELECT data, updated FROM saves WHERE player = ?", (player,)).fetchone()
+        if row is None:
+            return None
+        record = {"player": player, "data": row[0], "updated": row[1]}
+        with self.lock:
+            # A save may have arrived while we were reading
+            current = self._latest(player)
+            if current is not None and current["updated"] >= record["updated"]:
+                return current if current["data"] is not None else None
+            self._remember(player, record)
+        return record
+
+    def put(self, player, data):
+        # Stores the JSON text data for player (None deletes); returns the record
+        record = {"player": player, "data": data, "updated": time.time()}
+        with self.lock:
+            while len(self.pending) >= MAX_PENDING and player not in self.pending and not self.closed:
+                self.drained.wait()
+            if self.closed:
+                raise RuntimeError("save store is closed")
+            self.pending[player] = record
+            self._remember(player, record)
+            self.saves += 1
+            self.wakeup.notify()
+        return record
+
+    def delete(self, player):
+        return self.put(player, None)
+
+    def _write_batch(self, conn, batch):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("INSERT OR REPLACE INTO saves (player, data, updated) VALUES (?, ?, ?)",
+                             [(r["player"], r["data"], r["updated"]) for r in batch.values()
+                              if r["data"] is not None])
+            conn.executemany("DELETE FROM saves WHERE player = ?",
+                             [(r["player"],) for r in batch.values() if r["data"] is None])
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            with self.lock:
+                while not self.pending and not self.closed:
+                    self.wakeup.wait()
+                if not self.pending:
+                    break
+                closing = self.closed
+            if not closing:
+                # Let saves from other devices join this transaction
+                time.sleep(self.flush_interval)
+
+            with self.lock:
+                batch, self.pending = self.pending, {}
+                self.writing = batch
+            try:
+                self._write_batch(conn, batch)
+            except sqlite3.Error as e:
+                if closing:
+                    print(f"Save write failed, {len(batch)} saves lost: {e}")
+                    break
+                print(f"Save write failed ({len(batch)} players), retrying: {e}")
+                with self.lock:
+                    # Newer saves that arrived meanwhile win
+                    for player, record in batch.items():
+                        self.pending.setdefault(player, record)
+                    self.writing = {}
+                time.sleep(1)
+                continue
+
+            with self.lock:
+                self.writing = {}
+                self.rows_written += len(batch)
+                self.transactions += 1
+                self.drained.notify_all()
+        conn.close()
+
+    def flush(self):
+        # Blocks until every save made so far is committed
+        with self.lock:
+            self.wakeup.notify()
+            while self.pending or self.writing:
+                self.drained.wait()
+
+    def stats(self):
+        with self.lock:
+            return {
+                "saves": self.saves,
+                "rows_written": self.rows_written,
+                "transactions": self.transactions,
+                "pending": len(self.pending),
+                "cached": len(self.cache),
+            }
+
+    def close(self):
+        # Writes whatever is still pending, then stops the writer
+        with self.lock:
+            self.closed = True
+            self.wakeup.notify()
+            self.drained.notify_all()
+        self._writer.join()
+        stats = self.stats()
+        print(f"Saves: {stats['saves']} received, {stats['rows_written']} rows written "
+              f"in {stats['transactions']} transactions.")
@@ -0,0 +1,51 @@
+// Generated by build_manifest.py from asset-manifest.json; do not edit.
+const CACHE = 'math-quest-757eabeaf3ee';
+const PRECACHE = [
+    "./",
+    "index.html",
+    "assets/battle_bg.png",
+    "assets/hero.png",
+    "assets/title_bg.png",
+    "enemies/C.js?v=42900ddc",
+    "enemies/F.js?v=0960ff6f",
+    "enemies/G.js?v=e4a7efd9",
+    "enemies/L.js?v=aa5b2c66",
+    "enemies/M.js?v=982f83da",
+    "enemies/O.js?v=80811a58",
+    "enemies/R.js?v=85f4578b",
+    "enemies/S.js?v=050ad3d8",
+    "enemies/index.js?v=e4651eb6",
+    "game.js?v=3.110",
+    "problems/index.json",
+    "style.css?v=3.110"
+];
+
+self.addEventListener('install', (event) => {
+    event.waitUntil(caches.open(CACHE).then(cache => cache.addAll(PRECACHE)).then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil(caches.keys()
+        .then(keys => Promise.all(keys.filter(k => k.startsWith('math-quest-') && k !== CACHE).map(k => caches.delete(k))))
+        .then(() => self.clients.claim()));
+});
+
+self.addEventListener('fetch', (event) => {
+    const request = event.request;
+    const url = new URL(request.url);
+    // Leave the API, other origins and ranged audio requests to the network
+    if (request.method !== 'GET' || url.origin !== location.origin || url.pathname.startsWith('/api/')
+        || request.headers.has('range')) {
+        return;
+    }
+    event.respondWith(fetch(request)
+        .then(response => {
+            if (response.status === 200) {
+                const copy = response.clone();
+                caches.open(CACHE).then(cache => cache.put(request, copy));
+            }
+            return response;
+        })
+        .catch(() => caches.match(request, { ignoreSearch: true })
+            .then(cached => cached || Response.error())));
+});
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+import fix_backgrounds
+
+# The NumPy and tiled engines must wipe exactly the pixels the original
+# pure-Python engine does. Tiles are forced down to MIN_TILE so the fill has
+# to cross tile edges (the maze winds through every tile).
+
+def random_sprite(seed, width=200, height=150):
+    # Two-tone checkerboard with a noisy figure in the middle and some pixels
+    # that are already transparent
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[:height, :width]
+    arr = np.where(((x // 8 + y // 8) % 2 == 0)[..., None], [255, 255, 255, 255], [204, 204, 204, 255])
+    figure = ((x - width / 2) / (width / 3)) ** 2 + ((y - height / 2) / (height / 3)) ** 2 < 1
+    noise = rng.integers(0, 256, (height, width, 4))
+    noise[..., 3] = 255
+    keep = figure & (rng.random((height, width)) < 0.7)
+    arr[keep] = noise[keep]
+    arr[rng.random((height, width)) < 0.02, 3] = 0
+    return Image.fromarray(arr.astype(np.uint8), "RGBA")
+
+def maze(size=320, step=10):
+    # A walled box entered at one corner; inside, a serpentine corridor and a
+    # sealed pocket that must stay untouched
+    arr = np.full((size, size, 4), 255, np.uint8)
+    wall = (0, 0, 0, 255)
+    lo, hi = 10, size - 11
+    arr[lo:lo + 2, lo:hi + 1] = wall
+    arr[hi - 1:hi + 1, lo:hi + 1] = wall
+    arr[lo:hi + 1, lo:lo + 2] = wall
+    arr[lo:hi + 1, hi - 1:hi + 1] = wall
+    arr[lo:lo + 2, lo + 2:lo + 8] = 255 # Entrance
+    for i, y in enumerate(range(lo + step, hi - 1, step)):
+        arr[y:y + 2, lo:hi + 1] = wall
+        gap = slice(hi - 8, hi - 1) if i % 2 == 0 else slice(lo + 2, lo + 9)
+        arr[y:y + 2, gap] = 255
+    arr[153:159, 150:160] = wall # Inside one corridor, leaving a row free above and below
+    arr[155:157, 152:158] = 255
+    return Image.fromarray(arr, "RGBA")
+
+def run_engine(engine, img, tmp_path):
+    img = img.copy()
+    if engine == "tiled":
+        count = fix_backgrounds.remove_background_tiled(img, budget_mb=0.01, tile_dir=str(tmp_path))
+    else:
+        count = fix_backgrounds.ENGINES[engine](img)
+    return count, np.asarray(img)
+
+@pytest.mark.parametrize("make", [lambda: random_sprite(1), lambda: random_sprite(2), maze],
+                         ids=["random-1", "random-2", "maze"])
+def test_engines_match_python(make, tmp_path):
+    img = make()
+    expected_count, expected = run_engine("python", img, tmp_path)
+    assert expected_count
+    for engine in ("numpy", "tiled"):
+        count, result = run_engine(engine, img, tmp_path)
+        assert count == expected_count, engine
+        assert np.array_equal(result, expected), engine
+
+def test_maze_is_filled_through_the_entrance(tmp_path):
+    _, result = run_engine("tiled", maze(), tmp_path)
+    assert result[305, 150, 3] == 0 # Far end of the corridor
+    assert result[156, 155, 3] == 255 # Sealed pocket
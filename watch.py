@@ -0,0 +1,187 @@
+import os
+import sys
+import time
+import argparse
+import threading
+import urllib.request
+
+import pipeline_cache
+import optimize_sprites
+import enemy_compiler
+from fix_backgrounds import ASSETS_DIR, process_cached, update_manifest, pipeline_params
+from process_new_images import plan_jobs, process_job
+
+# Dev daemon: polls the sources and reruns only the stages a change affects.
+#  - new "<ID>_*.png" artwork in assets/ -> rename + background removal +
+#    variants for that target only (process_new_images.process_job)
+#  - an edited assets/uma_*.png -> background removal + variants for it
+#  - raw_enemies.txt / assets/atlas.json -> enemy compile (enemies.js + shards),
+#    also after the image stage since enemyData lists each sprite's variants
+#  - game.js, style.css, index.html, anything else in assets/ -> reload only
+# Files a stage writes or moves itself don't count as new changes.
+# After each rebuild, on_rebuild is called (host_quest.py --watch bumps the
+# live-reload version the browsers poll); standalone, --notify POSTs to a
+# server started with --live-reload.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+WATCH_FILES = ["raw_enemies.txt", "index.html", "game.js", "style.css"]
+WATCH_DIRS = [ASSETS_DIR]
+ENEMY_SOURCES = {"raw_enemies.txt", f"{ASSETS_DIR}/atlas.json"}
+IMAGE_EXTS = (".png", ".jpg", ".jpeg")
+
+POLL_INTERVAL = 0.1 # Seconds between scans
+DEBOUNCE = 0.15 # Wait this long without further changes before rebuilding (editors save in bursts)
+
+def snapshot(root=BASE_DIR):
+    # rel path -> (mtime_ns, size) of every watched file
+    files = {}
+    for name in WATCH_FILES:
+        try:
+            st = os.stat(os.path.join(root, name))
+        except OSError:
+            continue
+        files[name] = (st.st_mtime_ns, st.st_size)
+    for d in WATCH_DIRS:
+        try:
+            entries = list(os.scandir(os.path.join(root, d)))
+        except OSError:
+            continue
+        for entry in entries:
+            # Dotfiles are pipeline state, variants are pipeline output
+            if entry.name.startswith(".") or optimize_sprites.is_variant(entry.name) \
+                    or entry.name == optimize_sprites.REPORT_FILE or not entry.is_file():
+                continue
+            st = entry.stat()
+            files[f"{d}/{entry.name}"] = (st.st_mtime_ns, st.st_size)
+    return files
+
+def diff(before, after):
+    # Paths added, modified or removed between two snapshots
+    return {p for p in before.keys() | after.keys() if before.get(p) != after.get(p)}
+
+def plan_stages(changed, root=BASE_DIR):
+    # -> (asset file names to run through the image pipeline, recompile enemies?)
+    images = []
+    enemies = False
+    for path in sorted(changed):
+        if path in ENEMY_SOURCES:
+            enemies = True
+        elif path.startswith(ASSETS_DIR + "/") and path.lower().endswith(IMAGE_EXTS) \
+                and os.path.exists(os.path.join(root, path)):
+            images.append(path[len(ASSETS_DIR) + 1:])
+    return images, enemies
+
+def run_images(names):
+    # Background removal (+ rename for new artwork) for just these files in
+    # assets/ -> (number actually processed, asset paths the stage wrote or moved)
+    manifest = pipeline_cache.load_manifest(ASSETS_DIR, pipeline_params())
+    results = []
+    covered = set()
+    for target, sources in plan_jobs(names):
+        covered.add(target)
+        covered.update(filename for _, filename in sources)
+        results.append(process_job((target, sources, pipeline_cache.cached_output(manifest, target))))
+    for name in names:
+        if name not in covered and name.startswith("uma_") and name.endswith(".png"):
+            path = os.path.join(ASSETS_DIR, name)
+            covered.add(name)
+            results.append(process_cached((path, pipeline_cache.cached_output(manifest, name))))
+
+    processed = [info for removed, info in results if removed is not None and info is not None]
+    if processed:
+        update_manifest(manifest, processed)
+    return len(processed), {f"{ASSETS_DIR}/{name}" for name in covered}
+
+def run_enemies():
+    # Both layouts; each is skipped when its build stamp is current
+    enemy_compiler.compile_enemies()
+    enemy_compiler.compile_enemies(shard_dir=os.path.join(enemy_compiler.BASE_DIR, enemy_compiler.SHARD_DIR))
+
+def notify_url(url):
+    # on_rebuild callback that tells a host_quest.py --live-reload server
+    def notify():
+        try:
+            request = urllib.request.Request(url.rstrip("/") + "/api/reload", data=b"", method="POST")
+            urllib.request.urlopen(request, timeout=2).close()
+        except OSError as e:
+            print(f"Reload not sent ({e})")
+    return notify
+
+class Watcher:
+    def __init__(self, root=BASE_DIR, on_rebuild=None, dist=False, interval=POLL_INTERVAL, debounce=DEBOUNCE):
+        self.root = root
+        self.on_rebuild = on_rebuild
+        self.dist = dist
+        self.interval = interval
+        self.debounce = debounce
+        self.stop_event = threading.Event()
+        self.files = snapshot(root)
+
+    def rebuild(self, changed):
+        # Runs the affected stages; returns the watched paths they wrote
+        start = time.perf_counter()
+        images, enemies = plan_stages(changed, self.root)
+        processed, touched = run_images(images) if images else (0, set())
+        if enemies or processed:
+            run_enemies() # New sprite variants change the srcset in enemyData too
+        if self.dist:
+            import build_dist
+            build_dist.build_dist(self.root)
+        if self.on_rebuild is not None:
+            self.on_rebuild()
+        stages = (["images"] if processed else []) + (["enemies"] if enemies else []) + (["dist"] if self.dist else [])
+        print(f"Rebuilt ({', '.join(stages) or 'reload only'}) for {len(changed)} change(s) "
+              f"in {time.perf_counter() - start:.2f}s.")
+        return touched
+
+    def run(self):
+        # Poll until stop(); a burst of changes is collected until it has been
+        # quiet for `debounce` seconds, then rebuilt once
+        print(f"Watching {', '.join(WATCH_FILES + [d + '/' for d in WATCH_DIRS])} for changes...")
+        while not self.stop_event.wait(self.interval):
+            current = snapshot(self.root)
+            changed = diff(self.files, current)
+            if not changed:
+                continue
+            last_change = time.monotonic()
+            while time.monotonic() - last_change < self.debounce and not self.stop_event.is_set():
+                time.sleep(self.interval / 2)
+                latest = snapshot(self.root)
+                more = diff(current, latest)
+                if more:
+                    changed |= more
+                    current = latest
+                    last_change = time.monotonic()
+            self.files = current
+            try:
+                touched = self.rebuild(changed)
+            except Exception as e:
+                # Keep watching; the next save usually fixes it
+                print(f"Rebuild failed: {e}")
+                continue
+            # Our own writes (renamed artwork, processed sprites) are not new changes;
+            # anything else edited meanwhile is picked up by the next scan
+            after = snapshot(self.root)
+            for path in touched:
+                if path in after:
+                    self.files[path] = after[path]
+                else:
+                    self.files.pop(path, None)
+
+    def stop(self):
+        self.stop_event.set()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild only what changed while editing the game")
+    parser.add_argument("--notify", metavar="URL",
+                        help="host_quest.py --live-reload server to tell after each rebuild, e.g. http://127.0.0.1:8001")
+    parser.add_argument("--dist", action="store_true", help="also rebuild dist/ after each change")
+    args = parser.parse_args()
+
+    os.chdir(BASE_DIR) # The pipeline stages use paths relative to the game directory
+    watcher = Watcher(on_rebuild=notify_url(args.notify) if args.notify else None, dist=args.dist)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+        sys.exit(0)